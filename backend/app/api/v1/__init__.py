@@ -16,8 +16,13 @@ from app.api.v1.persona import router as persona_router
 from app.api.v1.phishing import router as phishing_router
 from app.api.v1.explanation import router as explanation_router
 from app.api.v1.simulation import router as simulation_router
+from app.api.v1.contributions import router as contributions_router
 from app.api.v1.heatmap import router as heatmap_router
 from app.api.v1.analyze import router as analyze_router
+from app.api.v1.jobs import router as jobs_router
+from app.api.v1.identity import router as identity_router
+from app.api.v1.analysis_store import router as analysis_store_router
+from app.api.v1.metrics import router as metrics_router
 
 router = APIRouter(prefix="/v1", tags=["v1"])
 
@@ -57,8 +62,23 @@ router.include_router(explanation_router)
 # Include hardening simulation endpoints
 router.include_router(simulation_router)
 
+# Include field contribution endpoints
+router.include_router(contributions_router)
+
 # Include heatmap visualization endpoints
 router.include_router(heatmap_router)
 
 # Include master analysis orchestrator endpoints
 router.include_router(analyze_router)
+
+# Include background job endpoints
+router.include_router(jobs_router)
+
+# Include cross-document identity index endpoints
+router.include_router(identity_router)
+
+# Include indexed analysis store endpoints
+router.include_router(analysis_store_router)
+
+# Include runtime metrics endpoints
+router.include_router(metrics_router)
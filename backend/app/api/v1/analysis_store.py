@@ -0,0 +1,157 @@
+"""
+Indexed analysis store API endpoints.
+Stores analysis results and answers exposure queries from indexes.
+"""
+
+from fastapi import APIRouter, HTTPException, Query, status
+from typing import List, Optional
+from app.schemas.analysis_store_schema import (
+    AnalysisQueryResponse,
+    StoreAnalysesRequest,
+    StoreAnalysesResponse
+)
+from app.services.analysis_store import QUERY_MAX_LIMIT, get_analysis_store, store_analysis_batch
+from app.core.responses import FastJSONResponse, model_response
+
+
+router = APIRouter(prefix="/analysis-store", tags=["Analysis Store"])
+
+
+@router.post(
+    "/analyses",
+    response_model=StoreAnalysesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Store Analysis Results",
+)
+def store_analyses(request: StoreAnalysesRequest) -> StoreAnalysesResponse:
+    """
+    Store and index analysis results (e.g. /analyze responses or bulk scan
+    output lines).
+    
+    Results of failed analyses (risk level "Unknown") are skipped.
+    Storing an `analysis_id` again replaces the earlier result. Analyses
+    can also be stored directly with `store: true` on the /analyze
+    endpoints.
+    
+    Returns 400, storing none of the results, if any result is malformed:
+    an `analysis_id` that is not a non-empty string, a `risk_score` that
+    is not a number, an entity field that is not a list, or a rule id,
+    attack vector category, risk level or timestamp that is not a string.
+    """
+    try:
+        stored = store_analysis_batch(request.analyses)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(StoreAnalysesResponse(stored=stored, skipped=len(request.analyses) - stored))
+
+
+@router.get(
+    "/query",
+    response_model=AnalysisQueryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Query Stored Analyses",
+)
+def query_analyses(
+    field: Optional[List[str]] = Query(None, description="Entity field that must be exposed (repeatable)"),
+    entity: Optional[List[str]] = Query(None, description="'field:value' entity that must be present (repeatable)"),
+    rule_id: Optional[List[str]] = Query(None, description="Correlation rule id that must have matched (repeatable)"),
+    category: Optional[List[str]] = Query(None, description="Attack vector category that must be present (repeatable)"),
+    risk_level: Optional[List[str]] = Query(None, description="Accepted risk level (repeatable, any of)"),
+    min_score: Optional[float] = Query(None, description="Minimum risk score"),
+    max_score: Optional[float] = Query(None, description="Maximum risk score"),
+    order: str = Query("desc", description="'desc' (highest score first) or 'asc'"),
+    limit: int = Query(20, ge=1, le=QUERY_MAX_LIMIT),
+    offset: int = Query(0, ge=0)
+) -> AnalysisQueryResponse:
+    """
+    Find stored analyses matching every filter, ordered by risk score.
+    
+    Answered from the store's inverted indexes (exposed fields, entity
+    value tokens, rule ids, attack vector categories, risk level) and its
+    sorted score index; stored results are never scanned. An entity
+    filter matches when one value of the field contains all of its words,
+    case-insensitively (phone numbers compare by digits), so
+    `company:acme corp` matches "Engineer at Acme Corp".
+    
+    **Examples:**
+    - Everyone exposing a phone number and a DOB:
+      `/api/v1/analysis-store/query?field=phones&field=dob`
+    - Who mentions a company with a High score:
+      `/api/v1/analysis-store/query?entity=company:Acme%20Corp&risk_level=High`
+    - Top 10 scores: `/api/v1/analysis-store/query?limit=10`
+    
+    **Returns:**
+    `total` matches and the `results` page selected by `offset` and
+    `limit`.
+    """
+    entities = []
+    for item in entity or []:
+        entity_field, separator, value = item.partition(":")
+        if not separator or not value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"entity must be 'field:value': {item}"
+            )
+        entities.append((entity_field.strip(), value))
+    
+    try:
+        result = get_analysis_store().query(
+            fields=field,
+            entities=entities,
+            rule_ids=rule_id,
+            categories=category,
+            risk_levels=risk_level,
+            min_score=min_score,
+            max_score=max_score,
+            order=order,
+            limit=limit,
+            offset=offset
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(AnalysisQueryResponse(**result))
+
+
+@router.get(
+    "/analyses/{analysis_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Get Stored Analysis",
+)
+def get_stored_analysis(analysis_id: str) -> dict:
+    """
+    Return a stored analysis result.
+    
+    Returns 404 if the analysis is not stored.
+    """
+    result = get_analysis_store().get(analysis_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analysis not stored: {analysis_id}"
+        )
+    return FastJSONResponse(result)
+
+
+@router.delete(
+    "/analyses/{analysis_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Remove Stored Analysis",
+)
+def remove_stored_analysis(analysis_id: str) -> dict:
+    """
+    Remove an analysis from the store and its indexes.
+    
+    Returns 404 if the analysis is not stored.
+    """
+    if not get_analysis_store().remove(analysis_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analysis not stored: {analysis_id}"
+        )
+    return {"analysis_id": analysis_id, "removed": True}
@@ -4,9 +4,13 @@ Two separate endpoints for text and PDF analysis.
 """
 
 from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
 from pydantic import BaseModel
-from app.services.analyze_service import run_comprehensive_analysis
+from app.core.responses import FastJSONResponse
+from app.services.analyze_service import run_comprehensive_analysis, resolve_analysis_stages
+from app.services.incremental_service import run_incremental_analysis
+from app.services.analysis_store import store_analysis
 
 
 router = APIRouter()
@@ -18,6 +22,15 @@ class TextAnalysisRequest(BaseModel):
     persona: Optional[str] = "professional_scammer"
     simulate_hardening: Optional[bool] = False
     fields_to_remove: Optional[List[str]] = None
+    profile: Optional[str] = None
+    stages: Optional[List[str]] = None
+    combined_llm: Optional[bool] = None
+    store: Optional[bool] = False
+
+
+class IncrementalAnalysisRequest(TextAnalysisRequest):
+    """Request schema for incremental re-analysis of an edited document."""
+    document_id: Optional[str] = None
 
 
 @router.post(
@@ -35,9 +48,16 @@ async def analyze_text(request: TextAnalysisRequest) -> dict:
     - `persona`: Optional persona type ('script_kiddie', 'professional_scammer', 'corporate_spy')
     - `simulate_hardening`: Whether to simulate hardening impact (default: false)
     - `fields_to_remove`: List of field names to remove during hardening simulation
+    - `profile`: Optional analysis profile ('full' or 'fast'; 'fast' skips all LLM and heatmap work)
+    - `stages`: Optional explicit stage list, overrides `profile`
+      ('score', 'vectors', 'persona', 'phishing', 'explanation', 'hardening', 'heatmap')
+    - `combined_llm`: Generate persona, phishing and explanation with one LLM call
+      (default: server `LLM_COMBINED_MODE` setting)
+    - `store`: Add the result to the indexed analysis store (default: false)
     
     **Returns:**
     Complete analysis with risk assessment, attack vectors, and visualizations.
+    The stages that ran are reported under `analysis_profile`.
     
     **Example curl:**
     ```bash
@@ -68,17 +88,119 @@ async def analyze_text(request: TextAnalysisRequest) -> dict:
                 detail="content is required and cannot be empty"
             )
         
-        # Run comprehensive analysis
-        result = run_comprehensive_analysis(
+        # Validate analysis profile / stages
+        try:
+            resolve_analysis_stages(request.profile, request.stages)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        # Run comprehensive analysis off the event loop so concurrent
+        # identical requests can be coalesced
+        result = await run_in_threadpool(
+            run_comprehensive_analysis,
             input_type="text",
             content=request.content,
             file_bytes=None,
             persona=request.persona,
             simulate_hardening=request.simulate_hardening,
-            fields_to_remove=request.fields_to_remove
+            fields_to_remove=request.fields_to_remove,
+            profile=request.profile,
+            stages=request.stages,
+            combined_llm=request.combined_llm
         )
+        if request.store:
+            store_analysis(result)
         
-        return result
+        # The result is plain JSON data; encode it directly without the
+        # jsonable_encoder pass
+        return FastJSONResponse(result)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error analyzing text: {str(e)}"
+        )
+
+
+@router.post(
+    "/analyze/text/incremental",
+    status_code=status.HTTP_200_OK,
+    summary="Re-analyze Edited Text",
+    tags=["Analysis"],
+)
+async def analyze_text_incremental(request: IncrementalAnalysisRequest) -> dict:
+    """
+    Analyze a new version of a text document, re-extracting only the
+    segments that changed since the previous version.
+    
+    **Request:**
+    Same fields as `/analyze/text`, plus:
+    - `document_id`: Id returned by a previous call for this document
+      (omit it for the first version)
+    
+    **Returns:**
+    The `/analyze/text` response plus `incremental`: the document id and
+    version number, how many segments were reused from cache, and the
+    entity and score diff against the previous version (`diff` is null for
+    the first version).
+    
+    **Example curl:**
+    ```bash
+    curl -X POST http://localhost:8000/api/v1/analyze/text/incremental \\
+      -H "Content-Type: application/json" \\
+      -d '{
+        "content": "Email: john@company.com, Phone: 555-1234, Lives in Austin",
+        "document_id": "4f1c2d6e-0b7a-4d43-9a55-2b1f0c8e7d10",
+        "profile": "fast"
+      }'
+    ```
+    """
+    
+    try:
+        # Validate persona
+        valid_personas = ["script_kiddie", "professional_scammer", "corporate_spy"]
+        if request.persona and request.persona not in valid_personas:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"persona must be one of: {', '.join(valid_personas)}"
+            )
+        
+        # Validate content
+        if not request.content or not request.content.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="content is required and cannot be empty"
+            )
+        
+        # Validate analysis profile / stages
+        try:
+            resolve_analysis_stages(request.profile, request.stages)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        result = await run_in_threadpool(
+            run_incremental_analysis,
+            content=request.content,
+            document_id=request.document_id,
+            persona=request.persona,
+            simulate_hardening=request.simulate_hardening,
+            fields_to_remove=request.fields_to_remove,
+            profile=request.profile,
+            stages=request.stages,
+            combined_llm=request.combined_llm
+        )
+        if request.store:
+            store_analysis(result)
+        
+        return FastJSONResponse(result)
     
     except HTTPException:
         raise
@@ -99,7 +221,11 @@ async def analyze_pdf(
     file: UploadFile = File(...),
     persona: Optional[str] = Form("professional_scammer"),
     simulate_hardening: Optional[bool] = Form(False),
-    fields_to_remove: Optional[str] = Form(None)
+    fields_to_remove: Optional[str] = Form(None),
+    profile: Optional[str] = Form(None),
+    stages: Optional[str] = Form(None),
+    combined_llm: Optional[bool] = Form(None),
+    store: Optional[bool] = Form(False)
 ) -> dict:
     """
     Analyze PDF file for privacy risks.
@@ -109,6 +235,10 @@ async def analyze_pdf(
     - `persona`: Optional persona type ('script_kiddie', 'professional_scammer', 'corporate_spy')
     - `simulate_hardening`: Whether to simulate hardening impact (default: false)
     - `fields_to_remove`: Comma-separated field names (e.g., 'phones,graduation_year')
+    - `profile`: Optional analysis profile ('full' or 'fast')
+    - `stages`: Optional comma-separated stage list (e.g., 'score,vectors'), overrides `profile`
+    - `combined_llm`: Generate persona, phishing and explanation with one LLM call
+    - `store`: Add the result to the indexed analysis store (default: false)
     
     **Returns:**
     Complete analysis with risk assessment, attack vectors, and visualizations.
@@ -151,20 +281,40 @@ async def analyze_pdf(
         if fields_to_remove:
             parsed_fields = [f.strip() for f in fields_to_remove.split(",") if f.strip()]
         
+        # Parse and validate analysis profile / stages
+        parsed_stages: Optional[List[str]] = None
+        if stages:
+            parsed_stages = [s.strip() for s in stages.split(",") if s.strip()]
+        try:
+            resolve_analysis_stages(profile, parsed_stages)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
         # Read PDF file
         file_bytes = await file.read()
         
-        # Run comprehensive analysis
-        result = run_comprehensive_analysis(
+        # Run comprehensive analysis off the event loop
+        result = await run_in_threadpool(
+            run_comprehensive_analysis,
             input_type="pdf",
             content=None,
             file_bytes=file_bytes,
             persona=persona,
             simulate_hardening=simulate_hardening,
-            fields_to_remove=parsed_fields
+            fields_to_remove=parsed_fields,
+            profile=profile,
+            stages=parsed_stages,
+            combined_llm=combined_llm
         )
+        if store:
+            store_analysis(result)
         
-        return result
+        # The result is plain JSON data; encode it directly without the
+        # jsonable_encoder pass
+        return FastJSONResponse(result)
     
     except HTTPException:
         raise
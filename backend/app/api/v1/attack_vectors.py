@@ -4,8 +4,17 @@ Maps extracted entities to real-world attack vectors.
 """
 
 from fastapi import APIRouter, HTTPException
-from app.schemas.attack_vector_schema import AttackVectorRequest, AttackVectorResponse
-from app.services.attack_vector_service import categorize_attack_vectors
+from app.schemas.attack_vector_schema import (
+    AttackVectorRequest,
+    AttackVectorResponse,
+    AttackVectorBatchRequest,
+    AttackVectorBatchResponse
+)
+from app.core.responses import model_response
+from app.services.attack_vector_service import (
+    categorize_attack_vectors,
+    categorize_attack_vectors_batch
+)
 
 router = APIRouter(prefix="/attack-vectors", tags=["attack-vectors"])
 
@@ -23,7 +32,8 @@ async def identify_attack_vectors(request: AttackVectorRequest):
         "inferred_risks": [...]  (optional)
     }
     
-    Attack Vector Categories:
+    Attack Vector Categories (defined in rules/attack_vector_rules.json,
+    reloaded automatically when the file changes):
     1. Spear Phishing Risk: company + job_title + email
     2. Identity Theft Risk: dob + email OR dob + phone
     3. Social Engineering Risk: family_mentions + location
@@ -51,7 +61,37 @@ async def identify_attack_vectors(request: AttackVectorRequest):
             entities=request.entities,
             inferred_risks=request.inferred_risks
         )
-        return AttackVectorResponse(**result)
+        return model_response(AttackVectorResponse(**result))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+
+
+@router.post("/batch", response_model=AttackVectorBatchResponse)
+async def identify_attack_vectors_batch(request: AttackVectorBatchRequest):
+    """
+    Categorize many entity sets in one request.
+
+    All entity sets are evaluated against the same rules snapshot.
+
+    Request body:
+    {
+        "entity_sets": [{...}, {...}]
+    }
+
+    Returns:
+    {
+        "results": [
+            {"attack_vectors": [...]},
+            ...
+        ]
+    }
+    """
+    try:
+        results = categorize_attack_vectors_batch(request.entity_sets)
+        return model_response(AttackVectorBatchResponse(results=results))
     except ValueError as e:
         raise HTTPException(
             status_code=400,
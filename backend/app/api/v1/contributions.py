@@ -0,0 +1,54 @@
+"""
+Field contribution API endpoint.
+Attributes the risk score to individual entity fields.
+"""
+
+from fastapi import APIRouter, HTTPException
+from app.schemas.contribution_schema import FieldContributionRequest, FieldContributionResponse
+from app.core.responses import model_response
+from app.services.contribution_service import calculate_field_contributions
+
+router = APIRouter(prefix="/field-contributions", tags=["field-contributions"])
+
+
+@router.post("", response_model=FieldContributionResponse)
+async def field_contributions(request: FieldContributionRequest):
+    """
+    Answer "which single piece of data hurts me most?".
+    
+    For every present entity field, returns:
+    - `shapley_value`: the field's exact Shapley value, i.e. its average
+      marginal effect on the risk score over every order in which the
+      fields could have been exposed. Values sum to
+      `risk_score - baseline_score`.
+    - `marginal_contribution`: the score drop from removing only that
+      field (what /simulate-hardening reports for that one field, without
+      running the pipeline or an LLM explanation).
+    
+    Request body:
+    {
+        "entities": {...}
+    }
+    
+    Returns:
+    {
+        "risk_score": 81.0,
+        "baseline_score": 0.0,
+        "contributions": [
+            {"field": "dob", "shapley_value": 16.67, "marginal_contribution": 34.0},
+            ...
+        ]
+    }
+    
+    Contributions are ordered by Shapley value, largest first. The same
+    list is included in every analysis under
+    `risk_assessment.field_contributions`.
+    """
+    try:
+        result = calculate_field_contributions(request.entities)
+        return model_response(FieldContributionResponse(**result))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
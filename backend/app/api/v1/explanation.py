@@ -4,8 +4,9 @@ Generates educational explanations of privacy risks for users.
 """
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from app.schemas.explanation_schema import ExplanationRequest, ExplanationResponse
-from app.services.explanation_service import generate_risk_explanation
+from app.services.explanation_service import generate_risk_explanation, stream_risk_explanation
 
 
 router = APIRouter()
@@ -72,23 +73,7 @@ def explain_risk(request: ExplanationRequest) -> ExplanationResponse:
     
     try:
         # Validate request data
-        if request.risk_score < 0 or request.risk_score > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="risk_score must be between 0 and 100"
-            )
-        
-        if not isinstance(request.score_breakdown, dict):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="score_breakdown must be a dictionary"
-            )
-        
-        if not isinstance(request.inferred_risks, list):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="inferred_risks must be a list"
-            )
+        _validate_explanation_request(request)
         
         # Generate explanation
         explanation = generate_risk_explanation(
@@ -106,3 +91,59 @@ def explain_risk(request: ExplanationRequest) -> ExplanationResponse:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error generating explanation: {str(e)}"
         )
+
+
+@router.post(
+    "/explain-risk/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream Privacy Risk Explanation",
+    tags=["Risk Explanation"],
+)
+def stream_explain_risk(request: ExplanationRequest) -> StreamingResponse:
+    """
+    Stream an educational explanation of privacy risks as it is generated.
+    
+    Same request body as POST /explain-risk. The explanation is sent as
+    plain text chunks so clients can render it token by token.
+    
+    **Fallback Behavior:**
+    If the LLM service is unavailable, streams the same safe generic
+    explanation as POST /explain-risk.
+    """
+    _validate_explanation_request(request)
+    
+    return StreamingResponse(
+        stream_risk_explanation(
+            risk_score=request.risk_score,
+            score_breakdown=request.score_breakdown,
+            inferred_risks=request.inferred_risks
+        ),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
+def _validate_explanation_request(request: ExplanationRequest) -> None:
+    """
+    Validate explanation request data.
+    
+    Raises:
+        HTTPException: 400 if any field is out of range or malformed
+    """
+    if request.risk_score < 0 or request.risk_score > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="risk_score must be between 0 and 100"
+        )
+    
+    if not isinstance(request.score_breakdown, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="score_breakdown must be a dictionary"
+        )
+    
+    if not isinstance(request.inferred_risks, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="inferred_risks must be a list"
+        )
@@ -4,8 +4,21 @@ Generates frontend-ready visualization data from risk scores.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from app.schemas.heatmap_schema import HeatmapRequest, HeatmapResponse
-from app.services.heatmap_service import generate_heatmap
+from typing import Any, Dict, Iterator, List
+from app.schemas.heatmap_schema import (
+    HeatmapRequest,
+    HeatmapResponse,
+    HeatmapAggregateRequest,
+    HeatmapAggregateResponse
+)
+from app.services.heatmap_service import (
+    generate_heatmap,
+    get_cached_heatmap,
+    aggregate_heatmaps,
+    breakdown_from_analysis
+)
+from app.services.job_queue import get_job_queue
+from app.core.responses import model_response
 
 
 router = APIRouter()
@@ -37,6 +50,9 @@ def risk_heatmap(request: HeatmapRequest) -> HeatmapResponse:
     - `risk_category_breakdown`: Detailed per-category risk scores
     - `heatmap`: Per-data-type severity mapping
     - `graph_data`: Ready-to-use bar, radar, and pie chart data
+    - `breakdown_hash`: Hash of the canonicalized breakdown. Identical
+      breakdowns are served from a memo cache and can be fetched again with
+      `GET /api/v1/risk-heatmap/{breakdown_hash}`.
     
     **Risk Levels:**
     - 0-30: Low
@@ -158,7 +174,7 @@ def risk_heatmap(request: HeatmapRequest) -> HeatmapResponse:
         # Generate heatmap visualization data
         heatmap_data = generate_heatmap(request.score_breakdown.dict())
         
-        return HeatmapResponse(**heatmap_data)
+        return model_response(HeatmapResponse(**heatmap_data))
     
     except HTTPException:
         raise
@@ -167,3 +183,115 @@ def risk_heatmap(request: HeatmapRequest) -> HeatmapResponse:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error generating heatmap: {str(e)}"
         )
+
+
+@router.post(
+    "/risk-heatmap/aggregate",
+    response_model=HeatmapAggregateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Aggregate Population Risk Heatmap",
+    tags=["Visualization"],
+)
+def aggregate_risk_heatmap(request: HeatmapAggregateRequest) -> HeatmapAggregateResponse:
+    """
+    Aggregate many analyses into an organization-level heatmap.
+    
+    Analyses are folded into running aggregates one at a time, so memory
+    use does not grow with the number of analyses.
+    
+    **Request Body:**
+    - `analysis_ids`: Analysis ids of completed background jobs
+      (see `/api/v1/jobs`). Unknown or unfinished ids are reported in
+      `missing_analysis_ids`.
+    - `results`: Stored analysis results (the `/api/v1/analyze/text`
+      response) or raw score breakdowns (the `score_breakdown` object of
+      `POST /api/v1/risk-heatmap`). Results without a risk assessment, or
+      from failed analyses (risk level Unknown), are skipped and their
+      positions reported in `skipped_result_indexes`.
+    - `top_n`: Number of data types to return (default 10)
+    
+    **Response:**
+    - `analysis_count`: Number of analyses aggregated
+    - `total_score`: Mean, min and max total risk score
+    - `risk_level_distribution`: Analyses per risk level
+    - `severity_distribution`: Percentage of High/Medium/Low items across
+      all components and data types (same thresholds as the single heatmap)
+    - `component_stats`: Per-component mean/min/max, severity counts and
+      histogram, sorted by mean descending
+    - `top_data_types`: Data types by total contribution
+    
+    - Returns 400 if no analyses could be aggregated
+    """
+    missing_analysis_ids: List[str] = []
+    skipped_result_indexes: List[int] = []
+    
+    def breakdowns() -> Iterator[Dict[str, Any]]:
+        for index, item in enumerate(request.results):
+            if "components" in item:
+                yield item
+                continue
+            breakdown = breakdown_from_analysis(item)
+            if breakdown is None:
+                skipped_result_indexes.append(index)
+                continue
+            yield breakdown
+        
+        if request.analysis_ids:
+            job_queue = get_job_queue()
+            for analysis_id in request.analysis_ids:
+                result = job_queue.get_analysis_result(analysis_id)
+                breakdown = breakdown_from_analysis(result) if result else None
+                if breakdown is None:
+                    missing_analysis_ids.append(analysis_id)
+                    continue
+                yield breakdown
+    
+    try:
+        aggregate = aggregate_heatmaps(breakdowns(), top_n=request.top_n)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error aggregating heatmaps: {str(e)}"
+        )
+    
+    if aggregate["analysis_count"] == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No analyses to aggregate"
+        )
+    
+    return model_response(
+        HeatmapAggregateResponse(
+            missing_analysis_ids=missing_analysis_ids,
+            skipped_result_indexes=skipped_result_indexes,
+            **aggregate
+        )
+    )
+
+
+@router.get(
+    "/risk-heatmap/{breakdown_hash}",
+    response_model=HeatmapResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Precomputed Risk Heatmap",
+    tags=["Visualization"],
+)
+def get_risk_heatmap(breakdown_hash: str) -> HeatmapResponse:
+    """
+    Return a precomputed heatmap by breakdown hash.
+    
+    The hash is returned as `breakdown_hash` by `POST /api/v1/risk-heatmap`.
+    Payloads
+    live in a bounded in-memory cache (HEATMAP_CACHE_SIZE entries), so old
+    hashes may have been evicted.
+    
+    - Returns 404 if the hash is unknown or was evicted
+    """
+    heatmap_data = get_cached_heatmap(breakdown_hash)
+    if heatmap_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No cached heatmap for breakdown hash: {breakdown_hash}"
+        )
+    
+    return model_response(HeatmapResponse(**heatmap_data))
@@ -0,0 +1,112 @@
+"""
+Cross-document identity index API endpoints.
+Links documents that belong to the same person and scores their combined
+exposure.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from app.schemas.identity_schema import IdentityDocumentRequest, IdentityResponse
+from app.services.identity_service import get_identity_index
+from app.core.responses import model_response
+
+
+router = APIRouter(prefix="/identity-index", tags=["Identity Index"])
+
+
+@router.post(
+    "/documents",
+    response_model=IdentityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Index Document Entities",
+)
+def index_document(request: IdentityDocumentRequest) -> IdentityResponse:
+    """
+    Add one document's entities to the identity index.
+    
+    The document is linked to every indexed document sharing a normalized
+    email or phone number with it, or two of its dates of birth and
+    (company, job title) pairs, directly or through other documents. Re-posting a `document_id`
+    replaces that document's entities.
+    
+    **Request:**
+    - `entities` (required): Entities extracted from the document (e.g.
+      `entities` of an analysis)
+    - `document_id`: Id to index the document under (e.g. the analysis id;
+      generated if omitted)
+    - `include_exposure`: Also score the linked identity (default: true)
+    
+    Entity fields of the wrong type (a list field that is not a list of
+    strings or numbers, a `years_of_experience` that is not a
+    non-negative integer) return 400 and nothing is indexed.
+    
+    **Returns:**
+    - `documents`: Linked document ids, in indexing order
+    - `shared_keys`: Identity keys held by more than one linked document
+    - `exposure`: Risk assessment of the union of the linked documents'
+      entities (correlation and scoring re-run on the merged set)
+    """
+    index = get_identity_index()
+    try:
+        document_id = index.add(request.entities, document_id=request.document_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    identity = index.identity(document_id, include_exposure=request.include_exposure)
+    if identity is None:
+        # Evicted by concurrent additions to a full index
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document not indexed: {document_id}"
+        )
+    return model_response(IdentityResponse(**identity))
+
+
+@router.get(
+    "/documents/{document_id}",
+    response_model=IdentityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Linked Identity",
+)
+def get_identity(document_id: str) -> IdentityResponse:
+    """
+    Return the identity containing an indexed document, with the combined
+    exposure score of all linked documents.
+    
+    The exposure is computed from the stored entities (no document is
+    rescanned) and cached until a document joins or leaves the identity.
+    
+    Returns 404 if the document is not indexed.
+    """
+    identity = get_identity_index().identity(document_id)
+    if identity is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document not indexed: {document_id}"
+        )
+    return model_response(IdentityResponse(**identity))
+
+
+@router.delete(
+    "/documents/{document_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Remove Indexed Document",
+)
+def remove_document(document_id: str) -> dict:
+    """
+    Remove a document from the identity index.
+    
+    The remaining documents of its identity are re-linked (when the
+    identity is next requested), so documents that were only connected
+    through it become separate identities.
+    
+    Returns 404 if the document is not indexed.
+    """
+    if not get_identity_index().remove(document_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document not indexed: {document_id}"
+        )
+    return {"document_id": document_id, "removed": True}
@@ -0,0 +1,177 @@
+"""
+Background job API endpoints.
+Submit long-running analyses and poll for results.
+"""
+
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
+from typing import List, Optional
+from app.schemas.job_schema import TextAnalysisJobRequest, JobStatusResponse
+from app.services.analyze_service import resolve_analysis_stages
+from app.services.job_queue import get_job_queue
+from app.core.responses import model_response
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+VALID_PERSONAS = ["script_kiddie", "professional_scammer", "corporate_spy"]
+
+
+@router.post(
+    "/analyze/text",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit Text Analysis Job",
+)
+def submit_text_analysis(request: TextAnalysisJobRequest) -> JobStatusResponse:
+    """
+    Queue a text analysis and return immediately with a job id.
+
+    Accepts the same options as `/api/v1/analyze/text`, plus:
+    - `lane`: 'interactive' (default) or 'bulk'. Interactive jobs are always
+      served first and have reserved workers.
+    - `callback_url`: Optional local webhook that receives the finished job.
+
+    Poll `GET /api/v1/jobs/{job_id}` for status and result.
+    """
+    try:
+        if request.persona and request.persona not in VALID_PERSONAS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"persona must be one of: {', '.join(VALID_PERSONAS)}"
+            )
+
+        if not request.content or not request.content.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="content is required and cannot be empty"
+            )
+
+        resolve_analysis_stages(request.profile, request.stages)
+
+        job = get_job_queue().submit(
+            kind="analyze_text",
+            payload={
+                "content": request.content,
+                "persona": request.persona,
+                "simulate_hardening": request.simulate_hardening,
+                "fields_to_remove": request.fields_to_remove,
+                "profile": request.profile,
+                "stages": request.stages
+            },
+            lane=request.lane,
+            callback_url=request.callback_url
+        )
+
+        return model_response(JobStatusResponse(**job), status_code=status.HTTP_202_ACCEPTED)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/analyze/upload-pdf",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit PDF Analysis Job",
+)
+async def submit_pdf_analysis(
+    file: UploadFile = File(...),
+    persona: Optional[str] = Form("professional_scammer"),
+    simulate_hardening: Optional[bool] = Form(False),
+    fields_to_remove: Optional[str] = Form(None),
+    profile: Optional[str] = Form(None),
+    stages: Optional[str] = Form(None),
+    lane: str = Form("interactive"),
+    callback_url: Optional[str] = Form(None)
+) -> JobStatusResponse:
+    """
+    Queue a PDF analysis and return immediately with a job id.
+
+    Accepts the same form fields as `/api/v1/analyze/upload-pdf`, plus
+    `lane` and `callback_url` (see the text job endpoint).
+
+    **Example curl:**
+    ```bash
+    curl -X POST http://localhost:8000/api/v1/jobs/analyze/upload-pdf \\
+      -F "file=@resume.pdf" \\
+      -F "simulate_hardening=true" \\
+      -F "lane=bulk"
+    ```
+    """
+    try:
+        if not file.filename or not file.filename.endswith(".pdf"):
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Only PDF files are supported"
+            )
+
+        if persona and persona not in VALID_PERSONAS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"persona must be one of: {', '.join(VALID_PERSONAS)}"
+            )
+
+        parsed_fields: Optional[List[str]] = None
+        if fields_to_remove:
+            parsed_fields = [f.strip() for f in fields_to_remove.split(",") if f.strip()]
+
+        parsed_stages: Optional[List[str]] = None
+        if stages:
+            parsed_stages = [s.strip() for s in stages.split(",") if s.strip()]
+        resolve_analysis_stages(profile, parsed_stages)
+
+        file_bytes = await file.read()
+        if not file_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is empty"
+            )
+
+        job = get_job_queue().submit(
+            kind="analyze_pdf",
+            payload={
+                "persona": persona,
+                "simulate_hardening": simulate_hardening,
+                "fields_to_remove": parsed_fields,
+                "profile": profile,
+                "stages": parsed_stages
+            },
+            file_bytes=file_bytes,
+            lane=lane,
+            callback_url=callback_url
+        )
+
+        return model_response(JobStatusResponse(**job), status_code=status.HTTP_202_ACCEPTED)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Job Status",
+)
+def get_job(job_id: str) -> JobStatusResponse:
+    """
+    Get the status of a job. Once `status` is 'completed', `result` holds
+    the full analysis in the same shape as `/api/v1/analyze/text`.
+    """
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    return model_response(JobStatusResponse(**job))
@@ -0,0 +1,57 @@
+"""
+Runtime metrics API endpoint.
+Exposes in-process counters for monitoring.
+"""
+
+from fastapi import APIRouter, status
+from app.core.single_flight import get_coalescing_stats
+from app.core.compression import get_compression_stats
+from app.llm.prompt_template import get_prompt_stats
+from app.services.heatmap_service import get_heatmap_cache_stats
+from app.services.simulation_service import get_simulation_cache_stats
+from app.services.identity_service import get_identity_index_stats
+from app.services.analysis_store import get_analysis_store_stats
+
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Get Runtime Metrics",
+)
+def get_metrics() -> dict:
+    """
+    Return in-process runtime counters.
+    
+    **Response:**
+    - `coalescing`: Per-group single-flight counters
+      (`analysis`, `generate_text`): `calls`, `executions`, `coalesced`,
+      `errors` and `in_flight`. `coalesced` counts callers that shared
+      another caller's in-flight computation.
+    - `heatmap_cache`: Heatmap memo cache `hits`, `misses`, `evictions`,
+      `size` and `max_size`.
+    - `compression`: Compressed response count, `uncompressed_bytes` and
+      `compressed_bytes` (overall and per encoding), responses skipped
+      (small, streamed or not compressible) and how many were compressed
+      off the event loop.
+    - `prompts`: Per-template `renders`, `trimmed` (renders that dropped
+      section lines to fit the token budget) and `estimated_tokens`.
+    - `hardening_simulations`: Registry of simulations whose LLM
+      explanation can be fetched by id (same counters as `heatmap_cache`).
+    - `identity_index`: Cross-document identity index `documents`, `keys`,
+      `identities`, `links` made, identity `rebuilds` after removals, and
+      exposure cache `exposure_hits` / `exposure_misses`.
+    - `analysis_store`: Stored `analyses`, `index_keys`, and `stored`,
+      `evicted`, `queries` and `indexed_queries` counters.
+    """
+    return {
+        "coalescing": get_coalescing_stats(),
+        "heatmap_cache": get_heatmap_cache_stats(),
+        "compression": get_compression_stats(),
+        "prompts": get_prompt_stats(),
+        "hardening_simulations": get_simulation_cache_stats(),
+        "identity_index": get_identity_index_stats(),
+        "analysis_store": get_analysis_store_stats()
+    }
@@ -4,8 +4,9 @@ Generates educational attack narratives from attacker perspectives.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.schemas.persona_schema import PersonaSimulationRequest, PersonaSimulationResponse
-from app.services.persona_service import generate_persona_narrative
+from app.services.persona_service import generate_persona_narrative, stream_persona_narrative
 
 router = APIRouter(prefix="/persona-simulation", tags=["persona"])
 
@@ -51,3 +52,28 @@ async def simulate_persona(request: PersonaSimulationRequest):
             status_code=400,
             detail=str(e)
         )
+
+
+@router.post("/stream", response_class=StreamingResponse)
+async def stream_persona(request: PersonaSimulationRequest):
+    """
+    Stream an educational attack narrative as the LLM generates it.
+    
+    Same request body as POST /persona-simulation. The narrative is sent
+    as plain text chunks so clients can render it token by token.
+    
+    Note:
+    - Invalid persona returns 400 before streaming starts
+    - If LLM is unavailable, the stream is empty (API still succeeds)
+    """
+    try:
+        chunks = stream_persona_narrative(
+            persona=request.persona,
+            analysis_summary=request.analysis_summary.dict()
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
@@ -4,8 +4,9 @@ Generates educational phishing emails for security awareness training.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.schemas.phishing_schema import PhishingSimulationRequest, PhishingSimulationResponse
-from app.services.phishing_service import generate_phishing_email
+from app.services.phishing_service import generate_phishing_email, stream_phishing_email
 
 router = APIRouter(prefix="/generate-phishing", tags=["phishing"])
 
@@ -51,3 +52,22 @@ async def generate_phishing(request: PhishingSimulationRequest):
             status_code=400,
             detail=f"Error generating phishing simulation: {str(e)}"
         )
+
+
+@router.post("/stream", response_class=StreamingResponse)
+async def stream_phishing(request: PhishingSimulationRequest):
+    """
+    Stream an educational phishing email simulation as the LLM generates it.
+    
+    Same request body as POST /generate-phishing. The email is sent as
+    plain text ("Email Subject: ...", "Email Body: ...") followed by the
+    educational disclaimer.
+    
+    Note:
+    - If LLM is unavailable, streams the safe default example
+    - Always ends with the educational disclaimer
+    """
+    return StreamingResponse(
+        stream_phishing_email(request.entities),
+        media_type="text/plain; charset=utf-8"
+    )
@@ -4,8 +4,20 @@ Simulates risk score before and after removing sensitive fields.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from app.schemas.simulation_schema import HardeningSimulationRequest, HardeningSimulationResponse
-from app.services.simulation_service import run_hardening_simulation
+from fastapi.responses import StreamingResponse
+from app.schemas.simulation_schema import (
+    HardeningExplanationResponse,
+    HardeningSimulationRequest,
+    HardeningSimulationResponse
+)
+from app.services.simulation_service import (
+    get_simulation_explanation,
+    run_hardening_scenarios,
+    run_hardening_simulation,
+    stream_simulation_explanation
+)
+from app.core.config import settings
+from app.core.responses import model_response
 
 
 router = APIRouter()
@@ -37,14 +49,27 @@ def simulate_hardening(request: HardeningSimulationRequest) -> HardeningSimulati
     - `original_entities`: Dictionary of extracted entities
     - `remove_fields`: List of field names to remove for simulation
       (invalid field names are ignored)
+    - `scenarios`: Optional list of alternative `remove_fields` lists to
+      compare in one request. The original score is computed once and
+      only the best scenario is explained.
+    - `explain`: Set to true to wait for the LLM explanation. By default
+      the response returns immediately with a templated explanation, and
+      the LLM one is fetched later via `simulation_id`.
     
     **Response:**
     - `original_score`: Risk score before changes (0-100)
     - `hardened_score`: Risk score after removing selected fields (0-100)
+      (best scenario when comparing scenarios)
     - `difference`: Risk reduction achieved (original - hardened)
+    - `explanation` / `explanation_source`: Templated or LLM explanation
+    - `simulation_id`: Id for GET /simulate-hardening/{simulation_id}/explanation
+      (and `/explanation/stream`)
+    - `best_scenario` / `scenarios`: Best scenario index and per-scenario
+      scores (scenario requests only)
     
     **Validation:**
     - Returns 400 if original_entities is empty or null
+    - Returns 400 if scenarios is empty or exceeds HARDENING_MAX_SCENARIOS
     
     **Example Request:**
     ```json
@@ -81,13 +106,27 @@ def simulate_hardening(request: HardeningSimulationRequest) -> HardeningSimulati
                 detail="original_entities cannot be empty"
             )
         
+        if request.scenarios is not None:
+            if len(request.scenarios) > settings.HARDENING_MAX_SCENARIOS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"At most {settings.HARDENING_MAX_SCENARIOS} scenarios can be compared per request"
+                )
+            result = run_hardening_scenarios(
+                original_entities=request.original_entities,
+                scenarios=request.scenarios,
+                explain=request.explain
+            )
+            return model_response(HardeningSimulationResponse(**result))
+        
         # Run the simulation (invalid field names are simply ignored)
         result = run_hardening_simulation(
             original_entities=request.original_entities,
-            remove_fields=request.remove_fields
+            remove_fields=request.remove_fields,
+            explain=request.explain
         )
         
-        return HardeningSimulationResponse(**result)
+        return model_response(HardeningSimulationResponse(**result))
     
     except HTTPException:
         raise
@@ -96,3 +135,57 @@ def simulate_hardening(request: HardeningSimulationRequest) -> HardeningSimulati
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Error running hardening simulation: {str(e)}"
         )
+
+
+@router.get(
+    "/simulate-hardening/{simulation_id}/explanation",
+    response_model=HardeningExplanationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Hardening Explanation",
+    tags=["Risk Simulation"],
+)
+def get_hardening_explanation(simulation_id: str) -> HardeningExplanationResponse:
+    """
+    Return the LLM explanation of a previous hardening simulation.
+    
+    The explanation is generated on the first request and reused after
+    that. Simulations are kept in a bounded registry
+    (HARDENING_SIMULATION_CACHE_SIZE); rerun the simulation if the id has
+    expired.
+    
+    **Validation:**
+    - Returns 404 if the simulation id is unknown or expired
+    """
+    result = get_simulation_explanation(simulation_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulation {simulation_id} not found"
+        )
+    return model_response(HardeningExplanationResponse(simulation_id=simulation_id, **result))
+
+
+@router.get(
+    "/simulate-hardening/{simulation_id}/explanation/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream Hardening Explanation",
+    tags=["Risk Simulation"],
+)
+def stream_hardening_explanation(simulation_id: str) -> StreamingResponse:
+    """
+    Stream the LLM explanation of a previous hardening simulation.
+    
+    Sent as plain text chunks. An explanation generated earlier is sent
+    at once; if the LLM is unavailable the generic fallback is streamed.
+    
+    **Validation:**
+    - Returns 404 if the simulation id is unknown or expired
+    """
+    chunks = stream_simulation_explanation(simulation_id)
+    if chunks is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulation {simulation_id} not found"
+        )
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
@@ -0,0 +1,64 @@
+"""
+Bounded in-process memo cache.
+Thread-safe LRU cache with hit/miss counters.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import threading
+
+
+class BoundedCache:
+    """
+    Least-recently-used cache holding at most `max_size` entries.
+
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, name: str, max_size: int = 1024):
+        self.name = name
+        self.max_size = max(0, max_size)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it recently used), or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return self._entries[key]
+            self._counters["misses"] += 1
+            return None
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value without touching counters or recency."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus current size and capacity."""
+        with self._lock:
+            return {**self._counters, "size": len(self._entries), "max_size": self.max_size}
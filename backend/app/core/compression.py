@@ -0,0 +1,231 @@
+"""
+Response compression middleware.
+Negotiates zstd, brotli or gzip from Accept-Encoding and compresses
+buffered responses above a size threshold.
+
+zstd and brotli are used only when the `zstandard` / `brotli` packages are
+installed; gzip is always available. Large bodies are compressed in a
+worker thread so the event loop is not blocked.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import gzip
+import threading
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+# Content types worth compressing
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/html", "text/csv", "application/x-ndjson")
+
+
+def _compress_gzip(body: bytes, level: int) -> bytes:
+    return gzip.compress(body, compresslevel=level)
+
+
+def _compress_brotli(body: bytes, level: int) -> bytes:
+    return brotli.compress(body, quality=level)
+
+
+def _compress_zstd(body: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+def available_encodings() -> List[str]:
+    """Encodings supported in this environment, in server preference order."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """
+    Pick a content encoding from an Accept-Encoding header.
+
+    The highest client q-value wins; ties go to server preference order
+    (the order of `supported`). `*` matches any supported encoding and
+    q=0 excludes an encoding.
+
+    Returns:
+        Encoding name, or None if nothing acceptable is supported
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionStats:
+    """Thread-safe byte counters for compressed responses."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            "responses_compressed": 0,
+            "responses_skipped": 0,
+            "uncompressed_bytes": 0,
+            "compressed_bytes": 0,
+            "offloaded": 0
+        }
+        self._by_encoding: Dict[str, Dict[str, int]] = {}
+
+    def record(self, encoding: str, uncompressed: int, compressed: int, offloaded: bool) -> None:
+        with self._lock:
+            self._counters["responses_compressed"] += 1
+            self._counters["uncompressed_bytes"] += uncompressed
+            self._counters["compressed_bytes"] += compressed
+            if offloaded:
+                self._counters["offloaded"] += 1
+            per_encoding = self._by_encoding.setdefault(
+                encoding, {"responses": 0, "uncompressed_bytes": 0, "compressed_bytes": 0}
+            )
+            per_encoding["responses"] += 1
+            per_encoding["uncompressed_bytes"] += uncompressed
+            per_encoding["compressed_bytes"] += compressed
+
+    def record_skipped(self) -> None:
+        with self._lock:
+            self._counters["responses_skipped"] += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            uncompressed = self._counters["uncompressed_bytes"]
+            return {
+                **self._counters,
+                "ratio": round(self._counters["compressed_bytes"] / uncompressed, 3) if uncompressed else None,
+                "by_encoding": {name: dict(counts) for name, counts in self._by_encoding.items()},
+                "available_encodings": available_encodings()
+            }
+
+
+compression_stats = CompressionStats()
+
+
+def get_compression_stats() -> Dict:
+    """Return compression byte counters."""
+    return compression_stats.snapshot()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing buffered HTTP responses.
+
+    Responses are left untouched when they are streamed (sent in several
+    body chunks), already encoded, not a compressible content type, or
+    smaller than `minimum_size`. Bodies of at least `offload_size` bytes
+    are compressed in a worker thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        offload_size: int = 65536,
+        levels: Optional[Dict[str, int]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        self.compressors = {
+            "gzip": _compress_gzip,
+            "br": _compress_brotli,
+            "zstd": _compress_zstd
+        }
+        self.supported = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.supported)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the headers until we know the body size
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            if message.get("more_body", False) or not self._should_compress(headers, body):
+                # Streamed or not worth compressing: forward as-is
+                passthrough = True
+                compression_stats.record_skipped()
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed, offloaded = await self._compress(encoding, body)
+            compression_stats.record(encoding, len(body), len(compressed), offloaded)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers["X-Uncompressed-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, headers: MutableHeaders, body: bytes) -> bool:
+        """Check size, content type and existing encoding."""
+        if len(body) < self.minimum_size or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in COMPRESSIBLE_TYPES
+
+    async def _compress(self, encoding: str, body: bytes) -> Tuple[bytes, bool]:
+        """Compress inline, or in a worker thread for large bodies."""
+        compressor = self.compressors[encoding]
+        level = self.levels[encoding]
+        if len(body) >= self.offload_size:
+            return await run_in_threadpool(compressor, body, level), True
+        return compressor(body, level), False
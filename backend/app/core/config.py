@@ -15,6 +15,48 @@ class Settings:
     
     CHATGROQ_API_KEY: str = os.getenv("CHATGROQ_API_KEY", "")
     
+    # Analysis pipeline
+    PIPELINE_MAX_WORKERS: int = int(os.getenv("PIPELINE_MAX_WORKERS", "4"))
+    LLM_STAGE_TIMEOUT: float = float(os.getenv("LLM_STAGE_TIMEOUT", "30"))
+    LLM_COMBINED_MODE: bool = os.getenv("LLM_COMBINED_MODE", "false").lower() == "true"
+    LLM_COMBINED_MAX_TOKENS: int = int(os.getenv("LLM_COMBINED_MAX_TOKENS", "1200"))
+    HARDENING_MAX_SCENARIOS: int = int(os.getenv("HARDENING_MAX_SCENARIOS", "64"))
+    
+    # Background job queue
+    JOB_DB_PATH: str = os.getenv("JOB_DB_PATH", "personashield_jobs.db")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_INTERACTIVE_RESERVED: int = int(os.getenv("JOB_INTERACTIVE_RESERVED", "1"))
+    JOB_POLL_INTERVAL: float = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+    WEBHOOK_ALLOWED_HOSTS: list = [
+        host.strip()
+        for host in os.getenv("WEBHOOK_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+        if host.strip()
+    ]
+    WEBHOOK_TIMEOUT: float = float(os.getenv("WEBHOOK_TIMEOUT", "5"))
+    
+    # Response compression
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_OFFLOAD_SIZE: int = int(os.getenv("COMPRESSION_OFFLOAD_SIZE", "65536"))
+    
+    # Prompt token budgets
+    PROMPT_TOKEN_BUDGET: int = int(os.getenv("PROMPT_TOKEN_BUDGET", "1024"))
+    PROMPT_CHARS_PER_TOKEN: int = int(os.getenv("PROMPT_CHARS_PER_TOKEN", "4"))
+    PROMPT_MAX_FIELD_CHARS: int = int(os.getenv("PROMPT_MAX_FIELD_CHARS", "300"))
+    
+    # Memo caches
+    HEATMAP_CACHE_SIZE: int = int(os.getenv("HEATMAP_CACHE_SIZE", "1024"))
+    CONTRIBUTION_CACHE_SIZE: int = int(os.getenv("CONTRIBUTION_CACHE_SIZE", "4096"))
+    HARDENING_SIMULATION_CACHE_SIZE: int = int(os.getenv("HARDENING_SIMULATION_CACHE_SIZE", "1024"))
+    SEGMENT_CACHE_SIZE: int = int(os.getenv("SEGMENT_CACHE_SIZE", "16384"))
+    DOCUMENT_VERSION_CACHE_SIZE: int = int(os.getenv("DOCUMENT_VERSION_CACHE_SIZE", "1024"))
+    
+    # Cross-document identity index
+    IDENTITY_INDEX_MAX_DOCUMENTS: int = int(os.getenv("IDENTITY_INDEX_MAX_DOCUMENTS", "100000"))
+    
+    # Indexed analysis store
+    ANALYSIS_STORE_MAX_ANALYSES: int = int(os.getenv("ANALYSIS_STORE_MAX_ANALYSES", "100000"))
+    
     def __init__(self):
         """Initialize settings from environment variables."""
         pass
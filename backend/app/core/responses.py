@@ -0,0 +1,66 @@
+"""
+Fast JSON response classes.
+
+FastJSONResponse encodes with orjson when it is installed and falls back
+to the standard library otherwise. model_response() sends an already
+validated pydantic model as JSON directly, skipping FastAPI's second
+response_model validation and jsonable_encoder pass.
+"""
+
+from typing import Any, Optional
+import json
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (stdlib json fallback)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    Send a validated pydantic model as JSON.
+
+    The model was validated when it was constructed; pydantic-core
+    serializes it straight to bytes. Returning a Response from an endpoint
+    makes FastAPI skip response_model processing, so keep response_model
+    on the route for the OpenAPI schema only, and pass the route's status
+    code explicitly.
+
+    Args:
+        model: Response model instance
+        status_code: HTTP status code
+        headers: Optional extra response headers
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
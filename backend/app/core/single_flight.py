@@ -0,0 +1,109 @@
+"""
+Single-flight request coalescing.
+Concurrent calls with the same key share one in-flight computation.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+import threading
+
+
+class _Call:
+    """An in-flight computation and the callers waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait and receive the same result (or exception).
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._counters = {
+            "calls": 0,
+            "executions": 0,
+            "coalesced": 0,
+            "errors": 0
+        }
+        _register(self)
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `func` once for all concurrent callers with the same key.
+
+        Args:
+            key: Deduplication key
+            func: Zero-argument function computing the result
+
+        Returns:
+            Tuple of (result, shared). `shared` is True for callers that
+            received another caller's result.
+
+        Raises:
+            Exception: Whatever `func` raised, re-raised to every waiter
+        """
+        with self._lock:
+            self._counters["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._counters["executions"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._counters["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result, call.waiters > 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus the number of keys currently in flight."""
+        with self._lock:
+            return {**self._counters, "in_flight": len(self._calls)}
+
+
+_registry: Dict[str, SingleFlight] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(group: SingleFlight) -> None:
+    """Track a group so its counters show up in get_coalescing_stats()."""
+    with _registry_lock:
+        _registry[group.name] = group
+
+
+def get_coalescing_stats() -> Dict[str, Dict[str, int]]:
+    """Return coalescing counters for every single-flight group."""
+    with _registry_lock:
+        groups = list(_registry.values())
+    return {group.name: group.stats() for group in groups}
@@ -0,0 +1,214 @@
+"""
+In-process PersonaShield engine.
+Embeds the analysis pipeline in another Python service without going
+through HTTP and JSON.
+
+The engine pins the configuration of one analysis profile and warms the
+shared snapshots (score table, compiled attack vector rules, extraction
+patterns) up front, so the first document does not pay for loading them.
+Results have the same shape as run_comprehensive_analysis.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from app.core.config import settings
+from app.services.analyze_service import (
+    LLM_STAGES,
+    resolve_analysis_stages,
+    run_comprehensive_analysis,
+    run_entity_analysis
+)
+from app.services.attack_vector_service import get_compiled_rules
+from app.services.extraction_service import extract_entities
+from app.services.score_table import get_score_table
+
+
+class PersonaShieldEngine:
+    """
+    Thread-safe in-process analysis engine.
+
+    One engine can be shared by any number of threads: configuration is
+    fixed at construction and all shared state (score table, rules
+    snapshots, memo caches) is guarded by the services themselves. Rules
+    and weights are still reloaded automatically when their files change.
+
+    Args:
+        profile: Analysis profile name ('full' or 'fast')
+        stages: Explicit stage list, overrides profile
+        llm: If False, LLM stages (persona, phishing, explanation) are
+            never run and results are fully deterministic
+        combined_llm: Use one combined LLM call for the LLM stages
+            (default: LLM_COMBINED_MODE setting)
+        stage_timeouts: Per-stage timeout overrides in seconds
+        max_workers: Documents analyzed concurrently by analyze_many
+            (default: PIPELINE_MAX_WORKERS setting)
+
+    Raises:
+        ValueError: If the profile or stage names are invalid, or the
+            rules cannot be loaded
+    """
+
+    def __init__(
+        self,
+        profile: Optional[str] = None,
+        stages: Optional[List[str]] = None,
+        llm: bool = True,
+        combined_llm: Optional[bool] = None,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None
+    ):
+        # Validate once; requests then run with the resolved options
+        active_stages = resolve_analysis_stages(profile, stages)
+        if not llm:
+            stages = [stage for stage in active_stages if stage not in LLM_STAGES]
+            profile = None
+
+        self.profile = profile
+        self.stages = list(stages) if stages else None
+        self.active_stages = resolve_analysis_stages(profile, self.stages)
+        self.llm = llm
+        self.combined_llm = combined_llm
+        self.stage_timeouts = dict(stage_timeouts or {})
+        self.max_workers = max(1, max_workers or settings.PIPELINE_MAX_WORKERS)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="personashield")
+        self.warm_up()
+
+    def warm_up(self) -> None:
+        """
+        Load the rules/weights snapshots and compile extraction patterns.
+
+        Raises:
+            ValueError: If the rules or weights cannot be loaded
+        """
+        get_score_table()
+        get_compiled_rules()
+        extract_entities("warm-up user@example.com 9876543210 graduated 2020")
+
+    @property
+    def rules_generation(self) -> int:
+        """Generation of the score table currently in use (changes on rules reload)."""
+        return get_score_table().generation
+
+    def analyze(
+        self,
+        text: Optional[str] = None,
+        pdf_bytes: Optional[bytes] = None,
+        persona: Optional[str] = None,
+        simulate_hardening: bool = False,
+        fields_to_remove: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze one document.
+
+        Args:
+            text: Document text
+            pdf_bytes: PDF document bytes (instead of text)
+            persona: Optional persona for simulation
+            simulate_hardening: Whether to run hardening simulation
+            fields_to_remove: Fields to remove for hardening
+
+        Returns:
+            Analysis result, as returned by run_comprehensive_analysis
+
+        Raises:
+            ValueError: If not exactly one of text and pdf_bytes is given
+        """
+        if (text is None) == (pdf_bytes is None):
+            raise ValueError("Provide exactly one of text or pdf_bytes")
+
+        return run_comprehensive_analysis(
+            input_type="text" if text is not None else "pdf",
+            content=text,
+            file_bytes=pdf_bytes,
+            persona=persona,
+            simulate_hardening=simulate_hardening,
+            fields_to_remove=fields_to_remove,
+            profile=self.profile,
+            stages=self.stages,
+            stage_timeouts=self.stage_timeouts or None,
+            combined_llm=self.combined_llm
+        )
+
+    def analyze_many(
+        self,
+        documents: Iterable[Union[str, bytes]],
+        persona: Optional[str] = None,
+        simulate_hardening: bool = False,
+        fields_to_remove: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze documents concurrently, yielding results in input order.
+
+        Documents are read lazily and at most 2 x max_workers are in
+        flight, so arbitrarily long iterables run in bounded memory.
+
+        Args:
+            documents: Text (str) or PDF (bytes) documents
+            persona, simulate_hardening, fields_to_remove: As in analyze
+
+        Yields:
+            Analysis results, one per document
+        """
+        window = deque()
+        options = {
+            "persona": persona,
+            "simulate_hardening": simulate_hardening,
+            "fields_to_remove": fields_to_remove
+        }
+
+        try:
+            for document in documents:
+                if isinstance(document, (bytes, bytearray)):
+                    window.append(self._pool.submit(self.analyze, pdf_bytes=bytes(document), **options))
+                else:
+                    window.append(self._pool.submit(self.analyze, text=document, **options))
+                if len(window) >= 2 * self.max_workers:
+                    yield window.popleft().result()
+
+            while window:
+                yield window.popleft().result()
+        finally:
+            # Generator closed early: drop documents that have not started
+            for future in window:
+                future.cancel()
+
+    def score_entities(
+        self,
+        entities: Mapping,
+        persona: Optional[str] = None,
+        simulate_hardening: bool = False,
+        fields_to_remove: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze already extracted entities (skips normalization and extraction).
+
+        Args:
+            entities: Dictionary of extracted entities
+            persona, simulate_hardening, fields_to_remove: As in analyze
+
+        Returns:
+            Analysis result, as returned by run_entity_analysis
+        """
+        return run_entity_analysis(
+            entities,
+            persona=persona,
+            simulate_hardening=simulate_hardening,
+            fields_to_remove=fields_to_remove,
+            profile=self.profile,
+            stages=self.stages,
+            stage_timeouts=self.stage_timeouts or None,
+            combined_llm=self.combined_llm
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool used by analyze_many."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "PersonaShieldEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
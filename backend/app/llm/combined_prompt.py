@@ -0,0 +1,141 @@
+"""
+Combined analysis prompt template.
+Requests the persona narrative, phishing simulation and risk explanation
+in one structured LLM call, sharing the profile context between them.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from app.llm.prompt_template import PromptTemplate
+
+
+# Sections the combined prompt can request, in output order
+COMBINED_SECTIONS = ["persona", "phishing", "explanation"]
+
+# JSON keys each section is returned under
+SECTION_KEYS = {
+    "persona": ["persona_narrative"],
+    "phishing": ["phishing_subject", "phishing_body"],
+    "explanation": ["explanation"]
+}
+
+PERSONA_DESCRIPTIONS = {
+    "script_kiddie": "an inexperienced, opportunistic attacker (script kiddie) relying on existing tools such as password cracking, phishing templates or credential stuffing",
+    "professional_scammer": "a professional social engineer crafting a personalized phishing or pretexting attack that leverages the target's role, organization and interests",
+    "corporate_spy": "a corporate intelligence operative building trust through professional channels to extract proprietary or competitive information"
+}
+
+COMBINED_ANALYSIS_TEMPLATE = PromptTemplate(
+    "combined_analysis",
+    """You are a cybersecurity and privacy educator preparing security awareness training material. Everything you write is for education ONLY.
+
+TARGET PROFILE:
+- Email(s): {email_count} (domain: {email_domain})
+- Phone number(s): {phone_count}
+- DOB: {dob_found}
+- Company: {company}
+- Role: {job_title}
+- Location: {location}
+- Skills: {skills}
+
+Primary attack vectors: {threat_list}
+Overall risk score: {risk_score}/100
+Score breakdown: PII {pii_exposure}/20, correlation {correlation_score}/20, inference {inference_depth}/20, employment {employment_exposure}/20, location {location_exposure}/10, timeline {timeline_exposure}/10, visibility {visibility_exposure}/10
+
+IDENTIFIED RISKS:
+{risks}
+
+Write these sections:
+{instructions}
+
+Return ONLY a single JSON object with exactly these string keys: {keys}. Do not wrap it in markdown or add any text outside the JSON.""",
+    sections={"instructions": "", "risks": "No specific risks identified"}
+)
+
+
+def get_combined_prompt(
+    sections: List[str],
+    analysis_summary: Dict[str, Any],
+    persona: Optional[str] = None
+) -> str:
+    """
+    Generate one prompt covering several LLM sections.
+
+    Args:
+        sections: Subset of COMBINED_SECTIONS to request
+        analysis_summary: Dictionary with entities, attack_vectors, risk_score,
+            score_breakdown and inferred_risks
+        persona: Persona type, required when "persona" is requested
+
+    Returns:
+        Formatted prompt string
+
+    Raises:
+        ValueError: If a section or the persona type is invalid
+    """
+    entities = analysis_summary.get("entities", {})
+    attack_vectors = analysis_summary.get("attack_vectors", [])
+    score_breakdown = analysis_summary.get("score_breakdown", {})
+
+    company = ", ".join(entities.get("company", [])[:1]) if entities.get("company") else "their company"
+    job_title = ", ".join(entities.get("job_title", [])[:1]) if entities.get("job_title") else "professional"
+
+    instructions = []
+    keys = []
+    for section in sections:
+        if section not in SECTION_KEYS:
+            raise ValueError(f"Invalid section: {section}. Must be one of: {', '.join(COMBINED_SECTIONS)}")
+        keys.extend(SECTION_KEYS[section])
+
+        if section == "persona":
+            if persona not in PERSONA_DESCRIPTIONS:
+                raise ValueError(f"Invalid persona type: {persona}. Must be one of: {', '.join(PERSONA_DESCRIPTIONS)}")
+            instructions.append(
+                f'- "persona_narrative": 2-3 sentences explaining how {PERSONA_DESCRIPTIONS[persona]} '
+                f"would exploit this data."
+            )
+        elif section == "phishing":
+            instructions.append(
+                f'- "phishing_subject": an urgent, realistic subject line for a SIMULATED phishing email '
+                f"to a {job_title} at {company}."
+            )
+            instructions.append(
+                '- "phishing_body": the simulated email body (3-4 paragraphs) in corporate tone with subtle '
+                'red flags (generic greeting, unexplained urgency). Use "[Company Portal Link]" instead of URLs. '
+                "Never ask for passwords or include harmful payloads."
+            )
+        else:
+            instructions.append(
+                '- "explanation": 150-250 friendly, jargon-free words for a non-technical person on why the '
+                "score is high or low, naming the risky data combinations, real-world consequences and "
+                'practical advice. Start with "Your profile contains".'
+            )
+
+    risks = []
+    for risk in analysis_summary.get("inferred_risks", []):
+        risk_type = risk.get("risk_type", "Unknown").replace("_", " ").title()
+        entity_types = ", ".join(risk.get("entity_types", []))
+        risks.append(f"- {risk_type}: {entity_types}")
+
+    return COMBINED_ANALYSIS_TEMPLATE.render(
+        email_count=len(entities.get("emails", [])),
+        email_domain=entities.get("emails")[0].split("@")[-1] if entities.get("emails") else "unknown",
+        phone_count=len(entities.get("phones", [])),
+        dob_found="found" if entities.get("dob") else "not found",
+        company=company,
+        job_title=job_title,
+        location=", ".join(entities.get("location", [])[:1]) if entities.get("location") else "Unknown",
+        skills=", ".join(entities.get("skills", [])[:3]) if entities.get("skills") else "Unspecified",
+        threat_list=", ".join(v.get("category", "") for v in attack_vectors[:3]) if attack_vectors else "personal data exposure",
+        risk_score=analysis_summary.get("risk_score", 0),
+        pii_exposure=score_breakdown.get("pii_exposure", 0),
+        correlation_score=score_breakdown.get("correlation_score", 0),
+        inference_depth=score_breakdown.get("inference_depth", 0),
+        employment_exposure=score_breakdown.get("employment_exposure", 0),
+        location_exposure=score_breakdown.get("location_exposure", 0),
+        timeline_exposure=score_breakdown.get("timeline_exposure", 0),
+        visibility_exposure=score_breakdown.get("visibility_exposure", 0),
+        instructions=instructions,
+        risks=risks,
+        keys=", ".join(f'"{key}"' for key in keys)
+    )
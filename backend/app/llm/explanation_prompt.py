@@ -3,7 +3,41 @@ Explanation prompt templates for LLM.
 """
 
 from typing import Dict, List, Any
-import json
+
+from app.llm.prompt_template import PromptTemplate
+
+
+EXPLANATION_TEMPLATE = PromptTemplate(
+    "explanation",
+    """You are a privacy education expert. Explain to a non-technical person why their data has a {risk_level} privacy risk score.
+
+RISK SCORE: {risk_score}/100
+
+SCORE BREAKDOWN:
+- PII Exposure: {pii_exposure}/20
+- Correlation Score: {correlation_score}/20
+- Inference Depth: {inference_depth}/20
+- Employment Exposure: {employment_exposure}/20
+- Location Exposure: {location_exposure}/10
+- Timeline Exposure: {timeline_exposure}/10
+- Visibility Exposure: {visibility_exposure}/10
+
+IDENTIFIED RISKS:
+{risks}
+
+Your explanation must:
+1. State in simple language WHY the score is high/low
+2. Mention specific data combinations that create risk (e.g., "email + phone + job title")
+3. Explain real-world consequences in everyday terms (e.g., "someone could use this to reset your password")
+4. Use friendly, balanced tone - educate, don't fear-monger
+5. Avoid technical jargon
+6. Include practical advice for reducing exposure
+7. Be 150-250 words
+8. Start with: "Your profile contains [what data] that creates risks because..."
+
+Write the explanation now:""",
+    sections={"risks": "No specific risks identified"}
+)
 
 
 def get_explanation_prompt(
@@ -23,15 +57,13 @@ def get_explanation_prompt(
         Prompt string for LLM
     """
     
-    # Format the inferred risks for readability
+    # Format the inferred risks for readability (trimmed to the token budget)
     risks_summary = []
     for risk in inferred_risks:
         risk_type = risk.get("risk_type", "Unknown").replace("_", " ").title()
         entity_types = ", ".join(risk.get("entity_types", []))
         risks_summary.append(f"- {risk_type}: {entity_types}")
     
-    risks_text = "\n".join(risks_summary) if risks_summary else "No specific risks identified"
-    
     # Determine risk level description
     if risk_score >= 80:
         risk_level = "high"
@@ -46,32 +78,15 @@ def get_explanation_prompt(
         risk_level = "low"
         severity_phrase = "minimal privacy exposure"
     
-    prompt = f"""You are a privacy education expert. Explain to a non-technical person why their data has a {risk_level} privacy risk score.
-
-RISK SCORE: {risk_score}/100
-
-SCORE BREAKDOWN:
-- PII Exposure: {score_breakdown.get('pii_exposure', 0)}/20
-- Correlation Score: {score_breakdown.get('correlation_score', 0)}/20
-- Inference Depth: {score_breakdown.get('inference_depth', 0)}/20
-- Employment Exposure: {score_breakdown.get('employment_exposure', 0)}/20
-- Location Exposure: {score_breakdown.get('location_exposure', 0)}/10
-- Timeline Exposure: {score_breakdown.get('timeline_exposure', 0)}/10
-- Visibility Exposure: {score_breakdown.get('visibility_exposure', 0)}/10
-
-IDENTIFIED RISKS:
-{risks_text}
-
-Your explanation must:
-1. State in simple language WHY the score is high/low
-2. Mention specific data combinations that create risk (e.g., "email + phone + job title")
-3. Explain real-world consequences in everyday terms (e.g., "someone could use this to reset your password")
-4. Use friendly, balanced tone - educate, don't fear-monger
-5. Avoid technical jargon
-6. Include practical advice for reducing exposure
-7. Be 150-250 words
-8. Start with: "Your profile contains [what data] that creates risks because..."
-
-Write the explanation now:"""
-    
-    return prompt
+    return EXPLANATION_TEMPLATE.render(
+        risk_level=risk_level,
+        risk_score=risk_score,
+        pii_exposure=score_breakdown.get("pii_exposure", 0),
+        correlation_score=score_breakdown.get("correlation_score", 0),
+        inference_depth=score_breakdown.get("inference_depth", 0),
+        employment_exposure=score_breakdown.get("employment_exposure", 0),
+        location_exposure=score_breakdown.get("location_exposure", 0),
+        timeline_exposure=score_breakdown.get("timeline_exposure", 0),
+        visibility_exposure=score_breakdown.get("visibility_exposure", 0),
+        risks=risks_summary
+    )
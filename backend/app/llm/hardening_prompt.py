@@ -2,6 +2,31 @@
 Hardening explanation prompt templates for LLM.
 """
 
+from app.llm.prompt_template import PromptTemplate
+
+
+HARDENING_EXPLANATION_TEMPLATE = PromptTemplate("hardening_explanation", """You are a privacy and cybersecurity awareness educator. Explain to a non-technical person why removing certain data fields reduces their privacy risk.
+
+HARDENING ACTION TAKEN:
+Removed fields: {fields_str}
+
+RISK CHANGE:
+- Original Risk Score: {original_score}/100
+- New Risk Score: {hardened_score}/100
+- Risk Reduction: {risk_reduction} points ({reduction_percent}% improvement)
+
+Your explanation must:
+1. Be clear and educational - written for someone without cybersecurity background
+2. Specifically mention the removed fields: {fields_str}
+3. Explain which attack risks become harder when these fields are removed
+4. Include concrete examples of how attackers would use this removed data
+5. Use friendly, balanced tone - educate don't scare
+6. Be 80-150 words
+7. Avoid technical jargon - use everyday language
+8. Start with: "Removing {fields_str} significantly reduces your risk because..."
+
+Write the explanation now:""")
+
 
 def get_hardening_explanation_prompt(
     removed_fields: list,
@@ -35,26 +60,10 @@ def get_hardening_explanation_prompt(
     else:
         impact = "meaningful"
     
-    prompt = f"""You are a privacy and cybersecurity awareness educator. Explain to a non-technical person why removing certain data fields reduces their privacy risk.
-
-HARDENING ACTION TAKEN:
-Removed fields: {fields_str}
-
-RISK CHANGE:
-- Original Risk Score: {original_score}/100
-- New Risk Score: {hardened_score}/100
-- Risk Reduction: {risk_reduction} points ({reduction_percent}% improvement)
-
-Your explanation must:
-1. Be clear and educational - written for someone without cybersecurity background
-2. Specifically mention the removed fields: {fields_str}
-3. Explain which attack risks become harder when these fields are removed
-4. Include concrete examples of how attackers would use this removed data
-5. Use friendly, balanced tone - educate don't scare
-6. Be 80-150 words
-7. Avoid technical jargon - use everyday language
-8. Start with: "Removing {fields_str} significantly reduces your risk because..."
-
-Write the explanation now:"""
-    
-    return prompt
+    return HARDENING_EXPLANATION_TEMPLATE.render(
+        fields_str=fields_str,
+        original_score=original_score,
+        hardened_score=hardened_score,
+        risk_reduction=risk_reduction,
+        reduction_percent=reduction_percent
+    )
@@ -1,17 +1,33 @@
 """
 LangChain client for text generation.
 Provides resilient interface to ChatGroq with fallback handling.
+
+langchain_groq and langchain_core are imported on first use rather than at
+module import, so workers that only run deterministic scoring never pay
+for loading the LLM stack.
 """
 
-from langchain_groq import ChatGroq
-from langchain_core.messages import HumanMessage
+from typing import Iterator
 import os
 
+from app.core.single_flight import SingleFlight
+
+
+# Coalesces identical in-flight prompts
+_generation_flight = SingleFlight("generate_text")
+
 
-def get_llm_client():
+# Default completion length for single-section prompts
+DEFAULT_MAX_TOKENS = 400
+
+
+def get_llm_client(max_tokens: int = DEFAULT_MAX_TOKENS):
     """
     Initialize and return ChatGroq LLM client.
     
+    Args:
+        max_tokens: Maximum completion length
+    
     Returns:
         ChatGroq client instance
     
@@ -23,39 +39,52 @@ def get_llm_client():
     if not api_key:
         raise ValueError("CHATGROQ_API_KEY environment variable not set")
     
+    from langchain_groq import ChatGroq
+    
     return ChatGroq(
         api_key=api_key,
         model="llama-3.1-8b-instant",
         temperature=0.3,
-        max_tokens=400
+        max_tokens=max_tokens
     )
 
 
-def generate_text(prompt: str) -> str:
+def generate_text(prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
     """
     Generate text from a prompt using LangChain ChatGroq.
     
     Includes robust error handling - returns empty string on any failure
-    to prevent API crashes.
+    to prevent API crashes. Concurrent calls with an identical prompt
+    share a single LLM request.
     
     Args:
         prompt: The prompt to generate text from
+        max_tokens: Maximum completion length
     
     Returns:
         Generated text string (empty string if generation fails)
     """
+    if not prompt or not isinstance(prompt, str):
+        return ""
+    
+    key = prompt if max_tokens == DEFAULT_MAX_TOKENS else f"{max_tokens}:{prompt}"
+    generated_text, _ = _generation_flight.do(key, lambda: _invoke_llm(prompt, max_tokens))
+    return generated_text
+
+
+def _invoke_llm(prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
+    """Send one prompt to the LLM, returning empty string on any failure."""
     try:
-        if not prompt or not isinstance(prompt, str):
-            return ""
-        
         # Get LLM client
         try:
-            llm = get_llm_client()
+            llm = get_llm_client(max_tokens)
         except ValueError:
             # API key not configured
             return ""
         
         # Generate text
+        from langchain_core.messages import HumanMessage
+        
         message = HumanMessage(content=prompt)
         response = llm.invoke([message])
         
@@ -71,3 +100,48 @@ def generate_text(prompt: str) -> str:
         # Log silently and return empty string
         # In production, this could be logged to monitoring system
         return ""
+
+
+def stream_text(prompt: str, fallback: str = "", max_tokens: int = DEFAULT_MAX_TOKENS) -> Iterator[str]:
+    """
+    Stream generated text chunk by chunk as the LLM produces it.
+    
+    Yields `fallback` instead when nothing could be generated (no API key,
+    request failure, or empty output). A failure after some chunks were
+    sent ends the stream early; text already sent is not retracted.
+    Streams are not coalesced.
+    
+    Args:
+        prompt: The prompt to generate text from
+        fallback: Text emitted when generation produces nothing
+        max_tokens: Maximum completion length
+    
+    Yields:
+        Text chunks
+    """
+    produced = False
+    
+    try:
+        if prompt and isinstance(prompt, str):
+            llm = get_llm_client(max_tokens)
+            
+            from langchain_core.messages import HumanMessage
+            
+            for chunk in llm.stream([HumanMessage(content=prompt)]):
+                content = getattr(chunk, "content", "")
+                if not content:
+                    continue
+                if not produced:
+                    # Drop leading whitespace, as generate_text strips it
+                    content = content.lstrip()
+                    if not content:
+                        continue
+                produced = True
+                yield content
+    
+    except Exception:
+        # Covers a missing API key as well as request failures
+        pass
+    
+    if not produced and fallback:
+        yield fallback
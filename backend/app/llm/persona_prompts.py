@@ -3,6 +3,50 @@ Persona prompt templates for attack vector simulation.
 Educational templates for different attacker archetypes.
 """
 
+from app.llm.prompt_template import PromptTemplate
+
+
+SCRIPT_KIDDIE_TEMPLATE = PromptTemplate("script_kiddie", """You are an educational cybersecurity analyst explaining how an inexperienced attacker (script kiddie) would exploit exposed personal data.
+
+Exposed data includes:
+- {email_count} email(s) {emails_found}
+- {phone_count} phone number(s) {phones_found}
+- DOB {dob_found}
+- Work details: {company} {company_found}
+
+Primary attack vectors: {threat_list}
+Overall risk score: {risk_score}/100
+
+Write a brief, educational explanation (2-3 sentences) of how a typical script kiddie would attempt to exploit this data using common tools like password cracking, phishing templates, or credential stuffing. Focus on the opportunistic nature and reliance on existing exploits. This is for cybersecurity education only.""")
+
+PROFESSIONAL_SCAMMER_TEMPLATE = PromptTemplate("professional_scammer", """You are an educational cybersecurity analyst explaining how a professional social engineer would exploit exposed personal data.
+
+Target profile:
+- Role: {target_role}
+- Organization: {target_company}
+- Location: {location}
+- Education: {graduation_year}
+- Skills: {skills}
+
+Primary attack vectors: {threat_list}
+Overall risk score: {risk_score}/100
+
+Write a brief, educational explanation (2-3 sentences) of how a professional social engineer would craft a personalized, convincing phishing or pretexting attack using this information. Explain how they would leverage the target's role, organization, and interests to build rapport and extract sensitive information. This is for cybersecurity education only.""")
+
+CORPORATE_SPY_TEMPLATE = PromptTemplate("corporate_spy", """You are an educational cybersecurity analyst explaining how a corporate intelligence gatherer would exploit exposed professional data.
+
+Target profile:
+- Organization: {target_company}
+- Technical skills: {skills}
+- Certifications: {certifications}
+- Experience: {years_of_experience} years
+- Network: {location}
+
+Primary attack vectors: {threat_list}
+Overall risk score: {risk_score}/100
+
+Write a brief, educational explanation (2-3 sentences) of how a corporate intelligence operative would approach this target. Focus on how they would identify this person's value, establish trust through professional channels, and strategically extract proprietary or competitive information. Explain the long-term relationship-building aspect. This is for cybersecurity education only.""")
+
 
 def get_script_kiddie_prompt(analysis_summary: dict) -> str:
     """
@@ -15,20 +59,17 @@ def get_script_kiddie_prompt(analysis_summary: dict) -> str:
     
     threat_list = ", ".join([v.get("category", "") for v in attack_vectors[:3]]) if attack_vectors else "personal data exposure"
     
-    prompt = f"""You are an educational cybersecurity analyst explaining how an inexperienced attacker (script kiddie) would exploit exposed personal data.
-
-Exposed data includes:
-- {len(entities.get('emails', []))} email(s) {'found' if entities.get('emails') else 'not found'}
-- {len(entities.get('phones', []))} phone number(s) {'found' if entities.get('phones') else 'not found'}
-- DOB {('found' if entities.get('dob') else 'not found')}
-- Work details: {', '.join(entities.get('company', [])[:1])} {('found' if entities.get('company') else 'not found')}
-
-Primary attack vectors: {threat_list}
-Overall risk score: {risk_score}/100
-
-Write a brief, educational explanation (2-3 sentences) of how a typical script kiddie would attempt to exploit this data using common tools like password cracking, phishing templates, or credential stuffing. Focus on the opportunistic nature and reliance on existing exploits. This is for cybersecurity education only."""
-    
-    return prompt
+    return SCRIPT_KIDDIE_TEMPLATE.render(
+        email_count=len(entities.get("emails", [])),
+        emails_found="found" if entities.get("emails") else "not found",
+        phone_count=len(entities.get("phones", [])),
+        phones_found="found" if entities.get("phones") else "not found",
+        dob_found="found" if entities.get("dob") else "not found",
+        company=", ".join(entities.get("company", [])[:1]),
+        company_found="found" if entities.get("company") else "not found",
+        threat_list=threat_list,
+        risk_score=risk_score
+    )
 
 
 def get_professional_scammer_prompt(analysis_summary: dict) -> str:
@@ -44,21 +85,15 @@ def get_professional_scammer_prompt(analysis_summary: dict) -> str:
     target_company = ", ".join(entities.get("company", [])[:1]) if entities.get("company") else "their employer"
     threat_list = ", ".join([v.get("category", "") for v in attack_vectors[:2]]) if attack_vectors else "identity fraud"
     
-    prompt = f"""You are an educational cybersecurity analyst explaining how a professional social engineer would exploit exposed personal data.
-
-Target profile:
-- Role: {target_role}
-- Organization: {target_company}
-- Location: {', '.join(entities.get('location', [])[:1]) if entities.get('location') else 'Unknown'}
-- Education: {entities.get('graduation_year', [None])[0] if entities.get('graduation_year') else 'Unknown'}
-- Skills: {', '.join(entities.get('skills', [])[:2]) if entities.get('skills') else 'Unspecified'}
-
-Primary attack vectors: {threat_list}
-Overall risk score: {risk_score}/100
-
-Write a brief, educational explanation (2-3 sentences) of how a professional social engineer would craft a personalized, convincing phishing or pretexting attack using this information. Explain how they would leverage the target's role, organization, and interests to build rapport and extract sensitive information. This is for cybersecurity education only."""
-    
-    return prompt
+    return PROFESSIONAL_SCAMMER_TEMPLATE.render(
+        target_role=target_role,
+        target_company=target_company,
+        location=", ".join(entities.get("location", [])[:1]) if entities.get("location") else "Unknown",
+        graduation_year=entities.get("graduation_year", [None])[0] if entities.get("graduation_year") else "Unknown",
+        skills=", ".join(entities.get("skills", [])[:2]) if entities.get("skills") else "Unspecified",
+        threat_list=threat_list,
+        risk_score=risk_score
+    )
 
 
 def get_corporate_spy_prompt(analysis_summary: dict) -> str:
@@ -74,21 +109,15 @@ def get_corporate_spy_prompt(analysis_summary: dict) -> str:
     skills = ", ".join(entities.get("skills", [])[:3]) if entities.get("skills") else "technical capabilities"
     threat_list = ", ".join([v.get("category", "") for v in attack_vectors[:2]]) if attack_vectors else "data access"
     
-    prompt = f"""You are an educational cybersecurity analyst explaining how a corporate intelligence gatherer would exploit exposed professional data.
-
-Target profile:
-- Organization: {target_company}
-- Technical skills: {skills}
-- Certifications: {', '.join(entities.get('certifications', [])[:2]) if entities.get('certifications') else 'None listed'}
-- Experience: {entities.get('years_of_experience', 0)} years
-- Network: {', '.join(entities.get('location', [])[:1]) if entities.get('location') else 'Unspecified'}
-
-Primary attack vectors: {threat_list}
-Overall risk score: {risk_score}/100
-
-Write a brief, educational explanation (2-3 sentences) of how a corporate intelligence operative would approach this target. Focus on how they would identify this person's value, establish trust through professional channels, and strategically extract proprietary or competitive information. Explain the long-term relationship-building aspect. This is for cybersecurity education only."""
-    
-    return prompt
+    return CORPORATE_SPY_TEMPLATE.render(
+        target_company=target_company,
+        skills=skills,
+        certifications=", ".join(entities.get("certifications", [])[:2]) if entities.get("certifications") else "None listed",
+        years_of_experience=entities.get("years_of_experience", 0),
+        location=", ".join(entities.get("location", [])[:1]) if entities.get("location") else "Unspecified",
+        threat_list=threat_list,
+        risk_score=risk_score
+    )
 
 
 def get_persona_prompt(persona_type: str, analysis_summary: dict) -> str:
@@ -3,32 +3,10 @@ Phishing email prompt template.
 Generates educational phishing simulations for security awareness training.
 """
 
+from app.llm.prompt_template import PromptTemplate
 
-def get_phishing_email_prompt(entities: dict) -> str:
-    """
-    Generate a prompt for creating an educational phishing email simulation.
-    
-    The email should:
-    - Be realistic but clearly educational
-    - Include specific extracted details (role, company, location)
-    - Avoid harmful instructions
-    - Avoid direct links
-    - Avoid asking for passwords directly
-    - Sound like common corporate phishing
-    - Include subtle red flags
-    
-    Args:
-        entities: Extracted entity dictionary
-    
-    Returns:
-        Formatted prompt string
-    """
-    company = ", ".join(entities.get("company", ["their company"])[:1])
-    job_title = ", ".join(entities.get("job_title", ["professional"])[:1])
-    location = ", ".join(entities.get("location", [])[:1]) if entities.get("location") else "their location"
-    email_domain = entities.get("emails", ["user@company.com"])[0].split("@")[1] if entities.get("emails") else "company.com"
-    
-    prompt = f"""You are a cybersecurity educator creating a SIMULATED PHISHING EMAIL for educational awareness training purposes ONLY. This simulation must demonstrate real phishing tactics while being clearly educational.
+
+PHISHING_EMAIL_TEMPLATE = PromptTemplate("phishing_email", """You are a cybersecurity educator creating a SIMULATED PHISHING EMAIL for educational awareness training purposes ONLY. This simulation must demonstrate real phishing tactics while being clearly educational.
 
 TARGET PROFILE:
 - Company: {company}
@@ -71,6 +49,36 @@ Email Subject: [subject line]
 Email Body:
 [email body - use [Company Portal Link] or [Action Required Link] instead of real URLs]
 
-Make it realistic so it serves as effective training material."""
+Make it realistic so it serves as effective training material.""")
+
+
+def get_phishing_email_prompt(entities: dict) -> str:
+    """
+    Generate a prompt for creating an educational phishing email simulation.
+    
+    The email should:
+    - Be realistic but clearly educational
+    - Include specific extracted details (role, company, location)
+    - Avoid harmful instructions
+    - Avoid direct links
+    - Avoid asking for passwords directly
+    - Sound like common corporate phishing
+    - Include subtle red flags
+    
+    Args:
+        entities: Extracted entity dictionary
+    
+    Returns:
+        Formatted prompt string
+    """
+    company = ", ".join(entities.get("company", ["their company"])[:1])
+    job_title = ", ".join(entities.get("job_title", ["professional"])[:1])
+    location = ", ".join(entities.get("location", [])[:1]) if entities.get("location") else "their location"
+    email_domain = entities.get("emails", ["user@company.com"])[0].split("@")[1] if entities.get("emails") else "company.com"
     
-    return prompt
+    return PHISHING_EMAIL_TEMPLATE.render(
+        company=company,
+        job_title=job_title,
+        location=location,
+        email_domain=email_domain
+    )
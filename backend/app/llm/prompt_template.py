@@ -0,0 +1,181 @@
+"""
+Prompt template layer.
+Precompiled prompt templates with local token estimation and deterministic
+trimming of variable sections to a token budget.
+
+Templates are parsed once at import time into literal segments and field
+slots. Rendering only joins strings. Variable-length sections (lists of
+lines, e.g. one line per inferred risk) are trimmed from the end until the
+prompt fits the budget, so the same inputs always produce the same prompt
+and identical prompts can be coalesced or cached.
+"""
+
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+import math
+import threading
+
+from app.core.config import settings
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text locally.
+
+    Uses a characters-per-token ratio (PROMPT_CHARS_PER_TOKEN, default 4),
+    which is close enough for budgeting English prompts without loading a
+    tokenizer.
+    """
+    return math.ceil(len(text) / settings.PROMPT_CHARS_PER_TOKEN)
+
+
+class PromptTemplate:
+    """
+    A precompiled prompt template.
+
+    Fields use str.format syntax (`{name}`, no format specs). Fields named
+    in `sections` take a list of lines and may be trimmed; every other
+    field is a scalar, capped at PROMPT_MAX_FIELD_CHARS characters.
+
+    Args:
+        name: Template name (used in stats)
+        template: Template text
+        sections: Mapping of section field name to the text used when the
+            section has no lines
+    """
+
+    def __init__(self, name: str, template: str, sections: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.sections = dict(sections or {})
+        self._segments: List[Tuple[str, Optional[str]]] = []
+
+        for literal, field, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f"Template '{name}': format specs are not supported ({field})")
+            self._segments.append((literal, field))
+
+        self.fields = tuple(field for _, field in self._segments if field is not None)
+        self.static_chars = sum(len(literal) for literal, _ in self._segments)
+
+        unknown = [section for section in self.sections if section not in self.fields]
+        if unknown:
+            raise ValueError(f"Template '{name}': unknown sections {', '.join(unknown)}")
+
+        _register(self)
+
+    def render(self, budget: Optional[int] = None, **values) -> str:
+        """
+        Render the template within a token budget.
+
+        Args:
+            budget: Token budget (default PROMPT_TOKEN_BUDGET)
+            **values: Scalar values, and lists of lines for section fields
+
+        Returns:
+            Prompt text
+
+        Raises:
+            KeyError: If a field value is missing
+        """
+        budget = settings.PROMPT_TOKEN_BUDGET if budget is None else budget
+        max_field_chars = settings.PROMPT_MAX_FIELD_CHARS
+
+        rendered: Dict[str, str] = {}
+        used_chars = self.static_chars
+
+        for field in self.fields:
+            if field in self.sections or field in rendered:
+                continue
+            rendered[field] = _cap(str(values[field]), max_field_chars)
+
+        for field in self.fields:
+            if field not in self.sections:
+                used_chars += len(rendered[field])
+
+        # Whatever is left of the budget goes to the sections, in order
+        available_chars = budget * settings.PROMPT_CHARS_PER_TOKEN - used_chars
+        trimmed = False
+        for field, empty_text in self.sections.items():
+            occurrences = self.fields.count(field)
+            text, was_trimmed = _fit_lines(
+                [str(line) for line in values[field]],
+                empty_text,
+                max(0, available_chars // occurrences)
+            )
+            rendered[field] = text
+            available_chars -= len(text) * occurrences
+            trimmed = trimmed or was_trimmed
+
+        prompt = "".join(
+            literal + (rendered[field] if field is not None else "")
+            for literal, field in self._segments
+        )
+
+        _record(self.name, estimate_tokens(prompt), trimmed)
+        return prompt
+
+
+def _cap(text: str, max_chars: int) -> str:
+    """Cap a scalar value at max_chars characters."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max(0, max_chars - 3)].rstrip() + "..."
+
+
+def _fit_lines(lines: List[str], empty_text: str, max_chars: int) -> Tuple[str, bool]:
+    """
+    Keep leading lines that fit in max_chars.
+
+    Dropped lines are summarized by a final "- (N more omitted)" line.
+    The first line is always kept so the section is never silently empty.
+
+    Returns:
+        Tuple of (section text, whether lines were dropped)
+    """
+    if not lines:
+        return empty_text, False
+
+    full_text = "\n".join(lines)
+    if len(full_text) <= max_chars:
+        return full_text, False
+
+    kept: List[str] = []
+    size = 0
+    for index, line in enumerate(lines):
+        marker = f"\n- ({len(lines) - index - 1} more omitted)" if index < len(lines) - 1 else ""
+        cost = len(line) + (1 if kept else 0)
+        if kept and size + cost + len(marker) > max_chars:
+            break
+        kept.append(line)
+        size += cost
+
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.append(f"- ({omitted} more omitted)")
+    return "\n".join(kept), omitted > 0
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _register(template: PromptTemplate) -> None:
+    """Create the stats entry for a template."""
+    with _stats_lock:
+        _stats.setdefault(template.name, {"renders": 0, "trimmed": 0, "estimated_tokens": 0})
+
+
+def _record(name: str, tokens: int, trimmed: bool) -> None:
+    """Count one render."""
+    with _stats_lock:
+        stats = _stats[name]
+        stats["renders"] += 1
+        stats["estimated_tokens"] += tokens
+        if trimmed:
+            stats["trimmed"] += 1
+
+
+def get_prompt_stats() -> Dict[str, Dict[str, int]]:
+    """Return per-template render counts, trims and estimated input tokens."""
+    with _stats_lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
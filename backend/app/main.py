@@ -3,16 +3,31 @@ PersonaShield Backend - Main Entry Point
 FastAPI application with versioned routing.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import router as api_router
 from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.core.compression import CompressionMiddleware
+from app.services.job_queue import get_job_queue, shutdown_job_queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start job workers at startup so jobs requeued after a restart run."""
+    get_job_queue()
+    yield
+    shutdown_job_queue()
+
 
 # Initialize FastAPI application
 app = FastAPI(
     title="PersonaShield Backend",
     description="Backend API for PersonaShield",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 # Enable CORS (allow all for now)
@@ -24,6 +39,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (gzip, plus br/zstd when installed)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE
+    )
+
 # Include API router under /api
 app.include_router(api_router)
 
@@ -0,0 +1,77 @@
+"""
+Schemas for the indexed analysis store.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class StoreAnalysesRequest(BaseModel):
+    """Schema for storing analysis results."""
+    analyses: List[Dict[str, Any]] = Field(...)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "analyses": [
+                    {
+                        "analysis_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "entities": {"phones": ["9876543210"], "dob": ["15/06/1995"]},
+                        "risk_assessment": {
+                            "risk_score": 72.5,
+                            "risk_level": "High",
+                            "inferred_risks": [{"rule_id": "PERSONAL_IDENTITY_RISK"}]
+                        },
+                        "attack_analysis": {
+                            "attack_vectors": [{"category": "Identity Theft Risk"}]
+                        }
+                    }
+                ]
+            }
+        }
+
+
+class StoreAnalysesResponse(BaseModel):
+    """Schema for store analyses response."""
+    stored: int
+    skipped: int
+
+
+class StoredAnalysisSummary(BaseModel):
+    """Schema for one stored analysis in query results."""
+    analysis_id: str
+    doc_id: Optional[str] = None
+    risk_score: float
+    risk_level: Optional[str]
+    rule_ids: List[str]
+    attack_vector_categories: List[str]
+    entities: Dict[str, Any]
+    timestamp: Optional[str] = None
+
+
+class AnalysisQueryResponse(BaseModel):
+    """Schema for a page of analysis store query results."""
+    total: int
+    offset: int
+    limit: int
+    results: List[StoredAnalysisSummary]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 1,
+                "offset": 0,
+                "limit": 20,
+                "results": [
+                    {
+                        "analysis_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "risk_score": 72.5,
+                        "risk_level": "High",
+                        "rule_ids": ["PERSONAL_IDENTITY_RISK"],
+                        "attack_vector_categories": ["Identity Theft Risk"],
+                        "entities": {"phones": ["9876543210"], "dob": ["15/06/1995"]},
+                        "timestamp": "2026-02-20T10:30:00Z"
+                    }
+                ]
+            }
+        }
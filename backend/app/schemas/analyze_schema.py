@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.schemas.contribution_schema import FieldContribution
+
 
 class AnalyzeRequest(BaseModel):
     """Request model for master analysis."""
@@ -34,6 +36,14 @@ class AnalyzeRequest(BaseModel):
         default_factory=list,
         description="Fields to remove for hardening simulation"
     )
+    profile: Optional[str] = Field(
+        None,
+        description="Optional analysis profile: 'full' (default) or 'fast' (score and attack vectors only)"
+    )
+    stages: Optional[List[str]] = Field(
+        None,
+        description="Optional explicit stage list, overrides profile: 'score', 'vectors', 'persona', 'phishing', 'explanation', 'hardening', 'heatmap'"
+    )
     
     class Config:
         json_schema_extra = {
@@ -65,6 +75,7 @@ class RiskAssessment(BaseModel):
     correlation_depth: float
     timeline_years: float
     visibility_score: float
+    field_contributions: List[FieldContribution] = []
 
 
 class AttackAnalysis(BaseModel):
@@ -102,6 +113,8 @@ class HardeningResult(BaseModel):
     hardened_score: Optional[float]
     difference: Optional[float]
     explanation: Optional[str]
+    explanation_source: Optional[str] = None
+    simulation_id: Optional[str] = None
 
 
 class VisualizationData(BaseModel):
@@ -114,6 +127,13 @@ class VisualizationData(BaseModel):
     graph_data: Optional[Dict[str, Any]]
 
 
+class AnalysisProfile(BaseModel):
+    """Stages that ran for an analysis."""
+    
+    profile: Optional[str]
+    stages: List[str]
+
+
 class AnalyzeResponse(BaseModel):
     """Response model for comprehensive analysis."""
     
@@ -133,6 +153,7 @@ class AnalyzeResponse(BaseModel):
     explanation: ExplanationResult
     hardening_simulation: Optional[HardeningResult] = None
     visualization: Optional[VisualizationData] = None
+    analysis_profile: Optional[AnalysisProfile] = None
     
     class Config:
         json_schema_extra = {
@@ -175,10 +196,16 @@ class AnalyzeResponse(BaseModel):
                     "original_score": 72.5,
                     "hardened_score": 45.0,
                     "difference": 27.5,
-                    "explanation": "Removing phone numbers..."
+                    "explanation": "Removing phones lowers your risk score from 72.5 to 45.0 out of 100...",
+                    "explanation_source": "template",
+                    "simulation_id": "3f9a1c0d52be47e8a1c6d2f0"
                 },
                 "visualization": {
                     "summary": {"total_score": 72.5, "risk_level": "High"}
+                },
+                "analysis_profile": {
+                    "profile": "full",
+                    "stages": ["score", "vectors", "persona", "phishing", "explanation", "hardening", "heatmap"]
                 }
             }
         }
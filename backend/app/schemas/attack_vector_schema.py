@@ -76,3 +76,30 @@ class AttackVectorResponse(BaseModel):
                 ]
             }
         }
+
+
+class AttackVectorBatchRequest(BaseModel):
+    """Schema for batch attack vector categorization request."""
+    entity_sets: List[dict] = Field(...)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "entity_sets": [
+                    {
+                        "emails": ["john@example.com"],
+                        "company": ["Amazon"],
+                        "job_title": ["engineer"]
+                    },
+                    {
+                        "dob": ["15/06/1995"],
+                        "phones": ["9876543210"]
+                    }
+                ]
+            }
+        }
+
+
+class AttackVectorBatchResponse(BaseModel):
+    """Schema for batch attack vector categorization response."""
+    results: List[AttackVectorResponse]
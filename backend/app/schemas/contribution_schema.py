@@ -0,0 +1,64 @@
+"""
+Schemas for per-field risk contribution analysis.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class FieldContributionRequest(BaseModel):
+    """Schema for field contribution request."""
+    entities: dict = Field(...)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "entities": {
+                    "emails": ["john@example.com"],
+                    "phones": ["9876543210"],
+                    "dob": ["15/06/1995"],
+                    "graduation_year": [2015],
+                    "company": ["Amazon"],
+                    "job_title": ["engineer"],
+                    "location": ["Bangalore"],
+                    "skills": ["python", "aws"],
+                    "years_of_experience": 8
+                }
+            }
+        }
+
+
+class FieldContribution(BaseModel):
+    """Schema for a single field's contribution to the risk score."""
+    field: str
+    shapley_value: float
+    marginal_contribution: float
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "field": "dob",
+                "shapley_value": 16.67,
+                "marginal_contribution": 34.0
+            }
+        }
+
+
+class FieldContributionResponse(BaseModel):
+    """Schema for field contribution response."""
+    risk_score: float
+    baseline_score: float
+    contributions: List[FieldContribution]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "risk_score": 81.0,
+                "baseline_score": 0.0,
+                "contributions": [
+                    {"field": "dob", "shapley_value": 16.67, "marginal_contribution": 34.0},
+                    {"field": "emails", "shapley_value": 14.69, "marginal_contribution": 32.02},
+                    {"field": "company", "shapley_value": 0.02, "marginal_contribution": 0.02}
+                ]
+            }
+        }
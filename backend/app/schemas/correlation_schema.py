@@ -4,11 +4,12 @@ Pydantic models for correlation request and response.
 """
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 
 class InferredRisk(BaseModel):
     """Schema for a single inferred risk."""
+    rule_id: Optional[str] = None
     risk_type: str
     severity: int
     pathway: List[str]
@@ -16,6 +17,7 @@ class InferredRisk(BaseModel):
     class Config:
         json_schema_extra = {
             "example": {
+                "rule_id": "PERSONAL_IDENTITY_RISK",
                 "risk_type": "Personal Identity Exposure",
                 "severity": 9,
                 "pathway": ["dob", "emails", "phones"]
@@ -58,11 +60,13 @@ class CorrelationResponse(BaseModel):
             "example": {
                 "inferred_risks": [
                     {
+                        "rule_id": "PERSONAL_IDENTITY_RISK",
                         "risk_type": "Personal Identity Exposure",
                         "severity": 9,
                         "pathway": ["dob", "emails", "phones"]
                     },
                     {
+                        "rule_id": "GOVERNMENT_ID_RISK",
                         "risk_type": "Government ID Reconstruction Risk",
                         "severity": 9,
                         "pathway": ["dob", "phones", "location"]
@@ -3,7 +3,7 @@ Heatmap visualization schema.
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 class ScoreBreakdownInput(BaseModel):
@@ -134,6 +134,10 @@ class HeatmapResponse(BaseModel):
     risk_category_breakdown: List[RiskCategoryBreakdown]
     heatmap: List[DataTypeHeatmap]
     graph_data: GraphData
+    breakdown_hash: Optional[str] = Field(
+        None,
+        description="Hash of the canonicalized score breakdown; use with GET /risk-heatmap/{breakdown_hash}"
+    )
     
     class Config:
         json_schema_extra = {
@@ -183,3 +187,89 @@ class HeatmapResponse(BaseModel):
                 }
             }
         }
+
+
+class HeatmapAggregateRequest(BaseModel):
+    """Request model for population heatmap aggregation."""
+    
+    analysis_ids: List[str] = Field(
+        default=[],
+        description="Analysis ids of completed background jobs to aggregate"
+    )
+    results: List[Dict[str, Any]] = Field(
+        default=[],
+        description="Stored analysis results (analyze response shape) or score breakdowns (score_breakdown shape)"
+    )
+    top_n: int = Field(
+        10,
+        ge=1,
+        le=100,
+        description="Number of data types to return in top_data_types"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "analysis_ids": ["550e8400-e29b-41d4-a716-446655440000"],
+                "results": [
+                    {
+                        "total_risk_score": 72,
+                        "components": {"pii_exposure": 20, "correlation_score": 15},
+                        "data_type_contributions": {"email": 18, "dob": 16}
+                    }
+                ],
+                "top_n": 5
+            }
+        }
+
+
+class ScoreStats(BaseModel):
+    """Mean, min and max of a score."""
+    
+    mean: float
+    min: float
+    max: float
+
+
+class HistogramBin(BaseModel):
+    """Histogram bin; bin_end is None for the open-ended last bin."""
+    
+    bin_start: float
+    bin_end: Optional[float]
+    count: int
+
+
+class ComponentStats(BaseModel):
+    """Aggregate statistics for one risk component."""
+    
+    component: str
+    count: int
+    mean: float
+    min: float
+    max: float
+    severity_counts: Dict[str, int]
+    histogram: List[HistogramBin]
+
+
+class DataTypeAggregate(BaseModel):
+    """Aggregate contribution of one data type."""
+    
+    data_type: str
+    total_contribution: float
+    mean_contribution: float
+    occurrences: int
+    prevalence: float
+    severity: str
+
+
+class HeatmapAggregateResponse(BaseModel):
+    """Response model for population heatmap aggregation."""
+    
+    analysis_count: int
+    missing_analysis_ids: List[str]
+    skipped_result_indexes: List[int]
+    total_score: ScoreStats
+    risk_level_distribution: Dict[str, int]
+    severity_distribution: SeverityDistribution
+    component_stats: List[ComponentStats]
+    top_data_types: List[DataTypeAggregate]
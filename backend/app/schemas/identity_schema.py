@@ -0,0 +1,75 @@
+"""
+Schemas for the cross-document identity index.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class IdentityDocumentRequest(BaseModel):
+    """Schema for indexing one document's entities."""
+    entities: dict = Field(...)
+    document_id: Optional[str] = None
+    include_exposure: bool = True
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "document_id": "resume-2026",
+                "entities": {
+                    "emails": ["john@example.com"],
+                    "phones": ["9876543210"],
+                    "company": ["Amazon"],
+                    "job_title": ["engineer"],
+                    "location": ["Bangalore"]
+                }
+            }
+        }
+
+
+class SharedIdentityKey(BaseModel):
+    """Schema for an identity key held by several linked documents."""
+    kind: str
+    value: str
+    documents: int
+
+
+class IdentityExposure(BaseModel):
+    """Schema for the risk assessment of an identity's merged entities."""
+    entities: Dict[str, Any]
+    risk_score: float
+    risk_level: str
+    score_breakdown: Dict[str, float]
+    inferred_risks: List[Dict[str, Any]]
+    correlation_depth: float
+    timeline_years: float
+    visibility_score: float
+
+
+class IdentityResponse(BaseModel):
+    """Schema for the identity containing a document."""
+    document_id: str
+    documents: List[str]
+    shared_keys: List[SharedIdentityKey]
+    exposure: Optional[IdentityExposure] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "document_id": "bio-2026",
+                "documents": ["resume-2026", "bio-2026"],
+                "shared_keys": [
+                    {"kind": "email", "value": "john@example.com", "documents": 2}
+                ],
+                "exposure": {
+                    "entities": {"emails": ["john@example.com"], "dob": ["15/06/1995"]},
+                    "risk_score": 81.0,
+                    "risk_level": "High",
+                    "score_breakdown": {"pii_exposure": 25.0},
+                    "inferred_risks": [{"risk_type": "Identity Theft Risk"}],
+                    "correlation_depth": 6.0,
+                    "timeline_years": 11,
+                    "visibility_score": 7.5
+                }
+            }
+        }
@@ -0,0 +1,97 @@
+"""
+Background job schema.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Any, Optional
+
+
+class TextAnalysisJobRequest(BaseModel):
+    """Request model for submitting a text analysis job."""
+    
+    content: str = Field(
+        ...,
+        description="Text to analyze"
+    )
+    persona: Optional[str] = Field(
+        "professional_scammer",
+        description="Optional persona: 'script_kiddie', 'professional_scammer', 'corporate_spy'"
+    )
+    simulate_hardening: Optional[bool] = Field(
+        False,
+        description="Whether to simulate hardening impact"
+    )
+    fields_to_remove: Optional[List[str]] = Field(
+        None,
+        description="Fields to remove for hardening simulation"
+    )
+    profile: Optional[str] = Field(
+        None,
+        description="Optional analysis profile: 'full' (default) or 'fast'"
+    )
+    stages: Optional[List[str]] = Field(
+        None,
+        description="Optional explicit stage list, overrides profile"
+    )
+    lane: str = Field(
+        "interactive",
+        description="Priority lane: 'interactive' or 'bulk'"
+    )
+    callback_url: Optional[str] = Field(
+        None,
+        description="Optional local webhook URL that receives the finished job as JSON"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "content": "Email: john@company.com, Phone: 9876543210",
+                "persona": "professional_scammer",
+                "simulate_hardening": True,
+                "fields_to_remove": ["phones", "graduation_year"],
+                "lane": "bulk",
+                "callback_url": "http://localhost:9000/personashield-callback"
+            }
+        }
+
+
+class JobStatusResponse(BaseModel):
+    """Response model for job status."""
+    
+    job_id: str
+    kind: str
+    lane: str
+    status: str = Field(
+        ...,
+        description="queued, running, completed or failed"
+    )
+    queue_position: Optional[int] = Field(
+        None,
+        description="Number of jobs ahead of this one (queued jobs only)"
+    )
+    analysis_id: Optional[str] = None
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Full analysis result once completed"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f1c2a9e-8d4b-4c1e-9a55-0b7f2d6e4c11",
+                "kind": "analyze_text",
+                "lane": "interactive",
+                "status": "queued",
+                "queue_position": 2,
+                "analysis_id": None,
+                "created_at": 1771583400.0,
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "result": None
+            }
+        }
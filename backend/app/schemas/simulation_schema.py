@@ -3,7 +3,7 @@ Hardening simulation schema.
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 class HardeningSimulationRequest(BaseModel):
@@ -17,6 +17,16 @@ class HardeningSimulationRequest(BaseModel):
         default_factory=list,
         description="List of entity field names to remove/redact for simulation"
     )
+    scenarios: Optional[List[List[str]]] = Field(
+        default=None,
+        description="Alternative hardening scenarios to compare, each a list of field names to remove "
+                    "(remove_fields is ignored when given)"
+    )
+    explain: bool = Field(
+        default=False,
+        description="Wait for the LLM explanation (of the best scenario when comparing scenarios) instead of "
+                    "returning the templated one; it can also be fetched later by simulation_id"
+    )
     
     class Config:
         json_schema_extra = {
@@ -31,11 +41,22 @@ class HardeningSimulationRequest(BaseModel):
                     "skills": ["Python", "AWS"],
                     "years_of_experience": 8
                 },
-                "remove_fields": ["emails", "phones", "date_of_birth"]
+                "remove_fields": ["emails", "phones", "date_of_birth"],
+                "scenarios": [["emails"], ["phones", "date_of_birth"], ["emails", "phones", "date_of_birth"]],
+                "explain": False
             }
         }
 
 
+class HardeningScenarioResult(BaseModel):
+    """Risk score for one hardening scenario."""
+    
+    scenario: int = Field(..., ge=0, description="Index of the scenario in the request")
+    remove_fields: List[str] = Field(..., description="Fields removed in this scenario")
+    hardened_score: float = Field(..., ge=0, le=100, description="Risk score after removing the fields (0-100)")
+    difference: float = Field(..., ge=0, description="Risk reduction (original - hardened)")
+
+
 class HardeningSimulationResponse(BaseModel):
     """Response model for hardening simulation."""
     
@@ -58,7 +79,23 @@ class HardeningSimulationResponse(BaseModel):
     )
     explanation: str = Field(
         ...,
-        description="LLM-generated explanation of hardening impact (fallback available if LLM unavailable)"
+        description="Explanation of hardening impact: templated, or LLM-generated when explain is true"
+    )
+    explanation_source: str = Field(
+        default="template",
+        description="Where the explanation came from: template, llm or fallback (LLM unavailable)"
+    )
+    simulation_id: Optional[str] = Field(
+        default=None,
+        description="Id for fetching or streaming the LLM explanation later"
+    )
+    best_scenario: Optional[int] = Field(
+        default=None,
+        description="Index of the scenario with the largest risk reduction (scenario requests only)"
+    )
+    scenarios: Optional[List[HardeningScenarioResult]] = Field(
+        default=None,
+        description="Per-scenario results, in request order (scenario requests only)"
     )
     
     class Config:
@@ -67,7 +104,28 @@ class HardeningSimulationResponse(BaseModel):
                 "original_score": 75.5,
                 "hardened_score": 42.3,
                 "difference": 33.2,
+                "explanation_source": "llm",
+                "simulation_id": "3f9a1c0d52be47e8a1c6d2f0",
                 "explanation": "Removing phones and graduation year significantly reduces your risk because these fields are commonly used to target and verify your identity. Phone numbers are frequently used for account recovery and two-factor authentication, making them high-value targets for attackers. Graduation year combined with other personal data like email and location makes it easier to reconstruct sensitive information. Without these fields, social engineers find it harder to craft convincing phishing attempts or impersonate you."
             }
         }
 
+
+class HardeningExplanationResponse(BaseModel):
+    """Response model for a lazily generated hardening explanation."""
+    
+    simulation_id: str = Field(..., description="Simulation the explanation belongs to")
+    explanation: str = Field(..., description="LLM-generated explanation of hardening impact")
+    explanation_source: str = Field(
+        ...,
+        description="llm, or fallback if the LLM is unavailable (retried on the next request)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "simulation_id": "3f9a1c0d52be47e8a1c6d2f0",
+                "explanation": "Removing 'phones' significantly reduces your risk because phone numbers are frequently used for account recovery and two-factor authentication...",
+                "explanation_source": "llm"
+            }
+        }
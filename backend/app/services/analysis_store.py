@@ -0,0 +1,417 @@
+"""
+Indexed analysis store.
+Keeps analysis results in memory and answers org-wide exposure queries
+("everyone exposing a phone and a DOB", "who mentions company X with a
+High score") from indexes instead of scanning stored results.
+
+Each stored analysis is added to inverted indexes (posting sets of
+analysis ids) on exposed entity fields, normalized entity value tokens,
+matched correlation rule ids, attack vector categories and risk level,
+and to an index sorted by risk score. A query intersects the posting
+sets of its filters, smallest first, and orders the matches by score;
+queries without set filters read their page straight out of the sorted
+score index.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import re
+import threading
+
+from app.core.config import settings
+from app.services.entity_set import presence_of
+from app.services.presence_service import ENTITY_FIELDS
+
+
+QUERY_MAX_LIMIT = 100
+
+# Entity fields whose values are indexed (years_of_experience is a count)
+VALUE_FIELDS = tuple(field for field in ENTITY_FIELDS if field != "years_of_experience")
+
+
+def normalize_entity_value(field: str, value: Any) -> str:
+    """
+    Normalize an entity value for indexing and lookup.
+
+    Phone numbers keep only their digits; other values are case-folded
+    with whitespace collapsed.
+    """
+    if field == "phones":
+        return re.sub(r"\D", "", str(value))
+    return " ".join(str(value).casefold().split())
+
+
+def _section(result: Dict[str, Any], key: str) -> Dict[str, Any]:
+    section = result.get(key) or {}
+    if not isinstance(section, dict):
+        raise ValueError(f"'{key}' must be an object")
+    return section
+
+
+def _check_string(value: Any, name: str) -> None:
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"'{name}' must be a string")
+
+
+def _check_items(section: Dict[str, Any], key: str, item_key: str) -> None:
+    items = section.get(key) or []
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"'{key}' must be a list of objects")
+    for item in items:
+        _check_string(item.get(item_key), item_key)
+
+
+def validate_analysis(result: Dict[str, Any]) -> None:
+    """
+    Check that an analysis result can be stored and queried.
+
+    Raises:
+        ValueError: If the analysis_id is not a non-empty string, the risk
+            score is not a number, an entity field is not a list, or a
+            rule id, category, risk level, timestamp or doc_id is not a
+            string
+    """
+    analysis_id = result.get("analysis_id")
+    if not analysis_id or not isinstance(analysis_id, str):
+        raise ValueError("Analysis result must have a string analysis_id")
+
+    risk_assessment = _section(result, "risk_assessment")
+    risk_score = risk_assessment.get("risk_score")
+    if isinstance(risk_score, bool) or not isinstance(risk_score, (int, float)):
+        raise ValueError("'risk_score' must be a number")
+    _check_string(risk_assessment.get("risk_level"), "risk_level")
+    _check_items(risk_assessment, "inferred_risks", "rule_id")
+    _check_items(_section(result, "attack_analysis"), "attack_vectors", "category")
+
+    entities = _section(result, "entities")
+    for field in VALUE_FIELDS:
+        if not isinstance(entities.get(field) or [], (list, tuple)):
+            raise ValueError(f"Entity field '{field}' must be a list")
+
+    _check_string(_section(result, "input_summary").get("timestamp"), "timestamp")
+    _check_string(result.get("doc_id"), "doc_id")
+
+
+def _index_keys(result: Dict[str, Any]) -> List[Tuple[str, ...]]:
+    """Inverted index keys of one analysis result."""
+    entities = result.get("entities") or {}
+    risk_assessment = result.get("risk_assessment") or {}
+    attack_analysis = result.get("attack_analysis") or {}
+
+    keys = {("field", field) for field in presence_of(entities).present_fields()} if entities else set()
+    for field in VALUE_FIELDS:
+        for value in entities.get(field) or ():
+            for token in normalize_entity_value(field, value).split():
+                keys.add(("entity", field, token))
+    for risk in risk_assessment.get("inferred_risks") or ():
+        if risk.get("rule_id"):
+            keys.add(("rule_id", risk["rule_id"]))
+    for vector in attack_analysis.get("attack_vectors") or ():
+        if vector.get("category"):
+            keys.add(("category", vector["category"]))
+    if risk_assessment.get("risk_level"):
+        keys.add(("risk_level", risk_assessment["risk_level"]))
+    return sorted(keys)
+
+
+def summarize_analysis(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Query result row for a stored analysis."""
+    risk_assessment = result.get("risk_assessment") or {}
+    attack_analysis = result.get("attack_analysis") or {}
+    summary = {
+        "analysis_id": result.get("analysis_id"),
+        "risk_score": risk_assessment.get("risk_score", 0.0),
+        "risk_level": risk_assessment.get("risk_level"),
+        "rule_ids": [risk["rule_id"] for risk in risk_assessment.get("inferred_risks") or () if risk.get("rule_id")],
+        "attack_vector_categories": list(dict.fromkeys(
+            vector["category"] for vector in attack_analysis.get("attack_vectors") or () if vector.get("category")
+        )),
+        "entities": result.get("entities") or {},
+        "timestamp": (result.get("input_summary") or {}).get("timestamp")
+    }
+    if result.get("doc_id"):
+        summary["doc_id"] = result["doc_id"]
+    return summary
+
+
+class AnalysisStore:
+    """
+    In-process store of analysis results with query indexes.
+
+    Holds at most `max_analyses` results; the oldest result is dropped
+    when the store is full. Stored results are shared with callers and
+    must be treated as read-only. Thread-safe.
+    """
+
+    def __init__(self, max_analyses: int = 100000):
+        self.max_analyses = max(1, max_analyses)
+        self._lock = threading.Lock()
+        # analysis id -> (result, index keys, score index entry), oldest first
+        self._analyses: "OrderedDict[str, Tuple[Dict[str, Any], List[Tuple[str, ...]], Tuple[float, int, str]]]" = OrderedDict()
+        # index key -> analysis ids
+        self._postings: Dict[Tuple[str, ...], Set[str]] = {}
+        # (risk_score, sequence, analysis id), ascending
+        self._scores: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._counters = {"stored": 0, "evicted": 0, "queries": 0, "indexed_queries": 0}
+
+    def add(self, result: Dict[str, Any]) -> str:
+        """
+        Store and index an analysis result.
+
+        Storing an analysis id again replaces the earlier result.
+
+        Args:
+            result: Result shaped like run_comprehensive_analysis
+
+        Returns:
+            The analysis id
+
+        Raises:
+            ValueError: If the result is malformed (see validate_analysis)
+        """
+        validate_analysis(result)
+        analysis_id = result["analysis_id"]
+        keys = _index_keys(result)
+        score = float(result["risk_assessment"]["risk_score"])
+
+        with self._lock:
+            if analysis_id in self._analyses:
+                self._remove(analysis_id)
+            while len(self._analyses) >= self.max_analyses:
+                self._remove(next(iter(self._analyses)))
+                self._counters["evicted"] += 1
+
+            self._sequence += 1
+            entry = (score, self._sequence, analysis_id)
+            self._analyses[analysis_id] = (result, keys, entry)
+            for key in keys:
+                self._postings.setdefault(key, set()).add(analysis_id)
+            insort(self._scores, entry)
+            self._counters["stored"] += 1
+        return analysis_id
+
+    def _remove(self, analysis_id: str) -> None:
+        _, keys, entry = self._analyses.pop(analysis_id)
+        for key in keys:
+            posting = self._postings[key]
+            posting.discard(analysis_id)
+            if not posting:
+                del self._postings[key]
+        del self._scores[bisect_left(self._scores, entry)]
+
+    def remove(self, analysis_id: str) -> bool:
+        """Remove an analysis; returns False if it was not stored."""
+        with self._lock:
+            if analysis_id not in self._analyses:
+                return False
+            self._remove(analysis_id)
+            return True
+
+    def get(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Return a stored analysis result, or None."""
+        with self._lock:
+            stored = self._analyses.get(analysis_id)
+            return stored[0] if stored else None
+
+    def query(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        entities: Optional[Iterable[Tuple[str, str]]] = None,
+        rule_ids: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        risk_levels: Optional[Iterable[str]] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        order: str = "desc",
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Find stored analyses matching every given filter.
+
+        Args:
+            fields: Entity fields that must be exposed (e.g. "phones")
+            entities: (field, value) pairs; an analysis matches when one
+                of its values of that field contains every token of value
+                (after normalize_entity_value)
+            rule_ids: Correlation rule ids that must all have matched
+            categories: Attack vector categories that must all be present
+            risk_levels: Accepted risk levels (any of)
+            min_score: Minimum risk score (inclusive)
+            max_score: Maximum risk score (inclusive)
+            order: "desc" (highest score first) or "asc"
+            limit: Page size (1 to QUERY_MAX_LIMIT)
+            offset: Number of matches to skip
+
+        Returns:
+            Dictionary with total (number of matches), offset, limit and
+            results (summaries of the requested page, see
+            summarize_analysis)
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        if order not in ("desc", "asc"):
+            raise ValueError("order must be 'desc' or 'asc'")
+        if not 1 <= limit <= QUERY_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {QUERY_MAX_LIMIT}")
+        if offset < 0:
+            raise ValueError("offset cannot be negative")
+        unknown = [field for field in list(fields or []) if field not in ENTITY_FIELDS]
+        unknown += [field for field, _ in list(entities or []) if field not in VALUE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown entity fields: {', '.join(unknown)}")
+
+        # Every filter except risk level and score requires all its keys
+        required = [("field", field) for field in fields or ()]
+        entity_tokens = [
+            (field, normalize_entity_value(field, value).split())
+            for field, value in entities or ()
+        ]
+        if any(not tokens for _, tokens in entity_tokens):
+            raise ValueError("Entity values cannot be empty")
+        required += [("entity", field, token) for field, tokens in entity_tokens for token in tokens]
+        # Tokens may come from different values of a field; multi-token
+        # values are checked against the matched analyses only
+        phrases = [(field, set(tokens)) for field, tokens in entity_tokens if len(tokens) > 1]
+        required += [("rule_id", rule_id) for rule_id in rule_ids or ()]
+        required += [("category", category) for category in categories or ()]
+        levels = list(dict.fromkeys(risk_levels or ()))
+
+        low = float("-inf") if min_score is None else float(min_score)
+        high = float("inf") if max_score is None else float(max_score)
+
+        with self._lock:
+            self._counters["queries"] += 1
+            start = bisect_left(self._scores, (low,))
+            end = bisect_right(self._scores, (high, float("inf")))
+
+            if not required and not levels:
+                # Page straight out of the sorted score index
+                total = max(0, end - start)
+                if order == "desc":
+                    page = self._scores[max(start, end - offset - limit):max(start, end - offset)][::-1]
+                else:
+                    page = self._scores[start + offset:min(end, start + offset + limit)]
+            else:
+                self._counters["indexed_queries"] += 1
+                matches = self._match(required, levels)
+                if phrases:
+                    matches = {
+                        analysis_id for analysis_id in matches
+                        if self._has_values(self._analyses[analysis_id][0], phrases)
+                    }
+                entries = [self._analyses[analysis_id][2] for analysis_id in matches]
+                if min_score is not None or max_score is not None:
+                    entries = [entry for entry in entries if low <= entry[0] <= high]
+                entries.sort(reverse=order == "desc")
+                total = len(entries)
+                page = entries[offset:offset + limit]
+
+            results = [summarize_analysis(self._analyses[entry[2]][0]) for entry in page]
+
+        return {"total": total, "offset": offset, "limit": limit, "results": results}
+
+    def _match(self, required: List[Tuple[str, ...]], levels: List[str]) -> Set[str]:
+        """Intersect posting sets, smallest first."""
+        postings = []
+        for key in required:
+            posting = self._postings.get(key)
+            if not posting:
+                return set()
+            postings.append(posting)
+        if levels:
+            level_matches = set()
+            for level in levels:
+                level_matches |= self._postings.get(("risk_level", level), set())
+            if not level_matches:
+                return set()
+            postings.append(level_matches)
+
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches &= posting
+            if not matches:
+                break
+        return matches
+
+    @staticmethod
+    def _has_values(result: Dict[str, Any], phrases: List[Tuple[str, Set[str]]]) -> bool:
+        """Whether each (field, tokens) pair is covered by one value of the field."""
+        entities = result.get("entities") or {}
+        return all(
+            any(tokens <= set(normalize_entity_value(field, value).split()) for value in entities.get(field) or ())
+            for field, tokens in phrases
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus stored analyses and index keys."""
+        with self._lock:
+            return {
+                **self._counters,
+                "analyses": len(self._analyses),
+                "index_keys": len(self._postings),
+                "max_analyses": self.max_analyses
+            }
+
+
+_analysis_store = AnalysisStore(settings.ANALYSIS_STORE_MAX_ANALYSES)
+
+
+def get_analysis_store() -> AnalysisStore:
+    """Return the process-wide analysis store."""
+    return _analysis_store
+
+
+def _is_failed_analysis(result: Dict[str, Any]) -> bool:
+    risk_assessment = result.get("risk_assessment")
+    return isinstance(risk_assessment, dict) and risk_assessment.get("risk_level") == "Unknown"
+
+
+def store_analysis(result: Dict[str, Any]) -> bool:
+    """
+    Store an analysis result if it is a real analysis.
+
+    Fallback results of failed analyses (risk level "Unknown") are not
+    stored.
+
+    Returns:
+        True if the result was stored
+
+    Raises:
+        ValueError: If the result is malformed (see validate_analysis)
+    """
+    if _is_failed_analysis(result):
+        return False
+    _analysis_store.add(result)
+    return True
+
+
+def store_analysis_batch(results: List[Dict[str, Any]]) -> int:
+    """
+    Store several analysis results, all or none.
+
+    Every result is validated before any is stored, so a malformed result
+    leaves the store unchanged. Fallback results of failed analyses are
+    skipped.
+
+    Returns:
+        Number of results stored
+
+    Raises:
+        ValueError: If a result is malformed (see validate_analysis)
+    """
+    results = [result for result in results if not _is_failed_analysis(result)]
+    for result in results:
+        validate_analysis(result)
+    for result in results:
+        _analysis_store.add(result)
+    return len(results)
+
+
+def get_analysis_store_stats() -> Dict[str, int]:
+    """Return analysis store counters and sizes."""
+    return _analysis_store.stats()
@@ -3,7 +3,11 @@ Master analysis orchestrator service.
 Orchestrates all analysis phases into a single comprehensive pipeline.
 """
 
+from collections.abc import Mapping
 from typing import Dict, List, Any, Optional
+import copy
+import hashlib
+import json
 import uuid
 from datetime import datetime
 
@@ -12,15 +16,432 @@ from app.services.ingestion_service import normalize_text, extract_text_from_pdf
 from app.services.extraction_service import extract_entities
 from app.services.correlation_engine import apply_correlation_rules
 from app.services.correlation_depth_service import calculate_correlation_depth
-from app.services.timeline_service import calculate_timeline_exposure
+from app.services.timeline_service import estimate_exposure_years
 from app.services.visibility_service import calculate_visibility
 from app.services.scoring_engine import calculate_risk_score
 from app.services.attack_vector_service import categorize_attack_vectors
+from app.services.contribution_service import calculate_field_contributions
+from app.services.presence_service import EntityPresence
+from app.services.entity_set import EntitySet, presence_of
 from app.services.persona_service import generate_persona_narrative
 from app.services.phishing_service import generate_phishing_email
 from app.services.explanation_service import generate_risk_explanation
+from app.services.combined_llm_service import generate_combined_outputs
 from app.services.simulation_service import run_hardening_simulation
 from app.services.heatmap_service import generate_heatmap
+from app.services.pipeline_executor import Stage, PipelineExecutor
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
+
+
+# Pipeline outputs each optional stage contributes to the response
+STAGE_OUTPUTS = {
+    "score": ["risk_score", "risk_level", "score_breakdown", "inferred_risks",
+              "correlation_depth", "timeline_years", "visibility_score", "field_contributions"],
+    "vectors": ["attack_vectors"],
+    "persona": ["persona_narrative"],
+    "phishing": ["phishing"],
+    "explanation": ["explanation_text"],
+    "hardening": ["hardening_result"],
+    "heatmap": ["visualization"]
+}
+
+# Optional stages that can be requested individually.
+# Ingestion, extraction, correlation, depth, timeline and visibility always
+# run because every stage below depends on them.
+ANALYSIS_STAGES = ["score", "vectors", "persona", "phishing", "explanation", "hardening", "heatmap"]
+
+# Stages each optional stage needs before it can run
+STAGE_DEPENDENCIES = {
+    "score": [],
+    "vectors": [],
+    "persona": ["score", "vectors"],
+    "phishing": [],
+    "explanation": ["score"],
+    "hardening": [],
+    "heatmap": ["score"]
+}
+
+# Named analysis profiles
+ANALYSIS_PROFILES = {
+    "full": ANALYSIS_STAGES,
+    "fast": ["score", "vectors"]
+}
+
+DEFAULT_PROFILE = "full"
+
+# Stages that call the LLM; combined mode merges them into a single LLM call
+LLM_STAGES = ["persona", "phishing", "explanation"]
+COMBINED_LLM_STAGES = LLM_STAGES
+
+
+def resolve_analysis_stages(
+    profile: Optional[str] = None,
+    stages: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Resolve the set of stages to run from a profile name and/or stage list.
+    
+    Explicit stages take precedence over the profile. Dependencies of the
+    requested stages are added, and "score" is always included so the
+    response keeps a valid risk_assessment.
+    
+    Args:
+        profile: Name of a profile in ANALYSIS_PROFILES (default 'full')
+        stages: Explicit list of stage names from ANALYSIS_STAGES
+    
+    Returns:
+        Stage names in canonical pipeline order
+    
+    Raises:
+        ValueError: If the profile or any stage name is unknown
+    """
+    if stages:
+        requested = stages
+    else:
+        profile_name = profile or DEFAULT_PROFILE
+        if profile_name not in ANALYSIS_PROFILES:
+            raise ValueError(
+                f"profile must be one of: {', '.join(ANALYSIS_PROFILES.keys())}"
+            )
+        requested = ANALYSIS_PROFILES[profile_name]
+    
+    unknown = [stage for stage in requested if stage not in STAGE_DEPENDENCIES]
+    if unknown:
+        raise ValueError(
+            f"Unknown stages: {', '.join(unknown)}. "
+            f"Valid stages: {', '.join(ANALYSIS_STAGES)}"
+        )
+    
+    # Add dependencies (the graph is shallow, one pass per requested stage is enough)
+    selected = {"score"}
+    for stage in requested:
+        selected.add(stage)
+        selected.update(STAGE_DEPENDENCIES[stage])
+    
+    return [stage for stage in ANALYSIS_STAGES if stage in selected]
+
+
+def _normalize_stage(input_type: str, content: Optional[str], file_bytes: Optional[bytes]) -> str:
+    """Normalize text input or extract text from PDF bytes."""
+    if input_type == "text":
+        return normalize_text(content)
+    elif input_type == "pdf":
+        return extract_text_from_pdf(file_bytes)
+    raise ValueError(f"Invalid input_type: {input_type}")
+
+
+def _extract_stage(normalized_text: str) -> EntitySet:
+    """Extract entities from normalized text into a shared EntitySet."""
+    return EntitySet.from_dict(extract_entities(normalized_text))
+
+
+def _presence_stage(entities: Dict[str, Any]) -> EntityPresence:
+    """Compute the shared entity presence vector."""
+    return presence_of(entities)
+
+
+def _correlation_stage(entities: Dict[str, Any], presence: EntityPresence) -> List[Dict[str, Any]]:
+    """Apply correlation rules and return inferred risks."""
+    correlation_result = apply_correlation_rules(entities, presence=presence)
+    return correlation_result.get("inferred_risks", [])
+
+
+def _depth_stage(inferred_risks: List[Dict[str, Any]]) -> float:
+    """Compute correlation depth score from inferred risks."""
+    correlation_depth_result = calculate_correlation_depth(inferred_risks)
+    return correlation_depth_result.get("correlation_depth_score", 0)
+
+
+def _timeline_stage(entities: Dict[str, Any]) -> int:
+    """Compute estimated exposure years from graduation year and experience."""
+    return estimate_exposure_years(entities)
+
+
+def _visibility_stage(entities: Dict[str, Any], presence: EntityPresence) -> float:
+    """Compute visibility score from entities."""
+    visibility_result = calculate_visibility(entities, presence=presence)
+    return visibility_result.get("visibility_score", 0)
+
+
+def _score_stage(
+    entities: Dict[str, Any],
+    presence: EntityPresence,
+    inferred_risks: List[Dict[str, Any]],
+    correlation_depth: float,
+    timeline_years: int,
+    visibility_score: float
+) -> Dict[str, Any]:
+    """Compute the weighted risk score."""
+    score_result = calculate_risk_score(
+        entities=entities,
+        inferred_risks=inferred_risks,
+        correlation_depth=correlation_depth,
+        timeline_years=timeline_years,
+        visibility_score=visibility_score,
+        presence=presence
+    )
+    return {
+        "risk_score": score_result.get("risk_score", 0),
+        "risk_level": score_result.get("risk_level", "Unknown"),
+        "score_breakdown": score_result.get("score_breakdown", {})
+    }
+
+
+def _contributions_stage(entities: Dict[str, Any], presence: EntityPresence) -> List[Dict[str, Any]]:
+    """Attribute the risk score to individual fields (Shapley values)."""
+    contribution_result = calculate_field_contributions(entities, presence=presence)
+    return contribution_result.get("contributions", [])
+
+
+def _vectors_stage(
+    entities: Dict[str, Any],
+    presence: EntityPresence,
+    inferred_risks: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Categorize attack vectors."""
+    attack_vector_result = categorize_attack_vectors(entities, inferred_risks, presence=presence)
+    return attack_vector_result.get("attack_vectors", [])
+
+
+def _persona_stage(
+    persona: Optional[str],
+    entities: Dict[str, Any],
+    attack_vectors: List[Dict[str, Any]],
+    risk_score: float
+) -> str:
+    """Generate persona narrative (empty when no persona requested)."""
+    if not persona:
+        return ""
+    persona_result = generate_persona_narrative(
+        persona=persona,
+        analysis_summary={
+            "entities": entities,
+            "attack_vectors": attack_vectors,
+            "risk_score": risk_score
+        }
+    )
+    return persona_result.get("narrative", "")
+
+
+def _phishing_stage(entities: Dict[str, Any]) -> Dict[str, str]:
+    """Generate phishing simulation."""
+    phishing_result = generate_phishing_email(entities)
+    return {
+        "email_subject": phishing_result.get("email_subject", ""),
+        "email_body": phishing_result.get("email_body", ""),
+        "disclaimer": phishing_result.get("disclaimer", "")
+    }
+
+
+def _explanation_stage(
+    risk_score: float,
+    score_breakdown: Dict[str, Any],
+    inferred_risks: List[Dict[str, Any]]
+) -> str:
+    """Generate risk explanation."""
+    return generate_risk_explanation(
+        risk_score=risk_score,
+        score_breakdown=score_breakdown,
+        inferred_risks=inferred_risks
+    )
+
+
+def _combined_llm_stage(
+    llm_sections: List[str],
+    persona: Optional[str],
+    entities: Dict[str, Any],
+    attack_vectors: List[Dict[str, Any]],
+    risk_score: float,
+    score_breakdown: Dict[str, Any],
+    inferred_risks: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Generate the requested LLM sections with one combined call."""
+    return generate_combined_outputs(
+        sections=llm_sections,
+        persona=persona,
+        entities=entities,
+        attack_vectors=attack_vectors,
+        risk_score=risk_score,
+        score_breakdown=score_breakdown,
+        inferred_risks=inferred_risks
+    )
+
+
+def _hardening_stage(
+    entities: Dict[str, Any],
+    simulate_hardening: bool,
+    fields_to_remove: Optional[List[str]],
+    risk_score: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Run hardening simulation, reusing the already computed original score.
+    
+    Returns the templated explanation; the LLM one can be fetched later by
+    simulation_id.
+    """
+    if not simulate_hardening:
+        return None
+    
+    # Default fields if not provided
+    fields_to_simulate = fields_to_remove if fields_to_remove else ["phones", "email", "graduation_year", "location"]
+    hardening_data = run_hardening_simulation(
+        entities,
+        fields_to_simulate,
+        original_score=risk_score
+    )
+    
+    # Safe construction with defensive defaults
+    if not hardening_data:
+        return None
+    return {
+        "original_score": hardening_data.get("original_score"),
+        "hardened_score": hardening_data.get("hardened_score"),
+        "difference": hardening_data.get("difference"),
+        "explanation": hardening_data.get(
+            "explanation",
+            "Reducing exposed personal attributes lowers correlation risk and decreases attack surface."
+        ),
+        "explanation_source": hardening_data.get("explanation_source"),
+        "simulation_id": hardening_data.get("simulation_id")
+    }
+
+
+def _heatmap_stage(
+    entities: Dict[str, Any],
+    risk_score: float,
+    score_breakdown: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Generate heatmap visualization data."""
+    # Calculate data type contributions from entities
+    data_type_contributions = {}
+    for entity_type, values in entities.items():
+        count = 0
+        if isinstance(values, (list, tuple)):
+            count = len([v for v in values if v])
+        elif values:
+            count = 1
+        
+        if entity_type in ["emails", "email_addresses", "email"]:
+            data_type_contributions["email"] = count * 6
+        elif entity_type in ["phones", "phone_numbers", "phone"]:
+            data_type_contributions["phone"] = count * 6
+        elif entity_type in ["dob", "date_of_birth"]:
+            data_type_contributions["dob"] = count * 8
+        elif entity_type in ["companies", "company_names", "company"]:
+            data_type_contributions["company"] = count * 5
+        elif entity_type in ["locations", "cities", "cities_lived", "location"]:
+            data_type_contributions["location"] = count * 4
+    
+    # Construct heatmap payload
+    heatmap_input = {
+        "total_risk_score": risk_score,
+        "components": score_breakdown,
+        "data_type_contributions": data_type_contributions
+    }
+    
+    heatmap_data = generate_heatmap(heatmap_input)
+    return {
+        "summary": heatmap_data.get("summary"),
+        "severity_distribution": heatmap_data.get("severity_distribution"),
+        "risk_category_breakdown": heatmap_data.get("risk_category_breakdown"),
+        "heatmap": heatmap_data.get("heatmap"),
+        "graph_data": heatmap_data.get("graph_data")
+    }
+
+
+# Coalesces concurrent identical analyses
+_analysis_flight = SingleFlight("analysis")
+
+
+# Analysis pipeline as a DAG. Timeline, visibility and correlation only
+# depend on entities, and the LLM stages only depend on scoring outputs,
+# so the executor runs them concurrently.
+ANALYSIS_PIPELINE = PipelineExecutor([
+    Stage("normalize", _normalize_stage,
+          inputs=["input_type", "content", "file_bytes"], outputs=["normalized_text"],
+          description="Normalizing input"),
+    Stage("extract", _extract_stage,
+          inputs=["normalized_text"], outputs=["entities"],
+          description="Extracting entities"),
+    Stage("presence", _presence_stage,
+          inputs=["entities"], outputs=["presence"],
+          description="Computing entity presence"),
+    Stage("correlation", _correlation_stage,
+          inputs=["entities", "presence"], outputs=["inferred_risks"],
+          description="Correlating risks"),
+    Stage("depth", _depth_stage,
+          inputs=["inferred_risks"], outputs=["correlation_depth"],
+          description="Computing correlation depth"),
+    Stage("timeline", _timeline_stage,
+          inputs=["entities"], outputs=["timeline_years"],
+          description="Computing timeline exposure"),
+    Stage("visibility", _visibility_stage,
+          inputs=["entities", "presence"], outputs=["visibility_score"],
+          description="Computing visibility score"),
+    Stage("score", _score_stage,
+          inputs=["entities", "presence", "inferred_risks", "correlation_depth", "timeline_years",
+                  "visibility_score"],
+          outputs=["risk_score", "risk_level", "score_breakdown"],
+          description="Computing risk score"),
+    Stage("contributions", _contributions_stage,
+          inputs=["entities", "presence"], outputs=["field_contributions"],
+          description="Computing field contributions",
+          safe_fail=True, defaults={"field_contributions": []}),
+    Stage("vectors", _vectors_stage,
+          inputs=["entities", "presence", "inferred_risks"], outputs=["attack_vectors"],
+          description="Categorizing attack vectors"),
+    Stage("persona", _persona_stage,
+          inputs=["persona", "entities", "attack_vectors", "risk_score"], outputs=["persona_narrative"],
+          description="Generating persona narrative",
+          timeout=settings.LLM_STAGE_TIMEOUT, safe_fail=True, defaults={"persona_narrative": ""}),
+    Stage("phishing", _phishing_stage,
+          inputs=["entities"], outputs=["phishing"],
+          description="Generating phishing simulation",
+          timeout=settings.LLM_STAGE_TIMEOUT, safe_fail=True),
+    Stage("explanation", _explanation_stage,
+          inputs=["risk_score", "score_breakdown", "inferred_risks"], outputs=["explanation_text"],
+          description="Generating explanation",
+          timeout=settings.LLM_STAGE_TIMEOUT, safe_fail=True, defaults={"explanation_text": ""}),
+    Stage("combined_llm", _combined_llm_stage,
+          inputs=["llm_sections", "persona", "entities", "attack_vectors", "risk_score", "score_breakdown",
+                  "inferred_risks"],
+          outputs=["llm_outputs"],
+          description="Generating combined LLM sections",
+          timeout=settings.LLM_STAGE_TIMEOUT, safe_fail=True, defaults={"llm_outputs": {}}),
+    Stage("hardening", _hardening_stage,
+          inputs=["entities", "simulate_hardening", "fields_to_remove", "risk_score"], outputs=["hardening_result"],
+          description="Running hardening simulation",
+          safe_fail=True),
+    Stage("heatmap", _heatmap_stage,
+          inputs=["entities", "risk_score", "score_breakdown"], outputs=["visualization"],
+          description="Generating heatmap",
+          safe_fail=True),
+], max_workers=settings.PIPELINE_MAX_WORKERS)
+
+
+def run_analysis_pipeline(
+    inputs: Dict[str, Any],
+    outputs: List[str],
+    timeouts: Optional[Dict[str, float]] = None,
+    log_prefix: str = ""
+) -> Dict[str, Any]:
+    """
+    Run only the pipeline stages needed for the requested outputs.
+    
+    Intermediate results supplied in `inputs` (e.g. precomputed `entities`
+    or `inferred_risks`) are reused instead of recomputed.
+    
+    Args:
+        inputs: Initial values, e.g. input_type/content/file_bytes or entities
+        outputs: Any subset of pipeline output names
+        timeouts: Optional per-stage timeout overrides in seconds
+        log_prefix: Prefix for progress log lines
+    
+    Returns:
+        Dictionary with inputs and all computed outputs
+    """
+    return ANALYSIS_PIPELINE.run(inputs, outputs, timeouts=timeouts, log_prefix=log_prefix)
 
 
 def run_comprehensive_analysis(
@@ -29,25 +450,36 @@ def run_comprehensive_analysis(
     file_bytes: Optional[bytes] = None,
     persona: Optional[str] = None,
     simulate_hardening: bool = False,
-    fields_to_remove: Optional[List[str]] = None
+    fields_to_remove: Optional[List[str]] = None,
+    profile: Optional[str] = None,
+    stages: Optional[List[str]] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+    combined_llm: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Run comprehensive analysis pipeline on input data.
     
-    Pipeline steps:
+    Pipeline stages (see ANALYSIS_PIPELINE):
     1. Normalize input (ingestion_service)
-    2. Extract entities (extraction_service)
+    2. Extract entities and presence vector (extraction_service, presence_service)
     3. Correlate risks (correlation_engine)
     4. Compute correlation depth (correlation_depth_service)
     5. Compute timeline (timeline_service)
     6. Compute visibility (visibility_service)
-    7. Compute risk score (scoring_engine)
+    7. Compute risk score and per-field contributions (scoring_engine,
+       contribution_service)
     8. Categorize attack vectors (attack_vector_service)
     9. Persona narrative (persona_service) - safe fail
     10. Phishing simulation (phishing_service) - safe fail
     11. Explanation (explanation_service) - safe fail
-    12. Optional hardening simulation (simulation_service)
-    13. Generate heatmap (heatmap_service)
+    12. Optional hardening simulation (simulation_service) - safe fail
+    13. Generate heatmap (heatmap_service) - safe fail
+    
+    Independent stages run concurrently. Steps 7-13 can be pruned with an
+    analysis profile or explicit stage list (see ANALYSIS_STAGES). The
+    "fast" profile runs only scoring and attack vectors, skipping all LLM
+    and heatmap work. In combined LLM mode, steps 9-11 share one LLM call
+    (combined_llm_service) when more than one of them is requested.
     
     Args:
         input_type: 'text' or 'pdf'
@@ -56,188 +488,224 @@ def run_comprehensive_analysis(
         persona: Optional persona for simulation
         simulate_hardening: Whether to run hardening simulation
         fields_to_remove: Fields to remove for hardening
+        profile: Optional analysis profile name ('full' or 'fast')
+        stages: Optional explicit stage list, overrides profile
+        stage_timeouts: Optional per-stage timeout overrides in seconds
+        combined_llm: Use one combined LLM call for persona, phishing and
+            explanation (default: LLM_COMBINED_MODE setting)
     
     Returns:
         Dictionary with complete analysis results
+    
+    Raises:
+        ValueError: If the profile or stage names are invalid
     """
     
-    analysis_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow().isoformat() + "Z"
+    # Resolve stages up front so invalid options fail fast
+    active_stages = resolve_analysis_stages(profile, stages)
+    analysis_profile = {
+        "profile": None if stages else (profile or DEFAULT_PROFILE),
+        "stages": active_stages
+    }
+    if combined_llm is None:
+        combined_llm = settings.LLM_COMBINED_MODE
+    
+    def run() -> Dict[str, Any]:
+        return _execute_analysis(
+            input_type=input_type,
+            content=content,
+            file_bytes=file_bytes,
+            persona=persona,
+            simulate_hardening=simulate_hardening,
+            fields_to_remove=fields_to_remove,
+            active_stages=active_stages,
+            analysis_profile=analysis_profile,
+            stage_timeouts=stage_timeouts,
+            combined_llm=combined_llm
+        )
+    
+    # Concurrent identical requests share one in-flight computation
+    key = _analysis_coalescing_key(
+        input_type, content, file_bytes,
+        {
+            "persona": persona,
+            "simulate_hardening": simulate_hardening,
+            "fields_to_remove": fields_to_remove,
+            "stages": active_stages,
+            "stage_timeouts": stage_timeouts,
+            "combined_llm": combined_llm
+        }
+    )
+    if key is None:
+        return run()
+    
+    result, shared = _analysis_flight.do(key, run)
+    if shared:
+        # Give each caller its own copy so nobody mutates a shared result,
+        # reported as a separate analysis with the caller's own options
+        result = copy.deepcopy(result)
+        result["analysis_id"] = str(uuid.uuid4())
+        result["input_summary"]["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        result["analysis_profile"] = analysis_profile
+    return result
+
+
+def run_entity_analysis(
+    entities: Mapping,
+    persona: Optional[str] = None,
+    simulate_hardening: bool = False,
+    fields_to_remove: Optional[List[str]] = None,
+    profile: Optional[str] = None,
+    stages: Optional[List[str]] = None,
+    stage_timeouts: Optional[Dict[str, float]] = None,
+    combined_llm: Optional[bool] = None,
+    input_type: str = "entities",
+    normalized_text: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run the analysis pipeline on already extracted entities.
+    
+    Same stages and result shape as run_comprehensive_analysis, without
+    normalization and extraction (character_count is 0 unless the
+    normalized text the entities came from is given).
+    
+    Args:
+        entities: Dictionary (or EntitySet) of extracted entities
+        input_type: Input type reported in input_summary
+        normalized_text: Normalized text the entities were extracted from
+        (other arguments as in run_comprehensive_analysis)
+    
+    Returns:
+        Dictionary with complete analysis results
+    
+    Raises:
+        ValueError: If the profile or stage names are invalid
+    """
+    active_stages = resolve_analysis_stages(profile, stages)
+    if combined_llm is None:
+        combined_llm = settings.LLM_COMBINED_MODE
+    
+    return _execute_analysis(
+        input_type=input_type,
+        content=None,
+        file_bytes=None,
+        persona=persona,
+        simulate_hardening=simulate_hardening,
+        fields_to_remove=fields_to_remove,
+        active_stages=active_stages,
+        analysis_profile={
+            "profile": None if stages else (profile or DEFAULT_PROFILE),
+            "stages": active_stages
+        },
+        stage_timeouts=stage_timeouts,
+        combined_llm=combined_llm,
+        entities=entities,
+        normalized_text=normalized_text
+    )
+
+
+def _analysis_coalescing_key(
+    input_type: str,
+    content: Optional[str],
+    file_bytes: Optional[bytes],
+    options: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Build the single-flight key from normalized content hash + options.
     
+    Text is normalized before hashing so whitespace-only differences
+    coalesce; PDFs are keyed by their raw bytes. Returns None for input
+    that cannot be keyed (the analysis then runs uncoalesced and reports
+    its own error).
+    """
+    digest = hashlib.sha256()
     try:
-        # STEP 1: Normalize input
-        print(f"\n[ANALYSIS {analysis_id}] Step 1: Normalizing input...")
         if input_type == "text":
-            normalized_text = normalize_text(content)
-        elif input_type == "pdf":
-            normalized_text = extract_text_from_pdf(file_bytes)
+            digest.update(b"text:" + normalize_text(content).encode("utf-8"))
+        elif input_type == "pdf" and file_bytes:
+            digest.update(b"pdf:" + file_bytes)
         else:
-            raise ValueError(f"Invalid input_type: {input_type}")
-        
-        # STEP 2: Extract entities
-        print(f"[ANALYSIS {analysis_id}] Step 2: Extracting entities...")
-        entities = extract_entities(normalized_text)
-        
-        # STEP 3: Correlate risks
-        print(f"[ANALYSIS {analysis_id}] Step 3: Correlating risks...")
-        correlation_result = apply_correlation_rules(entities)
-        inferred_risks = correlation_result.get("inferred_risks", [])
-        
-        # STEP 4: Compute correlation depth
-        print(f"[ANALYSIS {analysis_id}] Step 4: Computing correlation depth...")
-        correlation_depth_result = calculate_correlation_depth(inferred_risks)
-        correlation_depth = correlation_depth_result.get("correlation_depth_score", 0)
+            return None
+    except ValueError:
+        return None
+    
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _execute_analysis(
+    input_type: str,
+    content: Optional[str],
+    file_bytes: Optional[bytes],
+    persona: Optional[str],
+    simulate_hardening: bool,
+    fields_to_remove: Optional[List[str]],
+    active_stages: List[str],
+    analysis_profile: Dict[str, Any],
+    stage_timeouts: Optional[Dict[str, float]],
+    combined_llm: bool = False,
+    entities: Optional[Mapping] = None,
+    normalized_text: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run the pipeline once and assemble the analysis response.
+    
+    Precomputed `entities` (and the `normalized_text` they came from, if
+    known) skip normalization and extraction.
+    """
+    
+    analysis_id = str(uuid.uuid4())
+    timestamp = datetime.utcnow().isoformat() + "Z"
+    
+    try:
+        print(f"\n[ANALYSIS {analysis_id}] Starting pipeline: {', '.join(active_stages)}")
         
-        # STEP 5: Compute timeline
-        print(f"[ANALYSIS {analysis_id}] Step 5: Computing timeline exposure...")
-        graduation_year = 0
-        years_of_experience = 0
-        if "graduation_year" in entities and entities["graduation_year"]:
-            grad_year = entities["graduation_year"]
-            graduation_year = grad_year[0] if isinstance(grad_year, list) else grad_year
-        if "years_of_experience" in entities and entities["years_of_experience"]:
-            yoe = entities["years_of_experience"]
-            years_of_experience = yoe if isinstance(yoe, (int, float)) else (yoe[0] if isinstance(yoe, list) else 0)
+        # Combined mode only pays off when it replaces several LLM calls
+        llm_sections = [
+            stage for stage in active_stages
+            if stage in COMBINED_LLM_STAGES and (stage != "persona" or persona)
+        ] if combined_llm else []
+        if len(llm_sections) < 2:
+            llm_sections = []
         
-        timeline_result = calculate_timeline_exposure(
-            graduation_year=graduation_year,
-            years_of_experience=years_of_experience,
-            company_years=0
-        )
-        timeline_years = timeline_result.get("estimated_exposure_years", 0)
+        requested_outputs = ["entities"] if entities is not None else ["normalized_text", "entities"]
+        for stage in active_stages:
+            if stage not in llm_sections:
+                requested_outputs.extend(STAGE_OUTPUTS[stage])
+        if llm_sections:
+            requested_outputs.append("llm_outputs")
         
-        # STEP 6: Compute visibility
-        print(f"[ANALYSIS {analysis_id}] Step 6: Computing visibility score...")
-        visibility_result = calculate_visibility(entities)
-        visibility_score = visibility_result.get("visibility_score", 0)
+        inputs = {
+            "input_type": input_type,
+            "content": content,
+            "file_bytes": file_bytes,
+            "persona": persona,
+            "simulate_hardening": simulate_hardening,
+            "fields_to_remove": fields_to_remove,
+            "llm_sections": llm_sections
+        }
+        if entities is not None:
+            inputs["entities"] = EntitySet.from_dict(entities)
+            if normalized_text is not None:
+                inputs["normalized_text"] = normalized_text
         
-        # STEP 7: Compute risk score
-        print(f"[ANALYSIS {analysis_id}] Step 7: Computing risk score...")
-        score_result = calculate_risk_score(
-            entities=entities,
-            inferred_risks=inferred_risks,
-            correlation_depth=correlation_depth,
-            timeline_years=timeline_years,
-            visibility_score=visibility_score
+        values = run_analysis_pipeline(
+            inputs=inputs,
+            outputs=requested_outputs,
+            timeouts=stage_timeouts,
+            log_prefix=f"[ANALYSIS {analysis_id}]"
         )
-        risk_score = score_result.get("risk_score", 0)
-        risk_level = score_result.get("risk_level", "Unknown")
-        score_breakdown = score_result.get("score_breakdown", {})
-        
-        # STEP 8: Categorize attack vectors
-        print(f"[ANALYSIS {analysis_id}] Step 8: Categorizing attack vectors...")
-        attack_vector_result = categorize_attack_vectors(entities, inferred_risks)
-        attack_vectors = attack_vector_result.get("attack_vectors", [])
-        
-        # STEP 9: Persona narrative (safe fail)
-        print(f"[ANALYSIS {analysis_id}] Step 9: Generating persona narrative...")
-        persona_narrative = ""
-        if persona:
-            try:
-                persona_result = generate_persona_narrative(
-                    persona=persona,
-                    analysis_summary={
-                        "entities": entities,
-                        "attack_vectors": attack_vectors,
-                        "risk_score": risk_score
-                    }
-                )
-                persona_narrative = persona_result.get("narrative", "")
-            except Exception as e:
-                print(f"[WARNING] Persona narrative failed: {str(e)}")
-        
-        # STEP 10: Phishing simulation (safe fail)
-        print(f"[ANALYSIS {analysis_id}] Step 10: Generating phishing simulation...")
-        phishing_subject = ""
-        phishing_body = ""
-        phishing_disclaimer = ""
-        try:
-            phishing_result = generate_phishing_email(entities)
-            phishing_subject = phishing_result.get("email_subject", "")
-            phishing_body = phishing_result.get("email_body", "")
-            phishing_disclaimer = phishing_result.get("disclaimer", "")
-        except Exception as e:
-            print(f"[WARNING] Phishing simulation failed: {str(e)}")
-        
-        # STEP 11: Risk explanation (safe fail)
-        print(f"[ANALYSIS {analysis_id}] Step 11: Generating explanation...")
-        explanation_text = ""
-        try:
-            explanation_result = generate_risk_explanation(
-                risk_score=risk_score,
-                score_breakdown=score_breakdown,
-                inferred_risks=inferred_risks
-            )
-            explanation_text = explanation_result
-        except Exception as e:
-            print(f"[WARNING] Explanation generation failed: {str(e)}")
         
-        # STEP 12: Optional hardening simulation
-        print(f"[ANALYSIS {analysis_id}] Step 12: Optional hardening simulation...")
-        hardening_result = None
-        if simulate_hardening:
-            # Default fields if not provided
-            fields_to_simulate = fields_to_remove if fields_to_remove else ["phones", "email", "graduation_year", "location"]
-            try:
-                hardening_data = run_hardening_simulation(
-                    entities,
-                    fields_to_simulate
-                )
-                # Safe construction with defensive defaults
-                if hardening_data:
-                    hardening_result = {
-                        "original_score": hardening_data.get("original_score"),
-                        "hardened_score": hardening_data.get("hardened_score"),
-                        "difference": hardening_data.get("difference"),
-                        "explanation": hardening_data.get(
-                            "explanation",
-                            "Reducing exposed personal attributes lowers correlation risk and decreases attack surface."
-                        )
-                    }
-            except Exception as e:
-                print(f"[WARNING] Hardening simulation failed: {str(e)}")
+        if llm_sections:
+            values.update(values.get("llm_outputs") or {})
         
-        # STEP 13: Generate heatmap
-        print(f"[ANALYSIS {analysis_id}] Step 13: Generating heatmap...")
-        visualization_data = None
-        try:
-            # Calculate data type contributions from entities
-            data_type_contributions = {}
-            for entity_type, values in entities.items():
-                count = 0
-                if isinstance(values, list):
-                    count = len([v for v in values if v])
-                elif values:
-                    count = 1
-                
-                if entity_type in ["emails", "email_addresses", "email"]:
-                    data_type_contributions["email"] = count * 6
-                elif entity_type in ["phones", "phone_numbers", "phone"]:
-                    data_type_contributions["phone"] = count * 6
-                elif entity_type in ["dob", "date_of_birth"]:
-                    data_type_contributions["dob"] = count * 8
-                elif entity_type in ["companies", "company_names", "company"]:
-                    data_type_contributions["company"] = count * 5
-                elif entity_type in ["locations", "cities", "cities_lived", "location"]:
-                    data_type_contributions["location"] = count * 4
-            
-            # Construct heatmap payload
-            heatmap_input = {
-                "total_risk_score": risk_score,
-                "components": score_breakdown,
-                "data_type_contributions": data_type_contributions
-            }
-            
-            heatmap_data = generate_heatmap(heatmap_input)
-            visualization_data = {
-                "summary": heatmap_data.get("summary"),
-                "severity_distribution": heatmap_data.get("severity_distribution"),
-                "risk_category_breakdown": heatmap_data.get("risk_category_breakdown"),
-                "heatmap": heatmap_data.get("heatmap"),
-                "graph_data": heatmap_data.get("graph_data")
-            }
-        except Exception as e:
-            print(f"[WARNING] Heatmap generation failed: {str(e)}")
+        normalized_text = values.get("normalized_text", "")
+        entities = values["entities"]
+        if isinstance(entities, EntitySet):
+            entities = entities.to_dict()
+        risk_score = values["risk_score"]
+        attack_vectors = values.get("attack_vectors") or []
+        phishing = values.get("phishing") or {}
         
         print(f"[ANALYSIS {analysis_id}] ✅ Analysis complete. Risk Score: {risk_score}")
         
@@ -251,12 +719,13 @@ def run_comprehensive_analysis(
             "entities": entities,
             "risk_assessment": {
                 "risk_score": round(risk_score, 2),
-                "risk_level": risk_level,
-                "score_breakdown": score_breakdown,
-                "inferred_risks": inferred_risks,
-                "correlation_depth": round(correlation_depth, 2),
-                "timeline_years": round(timeline_years, 2),
-                "visibility_score": round(visibility_score, 2)
+                "risk_level": values["risk_level"],
+                "score_breakdown": values["score_breakdown"],
+                "inferred_risks": values["inferred_risks"],
+                "correlation_depth": round(values["correlation_depth"], 2),
+                "timeline_years": round(values["timeline_years"], 2),
+                "visibility_score": round(values["visibility_score"], 2),
+                "field_contributions": values.get("field_contributions") or []
             },
             "attack_analysis": {
                 "attack_vectors": attack_vectors,
@@ -264,18 +733,19 @@ def run_comprehensive_analysis(
             },
             "persona_simulation": {
                 "persona": persona,
-                "narrative": persona_narrative
+                "narrative": values.get("persona_narrative") or ""
             },
             "phishing_simulation": {
-                "email_subject": phishing_subject,
-                "email_body": phishing_body,
-                "disclaimer": phishing_disclaimer
+                "email_subject": phishing.get("email_subject", ""),
+                "email_body": phishing.get("email_body", ""),
+                "disclaimer": phishing.get("disclaimer", "")
             },
             "explanation": {
-                "explanation": explanation_text
+                "explanation": values.get("explanation_text") or ""
             },
-            "hardening_simulation": hardening_result,
-            "visualization": visualization_data
+            "hardening_simulation": values.get("hardening_result"),
+            "visualization": values.get("visualization"),
+            "analysis_profile": analysis_profile
         }
     
     except Exception as e:
@@ -296,7 +766,8 @@ def run_comprehensive_analysis(
                 "inferred_risks": [],
                 "correlation_depth": 0.0,
                 "timeline_years": 0.0,
-                "visibility_score": 0.0
+                "visibility_score": 0.0,
+                "field_contributions": []
             },
             "attack_analysis": {
                 "attack_vectors": [],
@@ -315,5 +786,6 @@ def run_comprehensive_analysis(
                 "explanation": ""
             },
             "hardening_simulation": None,
-            "visualization": None
+            "visualization": None,
+            "analysis_profile": analysis_profile
         }
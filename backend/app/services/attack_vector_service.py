@@ -1,213 +1,243 @@
 """
 Attack vector categorization service.
 Maps inferred risks to real-world attack categories.
+
+Attack vector definitions live in rules/attack_vector_rules.json and are
+compiled into bitmasks over the shared entity presence vector (see
+presence_service), so every category is evaluated from one presence mask.
+The compiled rules are reloaded automatically when the rules file changes;
+an edit that fails to load keeps the previous rules in use.
 """
 
-from typing import Dict, List
+import json
+import os
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional
+
+from app.services.presence_service import EntityPresence, FIELD_BITS, compute_presence
+
+
+_RULES_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "rules",
+    "attack_vector_rules.json"
+)
+
+# Deterministic output ordering by severity
+_SEVERITY_ORDER = {"High": 0, "Moderate": 1, "Low": 2}
+
+
+def load_attack_vector_rules() -> Dict:
+    """
+    Load attack vector rules from JSON configuration file.
+
+    Returns:
+        Dictionary with attack_vectors and severity_levels
+
+    Raises:
+        FileNotFoundError: If rules file not found
+        json.JSONDecodeError: If rules file is invalid JSON
+    """
+    with open(_RULES_PATH, 'r') as f:
+        rules_data = json.load(f)
+
+    return rules_data
 
 
-def categorize_attack_vectors(entities: Dict, inferred_risks: List[Dict] = None) -> Dict:
+class CompiledAttackVectorRules:
+    """
+    Attack vector rules compiled to bitmask checks.
+
+    Rule fields map to presence_service bits. A rule matches when all of
+    its required bits are set and at least `min_factors` of its factor
+    bits are set.
+    """
+
+    def __init__(self, rules_data: Dict):
+        definitions = rules_data.get("attack_vectors", [])
+
+        for definition in definitions:
+            for field in definition.get("factors", []) + definition.get("required_fields", []):
+                if field not in FIELD_BITS:
+                    raise ValueError(
+                        f"Unknown entity field '{field}' in attack vector "
+                        f"'{definition.get('category')}'"
+                    )
+
+        # (min_factors, severity) pairs, highest threshold first
+        self.severity_levels = sorted(
+            (
+                (level.get("min_factors", 0), level.get("severity", "Low"))
+                for level in rules_data.get("severity_levels", [])
+            ),
+            reverse=True
+        ) or [(4, "High"), (3, "Moderate"), (0, "Low")]
+
+        self.rules = []
+        for definition in definitions:
+            factors = sorted(set(definition.get("factors", [])))
+            factor_mask = 0
+            for field in factors:
+                factor_mask |= FIELD_BITS[field]
+            required_mask = 0
+            for field in definition.get("required_fields", []):
+                required_mask |= FIELD_BITS[field]
+
+            self.rules.append((
+                definition["category"],
+                factor_mask,
+                required_mask,
+                definition.get("min_factors", len(factors)),
+                # Factor names paired with bits, pre-sorted for output
+                tuple((field, FIELD_BITS[field]) for field in factors)
+            ))
+
+    def evaluate(self, mask: int) -> List[Dict]:
+        """Evaluate every rule against a presence mask."""
+        attack_vectors = []
+
+        for category, factor_mask, required_mask, min_factors, factors in self.rules:
+            if mask & required_mask != required_mask:
+                continue
+
+            present = mask & factor_mask
+            factor_count = bin(present).count("1")
+            if factor_count < min_factors:
+                continue
+
+            attack_vectors.append({
+                "category": category,
+                "severity": self._determine_severity(factor_count),
+                "contributing_factors": [field for field, bit in factors if present & bit]
+            })
+
+        # Sort by severity (High, Moderate, Low) for deterministic ordering
+        attack_vectors.sort(key=lambda x: (_SEVERITY_ORDER.get(x["severity"], 3), x["category"]))
+
+        return attack_vectors
+
+    def _determine_severity(self, factor_count: int) -> str:
+        """Determine severity based on contributing factors count."""
+        for min_factors, severity in self.severity_levels:
+            if factor_count >= min_factors:
+                return severity
+        return "Low"
+
+
+_compiled_rules = None
+_compiled_mtime = None
+_compile_lock = threading.Lock()
+
+
+def get_compiled_rules() -> CompiledAttackVectorRules:
+    """
+    Return compiled attack vector rules, recompiling if the file changed.
+
+    If a changed file cannot be loaded, the last good rules stay in use
+    until the file changes again.
+
+    Raises:
+        ValueError: If the rules file cannot be loaded or compiled and no
+            earlier version was loaded
+    """
+    global _compiled_rules, _compiled_mtime
+
+    try:
+        mtime = os.path.getmtime(_RULES_PATH)
+    except OSError:
+        # Missing file; the load below reports it
+        mtime = -1.0
+
+    if _compiled_rules is not None and mtime == _compiled_mtime:
+        return _compiled_rules
+
+    with _compile_lock:
+        if _compiled_rules is None or mtime != _compiled_mtime:
+            try:
+                _compiled_rules = CompiledAttackVectorRules(load_attack_vector_rules())
+            except Exception as e:
+                if _compiled_rules is None:
+                    raise ValueError(f"Failed to load attack vector rules: {str(e)}")
+                print(f"[WARNING] Failed to reload attack vector rules, keeping previous rules: {str(e)}")
+            _compiled_mtime = mtime
+
+    return _compiled_rules
+
+
+def reload_attack_vector_rules() -> CompiledAttackVectorRules:
+    """Force recompilation of the attack vector rules."""
+    global _compiled_mtime
+    with _compile_lock:
+        _compiled_mtime = None
+    return get_compiled_rules()
+
+
+def categorize_attack_vectors(
+    entities: Mapping,
+    inferred_risks: List[Dict] = None,
+    presence: Optional[EntityPresence] = None
+) -> Dict:
     """
     Categorize extracted entities into real-world attack vectors.
-    
-    Attack Vector Categories:
+
+    Attack Vector Categories (rules/attack_vector_rules.json):
     1. Spear Phishing Risk: company + job_title + email
     2. Identity Theft Risk: dob + email OR dob + phone
     3. Social Engineering Risk: family_mentions + location
     4. Corporate Espionage Risk: company + skills + certifications
     5. Credential Guessing Risk: email + graduation_year
-    
+
     Severity determined by contributing factors count:
     1-2 factors → Low
     3 factors → Moderate
     4+ factors → High
-    
+
     Args:
         entities: Dictionary of extracted entities
         inferred_risks: List of inferred risks (optional, for future enhancement)
-    
+        presence: Precomputed presence vector for entities (computed if omitted)
+
     Returns:
         Dictionary with attack_vectors list
-    
+
     Raises:
         ValueError: If entities is invalid
     """
-    if not isinstance(entities, dict):
+    if not isinstance(entities, Mapping):
         raise ValueError("Entities must be a dictionary")
-    
-    attack_vectors = []
-    
-    # Check Spear Phishing Risk
-    spear_phishing = _check_spear_phishing(entities)
-    if spear_phishing:
-        attack_vectors.append(spear_phishing)
-    
-    # Check Identity Theft Risk
-    identity_theft = _check_identity_theft(entities)
-    if identity_theft:
-        attack_vectors.append(identity_theft)
-    
-    # Check Social Engineering Risk
-    social_engineering = _check_social_engineering(entities)
-    if social_engineering:
-        attack_vectors.append(social_engineering)
-    
-    # Check Corporate Espionage Risk
-    corporate_espionage = _check_corporate_espionage(entities)
-    if corporate_espionage:
-        attack_vectors.append(corporate_espionage)
-    
-    # Check Credential Guessing Risk
-    credential_guessing = _check_credential_guessing(entities)
-    if credential_guessing:
-        attack_vectors.append(credential_guessing)
-    
-    # Sort by severity (High, Moderate, Low) for deterministic ordering
-    severity_order = {"High": 0, "Moderate": 1, "Low": 2}
-    attack_vectors.sort(key=lambda x: (severity_order.get(x["severity"], 3), x["category"]))
-    
+
+    if presence is None:
+        presence = compute_presence(entities)
+
     return {
-        "attack_vectors": attack_vectors
+        "attack_vectors": get_compiled_rules().evaluate(presence.mask)
     }
 
 
-def _has_field(entities: Dict, field: str) -> bool:
-    """Check if a field exists and has content."""
-    if field not in entities:
-        return False
-    
-    value = entities[field]
-    
-    if isinstance(value, list):
-        return len(value) > 0
-    elif isinstance(value, int):
-        return value > 0
-    elif isinstance(value, str):
-        return len(value) > 0
-    
-    return value is not None
-
-
-def _determine_severity(factor_count: int) -> str:
-    """Determine severity based on contributing factors count."""
-    if factor_count >= 4:
-        return "High"
-    elif factor_count == 3:
-        return "Moderate"
-    else:
-        return "Low"
+def categorize_attack_vectors_batch(entity_sets: Iterable[Dict]) -> List[Dict]:
+    """
+    Categorize many entity sets against a single compiled rules snapshot.
 
+    Args:
+        entity_sets: Iterable of entity dictionaries
 
-def _check_spear_phishing(entities: Dict) -> dict or None:
-    """
-    Spear Phishing Risk: company + job_title + email
-    """
-    contributing_factors = []
-    
-    if _has_field(entities, "company"):
-        contributing_factors.append("company")
-    if _has_field(entities, "job_title"):
-        contributing_factors.append("job_title")
-    if _has_field(entities, "emails"):
-        contributing_factors.append("emails")
-    
-    if len(contributing_factors) >= 2:  # At least 2 factors
-        return {
-            "category": "Spear Phishing Risk",
-            "severity": _determine_severity(len(contributing_factors)),
-            "contributing_factors": sorted(contributing_factors)
-        }
-    
-    return None
-
-
-def _check_identity_theft(entities: Dict) -> dict or None:
-    """
-    Identity Theft Risk: dob + email OR dob + phone
-    """
-    has_dob = _has_field(entities, "dob")
-    has_email = _has_field(entities, "emails")
-    has_phone = _has_field(entities, "phones")
-    
-    if has_dob and (has_email or has_phone):
-        contributing_factors = []
-        
-        if has_dob:
-            contributing_factors.append("dob")
-        if has_email:
-            contributing_factors.append("emails")
-        if has_phone:
-            contributing_factors.append("phones")
-        
-        return {
-            "category": "Identity Theft Risk",
-            "severity": _determine_severity(len(contributing_factors)),
-            "contributing_factors": sorted(contributing_factors)
-        }
-    
-    return None
-
-
-def _check_social_engineering(entities: Dict) -> dict or None:
-    """
-    Social Engineering Risk: family_mentions + location
-    """
-    contributing_factors = []
-    
-    if _has_field(entities, "family_mentions"):
-        contributing_factors.append("family_mentions")
-    if _has_field(entities, "location"):
-        contributing_factors.append("location")
-    
-    if len(contributing_factors) >= 2:
-        return {
-            "category": "Social Engineering Risk",
-            "severity": _determine_severity(len(contributing_factors)),
-            "contributing_factors": sorted(contributing_factors)
-        }
-    
-    return None
-
-
-def _check_corporate_espionage(entities: Dict) -> dict or None:
-    """
-    Corporate Espionage Risk: company + skills + certifications
-    """
-    contributing_factors = []
-    
-    if _has_field(entities, "company"):
-        contributing_factors.append("company")
-    if _has_field(entities, "skills"):
-        contributing_factors.append("skills")
-    if _has_field(entities, "certifications"):
-        contributing_factors.append("certifications")
-    
-    if len(contributing_factors) >= 2:
-        return {
-            "category": "Corporate Espionage Risk",
-            "severity": _determine_severity(len(contributing_factors)),
-            "contributing_factors": sorted(contributing_factors)
-        }
-    
-    return None
-
-
-def _check_credential_guessing(entities: Dict) -> dict or None:
-    """
-    Credential Guessing Risk: email + graduation_year
+    Returns:
+        List of results in input order, each shaped like categorize_attack_vectors()
+
+    Raises:
+        ValueError: If any entity set is invalid
     """
-    contributing_factors = []
-    
-    if _has_field(entities, "emails"):
-        contributing_factors.append("emails")
-    if _has_field(entities, "graduation_year"):
-        contributing_factors.append("graduation_year")
-    
-    if len(contributing_factors) >= 2:
-        return {
-            "category": "Credential Guessing Risk",
-            "severity": _determine_severity(len(contributing_factors)),
-            "contributing_factors": sorted(contributing_factors)
-        }
-    
-    return None
+    rules = get_compiled_rules()
+    results = []
+
+    for entities in entity_sets:
+        if not isinstance(entities, Mapping):
+            raise ValueError("Entities must be a dictionary")
+        results.append({
+            "attack_vectors": rules.evaluate(compute_presence(entities).mask)
+        })
+
+    return results
+
@@ -0,0 +1,378 @@
+"""
+Bulk scan service.
+Runs the deterministic analysis pipeline over a corpus of .txt/.pdf files
+in directories and tar/zip archives, without the HTTP server.
+
+Files on disk are read inside the worker processes; archive members are
+streamed out of the archive one at a time. Documents fan out
+over a process pool (each worker holds its own PersonaShieldEngine with
+the LLM stages disabled), and every document written to the output is
+recorded in a checkpoint file so an interrupted scan can resume where it
+stopped.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+
+from app.core.responses import orjson
+
+
+DOCUMENT_EXTENSIONS = {".txt": "text", ".pdf": "pdf"}
+
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ZIP_EXTENSIONS = (".zip",)
+
+OUTPUT_FORMATS = ["jsonl", "parquet", "arrow"]
+
+# Separates an archive path from a member name in document ids
+ARCHIVE_SEPARATOR = "::"
+
+
+def _document_kind(name: str) -> Optional[str]:
+    """Return "text" or "pdf" for a supported document name, else None."""
+    return DOCUMENT_EXTENSIONS.get(os.path.splitext(name)[1].lower())
+
+
+def iter_documents(paths: List[str]) -> Iterator[Tuple[str, str, Tuple[str, Any]]]:
+    """
+    Walk paths and yield every supported document.
+
+    Directories are walked recursively in sorted order; tar and zip
+    archives (given directly or found while walking) are expanded one
+    member at a time.
+
+    Args:
+        paths: Files, directories or archives
+
+    Yields:
+        Tuples of (doc_id, kind, source). kind is "text" or "pdf"; source
+        is ("file", path) for files on disk or ("bytes", data) for archive
+        members. doc_id is the file path, or "archive::member".
+
+    Raises:
+        ValueError: If a path does not exist
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield from _iter_path(os.path.join(root, name))
+        elif os.path.isfile(path):
+            yield from _iter_path(path)
+        else:
+            raise ValueError(f"Path not found: {path}")
+
+
+def _iter_path(path: str) -> Iterator[Tuple[str, str, Tuple[str, Any]]]:
+    """Yield the document at path, or the documents inside an archive."""
+    lowered = path.lower()
+    if lowered.endswith(ZIP_EXTENSIONS):
+        yield from _iter_zip(path)
+    elif lowered.endswith(TAR_EXTENSIONS):
+        yield from _iter_tar(path)
+    else:
+        kind = _document_kind(path)
+        if kind:
+            yield path, kind, ("file", path)
+
+
+def _iter_zip(path: str) -> Iterator[Tuple[str, str, Tuple[str, Any]]]:
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            kind = _document_kind(info.filename)
+            if kind and not info.is_dir():
+                yield f"{path}{ARCHIVE_SEPARATOR}{info.filename}", kind, ("bytes", archive.read(info))
+
+
+def _iter_tar(path: str) -> Iterator[Tuple[str, str, Tuple[str, Any]]]:
+    # Stream mode: members are read sequentially, compressed archives are
+    # never decompressed as a whole
+    with tarfile.open(path, "r|*") as archive:
+        for member in archive:
+            kind = _document_kind(member.name)
+            if kind and member.isfile():
+                data = archive.extractfile(member).read()
+                yield f"{path}{ARCHIVE_SEPARATOR}{member.name}", kind, ("bytes", data)
+
+
+def _read_source(source: Tuple[str, Any]) -> bytes:
+    """Return document bytes, reading files on disk in the worker."""
+    source_type, value = source
+    if source_type == "bytes":
+        return value
+
+    with open(value, "rb") as handle:
+        return handle.read()
+
+
+# Per-process engine, created by _init_worker
+_worker_engine = None
+
+
+def _init_worker(profile: Optional[str], stages: Optional[List[str]], quiet: bool) -> None:
+    """Process pool initializer: build the worker's engine."""
+    global _worker_engine
+
+    if quiet:
+        # Pipeline progress logs would interleave across workers
+        sys.stdout = open(os.devnull, "w")
+
+    from app.engine import PersonaShieldEngine
+    _worker_engine = PersonaShieldEngine(profile=profile, stages=stages, llm=False, max_workers=1)
+
+
+def scan_document(doc_id: str, kind: str, source: Tuple[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze one document in a worker process.
+
+    Returns:
+        The analysis result with doc_id added, or {"doc_id", "error"} if
+        the document could not be read. Documents the pipeline could not
+        analyze (empty text, invalid PDF) keep the fallback result and
+        also get an "error".
+    """
+    try:
+        data = _read_source(source)
+        if kind == "pdf":
+            result = _worker_engine.analyze(pdf_bytes=data)
+        else:
+            result = _worker_engine.analyze(text=data.decode("utf-8", errors="replace"))
+    except Exception as e:
+        return {"doc_id": doc_id, "error": str(e)}
+
+    if result["risk_assessment"]["risk_level"] == "Unknown":
+        # run_comprehensive_analysis reports failures as a fallback result
+        return {"doc_id": doc_id, "error": "Document could not be analyzed (empty or unreadable)", **result}
+    return {"doc_id": doc_id, **result}
+
+
+class JsonlResultWriter:
+    """
+    Appends results as JSON lines.
+
+    Every result is flushed as it is written, so it is durable as soon as
+    write() returns.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._handle: TextIO = sys.stdout if path == "-" else open(path, "a", encoding="utf-8")
+
+    def write(self, result: Dict[str, Any]) -> List[str]:
+        """Write one result; returns the doc ids now durably written."""
+        if orjson is not None:
+            line = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        else:
+            line = json.dumps(result, ensure_ascii=False, default=str)
+        self._handle.write(line + "\n")
+        self._handle.flush()
+        return [result["doc_id"]]
+
+    def close(self) -> List[str]:
+        if self._handle is not sys.stdout:
+            self._handle.close()
+        return []
+
+
+class ColumnarDatasetWriter:
+    """
+    Writes flattened results to a Parquet or Arrow dataset directory.
+
+    Each scan run writes new part files (see columnar_export), so resumed
+    runs never rewrite earlier output. Parquet and Arrow files are only
+    readable once closed, so every `part_size` results the open part is
+    closed and only then are its doc ids returned for the checkpoint. An
+    open part is written as "_part-NNNNN" (dataset readers skip names
+    starting with "_") and renamed when closed, so a killed run leaves no
+    unreadable part and its unfinished documents are scanned again on
+    resume. Requires pyarrow.
+    """
+
+    def __init__(self, path: str, file_format: str, row_group_size: int = 10000, part_size: int = 50000):
+        from app.services.columnar_export import columnar_schema
+
+        # Fails fast if pyarrow is missing
+        columnar_schema(file_format)
+
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.file_format = file_format
+        self.part_size = max(1, part_size)
+        self.row_group_size = min(row_group_size, self.part_size)
+        self._writer = None
+        self._part_path: Optional[str] = None
+        self._part_ids: List[str] = []
+
+    def write(self, result: Dict[str, Any]) -> List[str]:
+        """Buffer one result; returns the doc ids now durably written."""
+        if self._writer is None:
+            # Opened on the first result: runs with nothing to do add no part file
+            from app.services.columnar_export import ColumnarResultWriter
+
+            extension = f".{self.file_format}"
+            part = sum(
+                1 for name in os.listdir(self.path)
+                if name.startswith("part-") and name.endswith(extension)
+            )
+            self._part_path = os.path.join(self.path, f"part-{part:05d}{extension}")
+            # Overwrites the unfinished part a killed run may have left
+            self._writer = ColumnarResultWriter(
+                os.path.join(self.path, f"_part-{part:05d}{extension}"),
+                file_format=self.file_format,
+                row_group_size=self.row_group_size
+            )
+
+        self._writer.write(result)
+        self._part_ids.append(result["doc_id"])
+        if len(self._part_ids) >= self.part_size:
+            return self.close()
+        return []
+
+    def close(self) -> List[str]:
+        """Close the open part file; returns the doc ids written to it."""
+        if self._writer is None:
+            return []
+
+        self._writer.close()
+        os.replace(self._writer.path, self._part_path)
+        written = self._part_ids
+        self._writer = None
+        self._part_ids = []
+        return written
+
+
+def open_result_writer(output: str, output_format: str):
+    """
+    Create the writer for an output format.
+
+    Raises:
+        ValueError: If the format is unknown or its dependency is missing
+    """
+    if output_format == "jsonl":
+        return JsonlResultWriter(output)
+    if output_format in ("parquet", "arrow"):
+        if output == "-":
+            raise ValueError(f"{output_format} output needs a directory, not stdout")
+        return ColumnarDatasetWriter(output, output_format)
+    raise ValueError(f"format must be one of: {', '.join(OUTPUT_FORMATS)}")
+
+
+def load_checkpoint(path: Optional[str]) -> set:
+    """Return the doc ids recorded in a checkpoint file."""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as handle:
+        return {line.rstrip("\n") for line in handle if line.strip()}
+
+
+def run_scan(
+    paths: List[str],
+    output: str,
+    output_format: str = "jsonl",
+    checkpoint: Optional[str] = None,
+    workers: Optional[int] = None,
+    profile: Optional[str] = None,
+    stages: Optional[List[str]] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    progress_interval: float = 5.0
+) -> Dict[str, Any]:
+    """
+    Scan a corpus and write one result per document.
+
+    Documents already listed in the checkpoint are skipped. At most
+    4 x workers documents are in flight, so memory stays bounded however
+    large the corpus is.
+
+    Args:
+        paths: Files, directories or archives to scan
+        output: Output file (jsonl, "-" for stdout) or dataset directory
+            (parquet, arrow)
+        output_format: "jsonl", "parquet" or "arrow"
+        checkpoint: Checkpoint file for resumable runs (None disables it)
+        workers: Worker processes (default: CPU count)
+        profile: Analysis profile name ('full' or 'fast')
+        stages: Explicit stage list, overrides profile
+        progress: Called with the running stats every progress_interval
+            seconds
+        progress_interval: Seconds between progress callbacks
+
+    Returns:
+        Stats dictionary with scanned, skipped, errors, elapsed_seconds
+        and docs_per_second
+
+    Raises:
+        ValueError: If an option or path is invalid
+    """
+    # Fail fast on bad options before starting processes
+    from app.services.analyze_service import resolve_analysis_stages
+    resolve_analysis_stages(profile, stages)
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise ValueError(f"Path not found: {', '.join(missing)}")
+
+    done = load_checkpoint(checkpoint)
+    writer = open_result_writer(output, output_format)
+    checkpoint_handle = open(checkpoint, "a", encoding="utf-8") if checkpoint else None
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    stats = {"scanned": 0, "skipped": 0, "errors": 0, "elapsed_seconds": 0.0, "docs_per_second": 0.0}
+    started = time.perf_counter()
+    last_report = started
+
+    def record(doc_ids: List[str]) -> None:
+        if checkpoint_handle and doc_ids:
+            checkpoint_handle.write("".join(f"{doc_id}\n" for doc_id in doc_ids))
+            checkpoint_handle.flush()
+
+    def collect(finished) -> None:
+        nonlocal last_report
+        for future in finished:
+            result = future.result()
+            stats["scanned"] += 1
+            if "error" in result:
+                stats["errors"] += 1
+            record(writer.write(result))
+
+        now = time.perf_counter()
+        stats["elapsed_seconds"] = round(now - started, 3)
+        stats["docs_per_second"] = round(stats["scanned"] / (now - started), 2) if now > started else 0.0
+        if progress and now - last_report >= progress_interval:
+            last_report = now
+            progress(dict(stats))
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(profile, stages, True)
+    )
+    try:
+        running = set()
+        for doc_id, kind, source in iter_documents(paths):
+            if doc_id in done:
+                stats["skipped"] += 1
+                continue
+            running.add(pool.submit(scan_document, doc_id, kind, source))
+            if len(running) >= 4 * workers:
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                collect(finished)
+
+        while running:
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            collect(finished)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        record(writer.close())
+        if checkpoint_handle:
+            checkpoint_handle.close()
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["docs_per_second"] = round(stats["scanned"] / elapsed, 2) if elapsed > 0 else 0.0
+    return stats
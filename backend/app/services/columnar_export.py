@@ -0,0 +1,297 @@
+"""
+Columnar export of analysis results.
+Flattens run_comprehensive_analysis results into typed Arrow columns and
+streams them to Parquet or Arrow IPC files one row group at a time.
+
+Each result becomes one row: scalar scores as float64 columns, one
+column per score breakdown component, the entity presence bitmask as
+uint16 (bit order in the `presence_fields` schema metadata), and the
+matched correlation rule ids and attack vector categories as string
+lists, plus the full result as a JSON string (entities, persona,
+hardening and anything else the flat columns leave out). Low-cardinality
+strings are dictionary-encoded with codes that stay stable across row
+groups (Parquet additionally dictionary-encodes every string column on
+disk; its readers do not support dictionary lists, so list items are
+plain strings there). Rows are buffered column by column and written
+every `row_group_size` results, so memory stays bounded however many
+results are exported. Parquet and Arrow files are only readable once
+close() has written their footer.
+
+Requires the optional pyarrow package.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+import json
+
+from app.core.responses import orjson
+from app.services.entity_set import presence_of
+from app.services.presence_service import ENTITY_FIELDS
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+# One float64 column per score_breakdown key
+SCORE_COLUMNS = {
+    "score_pii_exposure": "pii_exposure",
+    "score_correlation": "correlation_score",
+    "score_inference_depth": "inference_depth_score",
+    "score_employment_exposure": "employment_exposure",
+    "score_location_exposure": "location_exposure",
+    "score_timeline_exposure": "timeline_exposure",
+    "score_visibility_exposure": "visibility_exposure"
+}
+
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+
+def _result_json(result: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
+def _parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.rstrip("Z")).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def flatten_analysis(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten one analysis result into a row of typed column values.
+
+    Args:
+        result: Result shaped like run_comprehensive_analysis (an optional
+            doc_id and error are carried over)
+
+    Returns:
+        Dictionary of column name to value (see columnar_schema)
+    """
+    input_summary = result.get("input_summary") or {}
+    risk_assessment = result.get("risk_assessment") or {}
+    score_breakdown = risk_assessment.get("score_breakdown") or {}
+    attack_analysis = result.get("attack_analysis") or {}
+    entities = result.get("entities") or {}
+
+    row = {
+        "doc_id": result.get("doc_id"),
+        "analysis_id": result.get("analysis_id"),
+        "input_type": input_summary.get("input_type"),
+        "character_count": input_summary.get("character_count"),
+        "timestamp": _parse_timestamp(input_summary.get("timestamp")),
+        "risk_score": risk_assessment.get("risk_score"),
+        "risk_level": risk_assessment.get("risk_level"),
+        "correlation_depth": risk_assessment.get("correlation_depth"),
+        "timeline_years": risk_assessment.get("timeline_years"),
+        "visibility_score": risk_assessment.get("visibility_score")
+    }
+    for column, key in SCORE_COLUMNS.items():
+        value = score_breakdown.get(key)
+        row[column] = float(value) if value is not None else None
+
+    row["presence_mask"] = presence_of(entities).mask if entities else 0
+    row["rule_ids"] = [risk["rule_id"] for risk in risk_assessment.get("inferred_risks") or []]
+    row["attack_vector_categories"] = [
+        vector.get("category", "") for vector in attack_analysis.get("attack_vectors") or []
+    ]
+    row["error"] = result.get("error")
+    row["result"] = _result_json(result)
+    return row
+
+
+# String columns holding a small set of distinct values
+DICTIONARY_COLUMNS = ("input_type", "risk_level", "rule_ids", "attack_vector_categories")
+
+
+def columnar_schema(file_format: str = "parquet"):
+    """
+    Arrow schema of flattened analysis rows.
+
+    Args:
+        file_format: "parquet" (list items are plain strings) or "arrow"
+            (list items are dictionary-encoded)
+
+    Raises:
+        ValueError: If pyarrow is not installed
+    """
+    if pyarrow is None:
+        raise ValueError("Columnar export requires the pyarrow package")
+
+    dictionary_string = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    list_item = dictionary_string if file_format == "arrow" else pyarrow.string()
+    fields = [
+        ("doc_id", pyarrow.string()),
+        ("analysis_id", pyarrow.string()),
+        ("input_type", dictionary_string),
+        ("character_count", pyarrow.int64()),
+        ("timestamp", pyarrow.timestamp("us", tz="UTC")),
+        ("risk_score", pyarrow.float64()),
+        ("risk_level", dictionary_string),
+        ("correlation_depth", pyarrow.float64()),
+        ("timeline_years", pyarrow.float64()),
+        ("visibility_score", pyarrow.float64())
+    ]
+    fields += [(column, pyarrow.float64()) for column in SCORE_COLUMNS]
+    fields += [
+        ("presence_mask", pyarrow.uint16()),
+        ("rule_ids", pyarrow.list_(list_item)),
+        ("attack_vector_categories", pyarrow.list_(list_item)),
+        ("error", pyarrow.string()),
+        ("result", pyarrow.string())
+    ]
+    return pyarrow.schema(fields, metadata={"presence_fields": json.dumps(list(ENTITY_FIELDS))})
+
+
+class _Dictionary:
+    """Append-only string dictionary; codes never change between row groups."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, values: List[Optional[str]]):
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(value)
+            indices.append(code)
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(indices, type=pyarrow.int32()),
+            pyarrow.array(self.values, type=pyarrow.string())
+        )
+
+
+def _list_array(lists: List[List[str]], items):
+    offsets = [0]
+    for values in lists:
+        offsets.append(offsets[-1] + len(values))
+    return pyarrow.ListArray.from_arrays(pyarrow.array(offsets, type=pyarrow.int32()), items)
+
+
+class ColumnarResultWriter:
+    """
+    Streams flattened analysis results to a Parquet or Arrow IPC file.
+
+    Values are buffered per column and written as one row group (Parquet)
+    or record batch (Arrow) every `row_group_size` results. The file is
+    only readable once close() has written its footer, so no result is
+    durable before then.
+
+    Args:
+        path: Output file path
+        file_format: "parquet" or "arrow"
+        row_group_size: Results per row group
+        compression: Parquet compression codec
+
+    Raises:
+        ValueError: If pyarrow is missing or the format is unknown
+    """
+
+    def __init__(
+        self,
+        path: str,
+        file_format: str = "parquet",
+        row_group_size: int = 10000,
+        compression: str = "zstd"
+    ):
+        if file_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(COLUMNAR_FORMATS)}")
+
+        self.schema = columnar_schema(file_format)
+        self.path = path
+        self.file_format = file_format
+        self.row_group_size = max(1, row_group_size)
+        self.rows_written = 0
+
+        if file_format == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=compression)
+        else:
+            self._sink = pyarrow.OSFile(path, "wb")
+            # Dictionaries only grow, so later batches are written as deltas
+            self._writer = pyarrow.ipc.new_file(
+                self._sink, self.schema,
+                options=pyarrow.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            )
+
+        self._dictionaries = {name: _Dictionary() for name in DICTIONARY_COLUMNS}
+
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self.schema.names}
+        self._buffered_ids: List[Any] = []
+
+    def write(self, result: Dict[str, Any]) -> List[Any]:
+        """Buffer one result; returns the doc ids of a row group it completed."""
+        for name, value in flatten_analysis(result).items():
+            self._columns[name].append(value)
+        self._buffered_ids.append(result.get("doc_id"))
+
+        if len(self._buffered_ids) >= self.row_group_size:
+            return self.flush()
+        return []
+
+    def write_many(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Write any number of results."""
+        for result in results:
+            self.write(result)
+
+    def flush(self) -> List[Any]:
+        """
+        Write buffered results as one row group; returns their doc ids.
+
+        The rows are not readable until close() finalizes the file.
+        """
+        if not self._buffered_ids:
+            return []
+
+        arrays = []
+        for field in self.schema:
+            values = self._columns[field.name]
+            if pyarrow.types.is_list(field.type):
+                flat = [item for items in values for item in items]
+                if pyarrow.types.is_dictionary(field.type.value_type):
+                    items = self._dictionaries[field.name].encode(flat)
+                else:
+                    items = pyarrow.array(flat, type=pyarrow.string())
+                arrays.append(_list_array(values, items))
+            elif pyarrow.types.is_dictionary(field.type):
+                arrays.append(self._dictionaries[field.name].encode(values))
+            else:
+                arrays.append(pyarrow.array(values, type=field.type))
+        table = pyarrow.Table.from_arrays(arrays, schema=self.schema)
+
+        if self.file_format == "parquet":
+            self._writer.write_table(table, row_group_size=len(table))
+        else:
+            self._writer.write_table(table, max_chunksize=len(table))
+
+        written = self._buffered_ids
+        self.rows_written += len(written)
+        self._columns = {name: [] for name in self.schema.names}
+        self._buffered_ids = []
+        return written
+
+    def close(self) -> List[Any]:
+        """Flush remaining results and finalize the file; returns the flushed doc ids."""
+        written = self.flush()
+        self._writer.close()
+        if self.file_format == "arrow":
+            self._sink.close()
+        return written
+
+    def __enter__(self) -> "ColumnarResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,179 @@
+"""
+Combined LLM generation service.
+Generates persona narrative, phishing simulation and risk explanation with
+a single LLM call, falling back per section when the output is incomplete.
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+import re
+
+from app.core.config import settings
+from app.llm.langchain_client import generate_text
+from app.llm.combined_prompt import get_combined_prompt, SECTION_KEYS
+from app.services.persona_service import generate_persona_narrative
+from app.services.phishing_service import (
+    generate_phishing_email,
+    _parse_phishing_email,
+    _get_fallback_response,
+    DISCLAIMER,
+    FALLBACK_SUBJECT
+)
+from app.services.explanation_service import generate_risk_explanation, _get_fallback_explanation
+
+
+def generate_combined_outputs(
+    sections: List[str],
+    persona: Optional[str],
+    entities: Dict[str, Any],
+    attack_vectors: List[Dict[str, Any]],
+    risk_score: float,
+    score_breakdown: Dict[str, Any],
+    inferred_risks: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Generate several LLM sections with one request.
+    
+    Sections missing from an otherwise usable response are regenerated
+    individually with their dedicated prompt. If the combined request
+    fails outright (LLM unavailable or empty output), every section gets
+    its static fallback instead, so an outage never costs extra calls.
+    
+    Args:
+        sections: Subset of "persona", "phishing", "explanation"
+        persona: Persona type (used when "persona" is requested)
+        entities: Extracted entities
+        attack_vectors: Categorized attack vectors
+        risk_score: Overall risk score
+        score_breakdown: Score components
+        inferred_risks: Inferred privacy risks
+    
+    Returns:
+        Dictionary with `persona_narrative`, `phishing` and `explanation_text`
+        for the requested sections
+    """
+    analysis_summary = {
+        "entities": entities,
+        "attack_vectors": attack_vectors,
+        "risk_score": risk_score,
+        "score_breakdown": score_breakdown,
+        "inferred_risks": inferred_risks
+    }
+    
+    try:
+        prompt = get_combined_prompt(sections, analysis_summary, persona)
+        generated_text = generate_text(prompt, max_tokens=settings.LLM_COMBINED_MAX_TOKENS)
+    except Exception as e:
+        print(f"Error generating combined LLM output: {str(e)}")
+        generated_text = ""
+    
+    parsed = parse_combined_output(generated_text) if generated_text else {}
+    llm_available = bool(generated_text)
+    outputs: Dict[str, Any] = {}
+    
+    if "persona" in sections:
+        narrative = parsed.get("persona_narrative", "")
+        if not narrative and llm_available:
+            print("[COMBINED LLM] persona section missing, regenerating individually")
+            narrative = generate_persona_narrative(persona, analysis_summary).get("narrative", "")
+        outputs["persona_narrative"] = narrative
+    
+    if "phishing" in sections:
+        subject = parsed.get("phishing_subject", "")
+        body = parsed.get("phishing_body", "")
+        if subject and body:
+            outputs["phishing"] = {
+                "email_subject": subject,
+                "email_body": body,
+                "disclaimer": DISCLAIMER
+            }
+        elif llm_available:
+            print("[COMBINED LLM] phishing section missing, regenerating individually")
+            outputs["phishing"] = generate_phishing_email(entities)
+        else:
+            outputs["phishing"] = _get_fallback_response()
+    
+    if "explanation" in sections:
+        explanation = parsed.get("explanation", "")
+        if not explanation and llm_available:
+            print("[COMBINED LLM] explanation section missing, regenerating individually")
+            explanation = generate_risk_explanation(risk_score, score_breakdown, inferred_risks)
+        outputs["explanation_text"] = explanation or _get_fallback_explanation()
+    
+    return outputs
+
+
+def parse_combined_output(generated_text: str) -> Dict[str, str]:
+    """
+    Parse combined LLM output into section fields.
+    
+    Accepts a JSON object, optionally wrapped in a markdown code fence or
+    surrounded by prose. When no valid JSON object can be found, falls
+    back to scanning for `key: value` labels. A phishing email returned
+    as one block of text (e.g. "Subject: ... Body: ...") is split with the
+    phishing service's tolerant parser.
+    
+    Args:
+        generated_text: Raw LLM output
+    
+    Returns:
+        Dictionary of non-empty section fields (missing fields are omitted)
+    """
+    known_keys = [key for keys in SECTION_KEYS.values() for key in keys]
+    data = _load_json_object(generated_text)
+    
+    if data is None:
+        data = _parse_labelled_fields(generated_text, known_keys + ["phishing_email"])
+    
+    parsed = {}
+    for key in known_keys:
+        value = data.get(key)
+        if isinstance(value, str) and value.strip():
+            parsed[key] = value.strip()
+    
+    # Phishing email returned as a single field, or the body still carries
+    # its own subject line
+    email_text = data.get("phishing_email")
+    if "phishing_body" in parsed and re.match(r"\s*(?:Email )?Subject:", parsed["phishing_body"], re.IGNORECASE):
+        email_text = parsed.pop("phishing_body")
+    if isinstance(email_text, str) and email_text.strip():
+        subject, body = _parse_phishing_email(email_text)
+        if subject != FALLBACK_SUBJECT:
+            parsed.setdefault("phishing_subject", subject)
+        parsed.setdefault("phishing_body", body)
+    
+    return parsed
+
+
+def _load_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Extract the outermost JSON object from text, or None."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    
+    try:
+        # strict=False tolerates raw newlines inside strings
+        data = json.loads(text[start:end + 1], strict=False)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_labelled_fields(text: str, keys: List[str]) -> Dict[str, str]:
+    """
+    Find `key: value` sections in free text.
+    
+    Each value runs until the next known label or the end of the text.
+    Quotes, trailing commas and braces left over from broken JSON are
+    stripped.
+    """
+    label = r'["\']?(' + "|".join(re.escape(key) for key in keys) + r')["\']?\s*[:=]'
+    matches = list(re.finditer(label, text, re.IGNORECASE))
+    
+    fields = {}
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        value = text[match.end():end].strip().rstrip("},").strip().strip("\"'").strip()
+        fields.setdefault(match.group(1).lower(), value.replace("\\n", "\n"))
+    return fields
@@ -0,0 +1,162 @@
+"""
+Field contribution service.
+Attributes the risk score to individual entity fields.
+
+Each present field gets its exact Shapley value (its average marginal
+effect over every order in which the fields could have been exposed) and
+its leave-one-out marginal contribution (the score drop from removing
+only that field, as a hardening simulation of that field would report).
+Coalition scores are lookups in the precomputed score table, so all
+2^n coalitions of the n present fields are evaluated directly.
+"""
+
+from collections.abc import Mapping
+from math import factorial
+from typing import Dict, List, Optional, Tuple
+
+from app.core.bounded_cache import BoundedCache
+from app.core.config import settings
+from app.services.presence_service import ENTITY_FIELDS, EntityPresence, FIELD_BITS, compute_presence
+from app.services.score_table import get_score_table
+from app.services.timeline_service import estimate_exposure_years
+
+
+# Fields that feed the timeline exposure (coalitions without them
+# have a different exposure year count)
+TIMELINE_FIELDS = ("graduation_year", "years_of_experience")
+
+# Contributions per (presence mask, exposure years per timeline coalition)
+_contribution_cache = BoundedCache("field_contributions", settings.CONTRIBUTION_CACHE_SIZE)
+
+
+def calculate_field_contributions(
+    entities: Mapping,
+    presence: Optional[EntityPresence] = None
+) -> Dict:
+    """
+    Calculate Shapley values and marginal contributions of present fields.
+    
+    The value of a coalition of fields is the risk score of the entities
+    with every other field removed. Shapley values sum to the difference
+    between the full score and the score with no fields.
+    
+    Args:
+        entities: Dictionary (or EntitySet) of extracted entities
+        presence: Precomputed presence vector for entities (computed if omitted)
+    
+    Returns:
+        Dictionary with risk_score, baseline_score and contributions (one
+        entry per present field, largest Shapley value first)
+    
+    Raises:
+        ValueError: If entities is invalid or the scoring rules cannot be loaded
+    """
+    if not isinstance(entities, Mapping):
+        raise ValueError("Entities must be a dictionary")
+    
+    if presence is None:
+        presence = compute_presence(entities)
+    
+    table = get_score_table()
+    years_by_timeline = _timeline_years(entities, presence.mask)
+    
+    key = (presence.mask, years_by_timeline, table.generation)
+    cached = _contribution_cache.get(key)
+    if cached is None:
+        cached = _compute_contributions(table, presence.mask, dict(years_by_timeline))
+        _contribution_cache.put(key, cached)
+    
+    risk_score, baseline_score, contributions = cached
+    return {
+        "risk_score": risk_score,
+        "baseline_score": baseline_score,
+        "contributions": [dict(contribution) for contribution in contributions]
+    }
+
+
+def _timeline_years(entities: Mapping, mask: int) -> Tuple:
+    """
+    Exposure years for each combination of present timeline fields.
+    
+    Returns:
+        Sorted tuple of (timeline field mask, exposure years) pairs
+    """
+    timeline_bits = [FIELD_BITS[field] for field in TIMELINE_FIELDS if mask & FIELD_BITS[field]]
+    
+    years = []
+    for combination in range(1 << len(timeline_bits)):
+        timeline_mask = 0
+        kept = {}
+        for index, bit in enumerate(timeline_bits):
+            if combination >> index & 1:
+                timeline_mask |= bit
+                field = ENTITY_FIELDS[bit.bit_length() - 1]
+                kept[field] = entities.get(field)
+        years.append((timeline_mask, estimate_exposure_years(kept)))
+    
+    return tuple(sorted(years))
+
+
+def _compute_contributions(table, mask: int, years_by_timeline: Dict[int, int]) -> Tuple:
+    """
+    Exact Shapley values over all coalitions of the present fields.
+    
+    phi_i = sum(S contains i) w(|S|) v(S) - sum(S lacks i) w'(|S|) v(S)
+    
+    with w(k) = (k-1)!(n-k)!/n! and w'(k) = k!(n-k-1)!/n!. Rewriting the
+    second sum as sum(all S) w'(|S|) v(S) - sum(S contains i) w'(|S|) v(S)
+    turns it into one constant shared by every field, so a single pass
+    over the 2^n coalitions suffices, touching only the fields inside
+    each coalition.
+    
+    Returns:
+        Tuple of (risk_score, baseline_score, contributions)
+    """
+    bits = [FIELD_BITS[field] for field in ENTITY_FIELDS if mask & FIELD_BITS[field]]
+    n = len(bits)
+    timeline_mask = sum(FIELD_BITS[field] for field in TIMELINE_FIELDS)
+    
+    n_factorial = factorial(n)
+    with_weight = [0.0] + [factorial(k - 1) * factorial(n - k) / n_factorial for k in range(1, n + 1)]
+    without_weight = [factorial(k) * factorial(n - k - 1) / n_factorial for k in range(n)] + [0.0]
+    
+    # Coalition masks and sizes over the local field indexes
+    coalition_masks = [0] * (1 << n)
+    sizes = [0] * (1 << n)
+    values = [0.0] * (1 << n)
+    accumulated = [0.0] * n
+    constant = 0.0
+    
+    for coalition in range(1 << n):
+        if coalition:
+            lowest = coalition & -coalition
+            rest = coalition ^ lowest
+            coalition_masks[coalition] = coalition_masks[rest] | bits[lowest.bit_length() - 1]
+            sizes[coalition] = sizes[rest] + 1
+        
+        coalition_mask = coalition_masks[coalition]
+        size = sizes[coalition]
+        value = table.risk_score(coalition_mask, years_by_timeline[coalition_mask & timeline_mask])
+        values[coalition] = value
+        
+        constant += without_weight[size] * value
+        weighted = (with_weight[size] + without_weight[size]) * value
+        remaining = coalition
+        while remaining:
+            lowest = remaining & -remaining
+            accumulated[lowest.bit_length() - 1] += weighted
+            remaining ^= lowest
+    
+    full = (1 << n) - 1
+    contributions: List[Dict] = []
+    for index, bit in enumerate(bits):
+        contributions.append({
+            "field": ENTITY_FIELDS[bit.bit_length() - 1],
+            "shapley_value": round(accumulated[index] - constant, 2),
+            "marginal_contribution": round(values[full] - values[full ^ (1 << index)], 2)
+        })
+    
+    # Largest contribution first; ties keep extraction field order
+    contributions.sort(key=lambda contribution: -contribution["shapley_value"])
+    
+    return values[full], values[0], tuple(contributions)
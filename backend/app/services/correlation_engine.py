@@ -5,7 +5,11 @@ Loads rules from JSON and applies deterministic correlation logic.
 
 import json
 import os
-from typing import List, Dict
+from collections.abc import Mapping
+from typing import List, Dict, Optional
+
+from app.services.presence_service import EntityPresence, compute_presence, fields_mask
+from app.services.score_table import get_score_table
 
 
 def load_correlation_rules() -> List[Dict]:
@@ -32,15 +36,17 @@ def load_correlation_rules() -> List[Dict]:
     return rules_data.get("correlation_rules", [])
 
 
-def apply_correlation_rules(entities: Dict) -> Dict:
+def apply_correlation_rules(entities: Mapping, presence: Optional[EntityPresence] = None) -> Dict:
     """
     Apply correlation rules to extracted entities.
     
-    For each rule, if ALL required fields exist and are not empty,
-    create a risk entry.
+    For each rule, if ALL required fields are present (see presence_service),
+    create a risk entry. Results come from the precomputed score table
+    (see score_table), indexed by the presence mask.
     
     Args:
         entities: Dictionary of extracted entities
+        presence: Precomputed presence vector for entities (computed if omitted)
     
     Returns:
         Dictionary with inferred_risks list and inference_chains_count
@@ -48,18 +54,41 @@ def apply_correlation_rules(entities: Dict) -> Dict:
     Raises:
         ValueError: If entities is invalid
     """
-    if not isinstance(entities, dict):
+    if not isinstance(entities, Mapping):
         raise ValueError("Entities must be a dictionary")
     
     if not entities:
         raise ValueError("Entities cannot be empty")
     
-    # Load rules
-    try:
-        rules = load_correlation_rules()
-    except Exception as e:
-        raise ValueError(f"Failed to load correlation rules: {str(e)}")
+    # Rules snapshot (raises ValueError if the rules cannot be loaded)
+    table = get_score_table()
+    
+    if presence is None:
+        presence = compute_presence(entities)
+    
+    # Fresh copies so callers can annotate their risks
+    inferred_risks = [
+        {**risk, "pathway": list(risk["pathway"])}
+        for risk in table.inferred_risks(presence.mask)
+    ]
+    
+    return {
+        "inferred_risks": inferred_risks,
+        "inference_chains_count": len(inferred_risks)
+    }
+
+
+def match_correlation_rules(rules: List[Dict], presence: EntityPresence) -> List[Dict]:
+    """
+    Evaluate correlation rules against a presence vector.
     
+    Args:
+        rules: Correlation rules (see load_correlation_rules)
+        presence: Entity presence vector
+    
+    Returns:
+        Inferred risks sorted by severity (descending)
+    """
     inferred_risks = []
     
     # Apply each rule
@@ -68,45 +97,13 @@ def apply_correlation_rules(entities: Dict) -> Dict:
         if "condition" not in rule or "required_fields" not in rule["condition"]:
             continue
         
-        required_fields = rule["condition"]["required_fields"]
-        
-        # Check if all required fields exist and are not empty
-        all_fields_present = True
-        
-        for field in required_fields:
-            if field not in entities:
-                all_fields_present = False
-                break
-            
-            field_value = entities[field]
-            
-            # Handle different data types
-            if isinstance(field_value, list):
-                # For lists, check if they're not empty
-                if not field_value:
-                    all_fields_present = False
-                    break
-            elif isinstance(field_value, int):
-                # For numbers (like years_of_experience), only check if > 0
-                # (but we allow 0 as it's still a presence of data)
-                # Actually, let's check if the field exists and is not None
-                if field_value is None:
-                    all_fields_present = False
-                    break
-            elif isinstance(field_value, str):
-                # For strings, check if not empty
-                if not field_value:
-                    all_fields_present = False
-                    break
-            else:
-                # For other types, check if not None
-                if field_value is None:
-                    all_fields_present = False
-                    break
+        # Rules referencing unknown fields can never match
+        required_mask = fields_mask(rule["condition"]["required_fields"])
         
         # If all fields are present, add risk
-        if all_fields_present:
+        if required_mask is not None and presence.has_all(required_mask):
             risk = {
+                "rule_id": rule.get("rule_id"),
                 "risk_type": rule.get("risk_type", "Unknown Risk"),
                 "severity": rule.get("severity", 0),
                 "pathway": rule.get("pathway", [])
@@ -116,7 +113,4 @@ def apply_correlation_rules(entities: Dict) -> Dict:
     # Sort risks by severity (descending) for deterministic ordering
     inferred_risks.sort(key=lambda x: x["severity"], reverse=True)
     
-    return {
-        "inferred_risks": inferred_risks,
-        "inference_chains_count": len(inferred_risks)
-    }
+    return inferred_risks
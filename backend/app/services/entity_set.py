@@ -0,0 +1,181 @@
+"""
+Entity set container.
+Compact, immutable representation of extracted entities used inside the
+analysis pipeline.
+
+EntitySet stores one slot per field in presence_service.ENTITY_FIELDS and
+keeps list values as tuples, so it can be shared between pipeline stages
+and hardening variants without copying. It behaves as a read-only mapping
+and converts to and from the plain dict shape used at the API boundary.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Tuple
+import sys
+
+from app.services.presence_service import (
+    ENTITY_FIELDS,
+    FIELD_BITS,
+    FIELD_INDEX,
+    EntityPresence,
+    compute_presence
+)
+
+
+# Marks a standard field that was not a key of the source dict
+_MISSING = object()
+
+
+class EntitySet(Mapping):
+    """
+    Immutable mapping of entity field name to value.
+
+    List values are stored as tuples. `without()` returns a new set that
+    shares every untouched bucket with the original, and the presence
+    vector is computed at most once per set.
+    """
+
+    __slots__ = ("_values", "_extra", "_presence")
+
+    def __init__(
+        self,
+        values: Tuple[Any, ...],
+        extra: Tuple[Tuple[str, Any], ...] = (),
+        presence: EntityPresence = None
+    ):
+        self._values = values
+        self._extra = extra
+        self._presence = presence
+
+    @classmethod
+    def from_dict(cls, entities: Mapping) -> "EntitySet":
+        """
+        Build an EntitySet from the dict shape returned by extract_entities.
+
+        Returns the argument unchanged if it already is an EntitySet.
+
+        Raises:
+            ValueError: If entities is invalid
+        """
+        if isinstance(entities, EntitySet):
+            return entities
+        if not isinstance(entities, Mapping):
+            raise ValueError("Entities must be a dictionary")
+
+        values = [_MISSING] * len(ENTITY_FIELDS)
+        extra = []
+        for key, value in entities.items():
+            index = FIELD_INDEX.get(key)
+            if index is not None:
+                values[index] = _freeze(value)
+            else:
+                extra.append((sys.intern(str(key)), _freeze(value)))
+
+        return cls(tuple(values), tuple(extra))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to a plain dict with list values (API boundary shape)."""
+        return {key: _thaw(value) for key, value in self.items()}
+
+    @property
+    def presence(self) -> EntityPresence:
+        """Presence vector for this set, computed on first access."""
+        if self._presence is None:
+            self._presence = compute_presence(self)
+        return self._presence
+
+    def without(self, fields: Iterable[str]) -> "EntitySet":
+        """
+        Return a copy with the given fields emptied.
+
+        Lists become empty, strings become "", numbers become 0 and anything
+        else becomes None. Fields that are not keys of this set are ignored.
+        All other buckets are shared with this set.
+        """
+        values = list(self._values)
+        extra = dict(self._extra)
+        cleared_mask = 0
+        cleared_indexes = []
+
+        for field in fields:
+            index = FIELD_INDEX.get(field)
+            if index is not None:
+                if values[index] is _MISSING:
+                    continue
+                values[index] = _empty_like(values[index])
+                cleared_mask |= FIELD_BITS[field]
+                cleared_indexes.append(index)
+            elif field in extra:
+                extra[field] = _empty_like(extra[field])
+
+        presence = None
+        if self._presence is not None:
+            counts = list(self._presence.counts)
+            for index in cleared_indexes:
+                counts[index] = 0
+            presence = EntityPresence(self._presence.mask & ~cleared_mask, tuple(counts))
+
+        return EntitySet(tuple(values), tuple(extra.items()), presence)
+
+    def __getitem__(self, key: str) -> Any:
+        index = FIELD_INDEX.get(key)
+        if index is not None:
+            value = self._values[index]
+            if value is not _MISSING:
+                return value
+        else:
+            for extra_key, value in self._extra:
+                if extra_key == key:
+                    return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field, value in zip(ENTITY_FIELDS, self._values):
+            if value is not _MISSING:
+                yield field
+        for key, _ in self._extra:
+            yield key
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not _MISSING) + len(self._extra)
+
+    def __copy__(self) -> "EntitySet":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "EntitySet":
+        return self
+
+    def __repr__(self) -> str:
+        return f"EntitySet({self.to_dict()!r})"
+
+
+def presence_of(entities: Mapping) -> EntityPresence:
+    """Return the presence vector, reusing the cached one of an EntitySet."""
+    if isinstance(entities, EntitySet):
+        return entities.presence
+    return compute_presence(entities)
+
+
+def _freeze(value: Any) -> Any:
+    """Store list values as tuples."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Convert stored tuples back to lists."""
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _empty_like(value: Any) -> Any:
+    """Empty value of the same kind, used when a field is hardened away."""
+    if isinstance(value, (list, tuple)):
+        return ()
+    elif isinstance(value, str):
+        return ""
+    elif isinstance(value, (int, float)):
+        return 0
+    return None
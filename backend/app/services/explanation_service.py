@@ -3,8 +3,8 @@ Risk explanation service.
 Generates educational explanations of privacy risks using LLM.
 """
 
-from typing import Dict, List, Any
-from app.llm.langchain_client import generate_text
+from typing import Dict, Iterator, List, Any
+from app.llm.langchain_client import generate_text, stream_text
 from app.llm.explanation_prompt import get_explanation_prompt
 
 
@@ -45,6 +45,33 @@ def generate_risk_explanation(
         return _get_fallback_explanation()
 
 
+def stream_risk_explanation(
+    risk_score: float,
+    score_breakdown: Dict[str, Any],
+    inferred_risks: List[Dict[str, Any]]
+) -> Iterator[str]:
+    """
+    Stream a non-technical explanation of privacy risks as it is generated.
+    
+    Args:
+        risk_score: Overall risk score (0-100)
+        score_breakdown: Dictionary of score components
+        inferred_risks: List of inferred privacy risks
+    
+    Yields:
+        Explanation text chunks
+        Yields the fallback text if LLM fails before producing output
+    """
+    try:
+        prompt = get_explanation_prompt(risk_score, score_breakdown, inferred_risks)
+    except Exception as e:
+        print(f"Error generating risk explanation: {str(e)}")
+        yield _get_fallback_explanation()
+        return
+    
+    yield from stream_text(prompt, fallback=_get_fallback_explanation())
+
+
 def _get_fallback_explanation() -> str:
     """
     Fallback explanation when LLM is unavailable.
@@ -1,31 +1,284 @@
 """
 Heatmap visualization service.
 Pure transformation logic to convert risk scores into frontend-ready visualization data.
+
+Score breakdowns are small and discrete, so many analyses produce the same
+heatmap. Results are memoized in a bounded cache keyed by a hash of the
+canonicalized breakdown.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Optional
+import hashlib
+import json
+
+from app.core.bounded_cache import BoundedCache
+from app.core.config import settings
+
+
+_heatmap_cache = BoundedCache("heatmap", max_size=settings.HEATMAP_CACHE_SIZE)
 
 
 def generate_heatmap(score_breakdown: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate frontend-ready heatmap visualization data from risk scores.
     
+    Results are memoized by breakdown hash; a cached payload is shared
+    between callers and must not be mutated.
+    
     Args:
         score_breakdown: Dictionary with total_risk_score, components, and data_type_contributions
     
     Returns:
-        Dictionary with summary, severity_distribution, risk_category_breakdown, heatmap, and graph_data
+        Dictionary with summary, severity_distribution, risk_category_breakdown, heatmap,
+        graph_data and breakdown_hash
+    """
+    key = breakdown_hash(score_breakdown)
+    if key is not None:
+        cached = _heatmap_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    heatmap_data = _build_heatmap(score_breakdown)
+    heatmap_data["breakdown_hash"] = key
+    
+    if key is not None:
+        _heatmap_cache.put(key, heatmap_data)
+    
+    return heatmap_data
+
+
+def breakdown_hash(score_breakdown: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash a canonicalized score breakdown.
+    
+    Numbers are normalized to floats (so 20 and 20.0 hash the same) while key
+    order is kept, because it determines label order in the chart data.
+    
+    Returns:
+        Hex digest, or None if the breakdown contains non-numeric scores
+    """
+    try:
+        canonical = [
+            float(score_breakdown.get("total_risk_score", 0)),
+            [[name, float(score)] for name, score in score_breakdown.get("components", {}).items()],
+            [[name, float(score)] for name, score in score_breakdown.get("data_type_contributions", {}).items()]
+        ]
+    except (TypeError, ValueError, AttributeError):
+        return None
+    
+    return hashlib.sha256(
+        json.dumps(canonical, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def get_cached_heatmap(key: str) -> Optional[Dict[str, Any]]:
+    """Return a previously generated heatmap by breakdown hash, or None."""
+    return _heatmap_cache.get(key)
+
+
+def get_heatmap_cache_stats() -> Dict[str, int]:
+    """Return heatmap memo cache counters."""
+    return _heatmap_cache.stats()
+
+
+# Fixed histogram bins for component scores, aligned with the severity
+# thresholds in _get_severity (8 and 15). The last bin is open-ended.
+HISTOGRAM_BIN_EDGES = [0, 4, 8, 12, 15, 20, 30]
+
+
+class HeatmapAggregator:
+    """
+    Streaming aggregate of many score breakdowns.
+    
+    Each breakdown is folded in as it arrives and then discarded, so memory
+    depends only on the number of distinct components and data types, not
+    on the number of analyses.
+    """
+    
+    def __init__(self):
+        self.analysis_count = 0
+        self.total_score_sum = 0.0
+        self.total_score_min = None
+        self.total_score_max = None
+        self.risk_levels = {"Low": 0, "Moderate": 0, "High": 0}
+        self.severity_counts = {"High": 0, "Medium": 0, "Low": 0}
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.data_types: Dict[str, Dict[str, Any]] = {}
+    
+    def add(self, score_breakdown: Dict[str, Any]) -> None:
+        """Fold one score breakdown (generate_heatmap input shape) into the aggregate."""
+        total_score = float(score_breakdown.get("total_risk_score", 0))
+        
+        self.analysis_count += 1
+        self.total_score_sum += total_score
+        self.total_score_min = total_score if self.total_score_min is None else min(self.total_score_min, total_score)
+        self.total_score_max = total_score if self.total_score_max is None else max(self.total_score_max, total_score)
+        self.risk_levels[_get_risk_level(total_score)] += 1
+        
+        for name, score in score_breakdown.get("components", {}).items():
+            self._add_score(self.components, name, float(score), histogram=True)
+        
+        for name, contribution in score_breakdown.get("data_type_contributions", {}).items():
+            self._add_score(self.data_types, name, float(contribution), histogram=False)
+    
+    def _add_score(self, table: Dict[str, Dict[str, Any]], name: str, score: float, histogram: bool) -> None:
+        """Update running stats for one component or data type."""
+        stats = table.get(name)
+        if stats is None:
+            stats = {
+                "count": 0,
+                "sum": 0.0,
+                "min": score,
+                "max": score,
+                "severity_counts": {"High": 0, "Medium": 0, "Low": 0}
+            }
+            if histogram:
+                stats["histogram"] = [0] * len(HISTOGRAM_BIN_EDGES)
+            table[name] = stats
+        
+        severity = _get_severity(score)
+        stats["count"] += 1
+        stats["sum"] += score
+        stats["min"] = min(stats["min"], score)
+        stats["max"] = max(stats["max"], score)
+        stats["severity_counts"][severity] += 1
+        self.severity_counts[severity] += 1
+        
+        if histogram:
+            stats["histogram"][_histogram_bin(score)] += 1
+    
+    def result(self, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Build the aggregate heatmap payload.
+        
+        Args:
+            top_n: Number of data types to include, by total contribution
+        
+        Returns:
+            Dictionary with analysis_count, total_score, risk_level_distribution,
+            severity_distribution, component_stats and top_data_types
+        """
+        count = self.analysis_count
+        
+        component_stats = []
+        for name, stats in self.components.items():
+            component_stats.append({
+                "component": name,
+                "count": stats["count"],
+                "mean": round(stats["sum"] / stats["count"], 2),
+                "min": round(stats["min"], 2),
+                "max": round(stats["max"], 2),
+                "severity_counts": {level.lower(): n for level, n in stats["severity_counts"].items()},
+                "histogram": [
+                    {
+                        "bin_start": HISTOGRAM_BIN_EDGES[i],
+                        "bin_end": HISTOGRAM_BIN_EDGES[i + 1] if i + 1 < len(HISTOGRAM_BIN_EDGES) else None,
+                        "count": n
+                    }
+                    for i, n in enumerate(stats["histogram"])
+                ]
+            })
+        component_stats.sort(key=lambda x: x["mean"], reverse=True)
+        
+        data_types = []
+        for name, stats in self.data_types.items():
+            data_types.append({
+                "data_type": name,
+                "total_contribution": round(stats["sum"], 1),
+                "mean_contribution": round(stats["sum"] / stats["count"], 2),
+                "occurrences": stats["count"],
+                "prevalence": round((stats["count"] / count) * 100, 1) if count else 0.0,
+                "severity": _get_severity(stats["sum"] / stats["count"])
+            })
+        data_types.sort(key=lambda x: (-x["total_contribution"], x["data_type"]))
+        
+        return {
+            "analysis_count": count,
+            "total_score": {
+                "mean": round(self.total_score_sum / count, 2) if count else 0.0,
+                "min": round(self.total_score_min, 2) if count else 0.0,
+                "max": round(self.total_score_max, 2) if count else 0.0
+            },
+            "risk_level_distribution": dict(self.risk_levels),
+            "severity_distribution": _calculate_severity_distribution(self.severity_counts),
+            "component_stats": component_stats,
+            "top_data_types": data_types[:max(0, top_n)]
+        }
+
+
+def aggregate_heatmaps(score_breakdowns: Iterable[Dict[str, Any]], top_n: int = 10) -> Dict[str, Any]:
+    """
+    Aggregate many score breakdowns into an org-level heatmap.
+    
+    `score_breakdowns` is consumed lazily, one breakdown at a time, so a
+    generator reading from storage keeps memory use constant.
+    
+    Args:
+        score_breakdowns: Iterable of generate_heatmap inputs
+        top_n: Number of data types to include in top_data_types
+    
+    Returns:
+        Aggregate payload (see HeatmapAggregator.result)
     """
+    aggregator = HeatmapAggregator()
+    for score_breakdown in score_breakdowns:
+        aggregator.add(score_breakdown)
+    return aggregator.result(top_n=top_n)
+
+
+def breakdown_from_analysis(analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild a heatmap score breakdown from a comprehensive analysis result.
+    
+    Components come from risk_assessment.score_breakdown and data type
+    contributions from the visualization heatmap entries.
+    
+    Returns:
+        Score breakdown dictionary, or None if the result has no risk
+        assessment or is the fallback result of a failed analysis
+    """
+    risk_assessment = analysis.get("risk_assessment")
+    if not risk_assessment or risk_assessment.get("risk_level") == "Unknown":
+        return None
+    
+    visualization = analysis.get("visualization") or {}
+    return {
+        "total_risk_score": risk_assessment.get("risk_score", 0),
+        "components": risk_assessment.get("score_breakdown") or {},
+        "data_type_contributions": {
+            item["data_type"]: item["contribution"]
+            for item in (visualization.get("heatmap") or [])
+            if "data_type" in item and "contribution" in item
+        }
+    }
+
+
+def _histogram_bin(score: float) -> int:
+    """Index of the histogram bin containing score."""
+    index = 0
+    for i, edge in enumerate(HISTOGRAM_BIN_EDGES):
+        if score >= edge:
+            index = i
+    return index
+
+
+def _build_heatmap(score_breakdown: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the heatmap payload (uncached)."""
     
     total_score = score_breakdown.get("total_risk_score", 0)
     components = score_breakdown.get("components", {})
     data_type_contributions = score_breakdown.get("data_type_contributions", {})
     
+    # Bucket every score by severity once; summary and distribution share it
+    severity_counts = _count_severities(
+        list(components.values()) + list(data_type_contributions.values())
+    )
+    
     # Generate summary
-    summary = _generate_summary(total_score, components, data_type_contributions)
+    summary = _generate_summary(total_score, severity_counts)
     
     # Generate severity distribution
-    severity_dist = _calculate_severity_distribution(components, data_type_contributions)
+    severity_dist = _calculate_severity_distribution(severity_counts)
     
     # Generate risk category breakdown
     category_breakdown = _generate_category_breakdown(components)
@@ -85,50 +338,43 @@ def _severity_to_color(severity: str) -> str:
     return color_map.get(severity, "#888888")
 
 
+def _count_severities(all_scores: List[float]) -> Dict[str, int]:
+    """Count scores per severity level in a single pass."""
+    counts = {"High": 0, "Medium": 0, "Low": 0}
+    for score in all_scores:
+        counts[_get_severity(score)] += 1
+    return counts
+
+
 def _generate_summary(
     total_score: float,
-    components: Dict[str, float],
-    data_type_contributions: Dict[str, float]
+    severity_counts: Dict[str, int]
 ) -> Dict[str, Any]:
     """Generate summary statistics."""
     
     risk_level = _get_risk_level(total_score)
     
-    # Count severity levels across all items
-    all_scores = list(components.values()) + list(data_type_contributions.values())
-    high_count = sum(1 for score in all_scores if score >= 15)
-    medium_count = sum(1 for score in all_scores if 8 <= score < 15)
-    low_count = sum(1 for score in all_scores if score < 8)
-    
     return {
         "total_score": round(total_score, 1),
         "risk_level": risk_level,
-        "high_severity_count": high_count,
-        "medium_severity_count": medium_count,
-        "low_severity_count": low_count
+        "high_severity_count": severity_counts["High"],
+        "medium_severity_count": severity_counts["Medium"],
+        "low_severity_count": severity_counts["Low"]
     }
 
 
-def _calculate_severity_distribution(
-    components: Dict[str, float],
-    data_type_contributions: Dict[str, float]
-) -> Dict[str, float]:
+def _calculate_severity_distribution(severity_counts: Dict[str, int]) -> Dict[str, float]:
     """Calculate percentage distribution of severity levels."""
     
-    all_scores = list(components.values()) + list(data_type_contributions.values())
-    total_items = len(all_scores)
+    total_items = sum(severity_counts.values())
     
     if total_items == 0:
         return {"high": 0.0, "medium": 0.0, "low": 0.0}
     
-    high_count = sum(1 for score in all_scores if score >= 15)
-    medium_count = sum(1 for score in all_scores if 8 <= score < 15)
-    low_count = sum(1 for score in all_scores if score < 8)
-    
     return {
-        "high": round((high_count / total_items) * 100, 1),
-        "medium": round((medium_count / total_items) * 100, 1),
-        "low": round((low_count / total_items) * 100, 1)
+        "high": round((severity_counts["High"] / total_items) * 100, 1),
+        "medium": round((severity_counts["Medium"] / total_items) * 100, 1),
+        "low": round((severity_counts["Low"] / total_items) * 100, 1)
     }
 
 
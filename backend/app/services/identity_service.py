@@ -0,0 +1,497 @@
+"""
+Cross-document identity index.
+Links analyses of different documents (resume, bio, posts) that belong to
+the same person, and scores the person's combined exposure.
+
+Every indexed document contributes identity keys: normalized emails,
+phone numbers, dates of birth and (company, job title) pairs. Emails and
+phone numbers identify a person on their own; dates of birth and
+employment are shared by many people, so they only link two documents
+when two of them (e.g. a date of birth and an employment, or two
+employers) match the same document. Each link key maps to a document
+holding it, and documents sharing a link key are merged into one
+identity with a union-find structure, so linking a document costs one
+dictionary lookup and one union per key. Each identity keeps its
+documents in indexing order and its shared-key counts up to date as
+documents join; removing a document only marks its identity, which is
+re-linked when next requested. Only the extracted entities of each
+document are kept; an identity's exposure re-runs correlation and
+scoring on the union of its documents' entities, without rescanning any
+text, and is cached until the identity changes.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+import uuid
+
+from app.core.config import settings
+from app.services.entity_set import EntitySet
+from app.services.presence_service import ENTITY_FIELDS
+
+
+# Entity fields normalized into identity keys
+IDENTITY_KEY_FIELDS = ("emails", "phones", "dob")
+
+# Key kinds that link documents on their own; the other kinds (dob,
+# employment) only link documents sharing two of them
+STRONG_KEY_KINDS = ("email", "phone")
+
+# Date formats produced by extraction_service._extract_dob
+_DOB_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y")
+
+# Pipeline outputs reported as an identity's exposure
+_EXPOSURE_OUTPUTS = [
+    "risk_score", "risk_level", "score_breakdown", "inferred_risks",
+    "correlation_depth", "timeline_years", "visibility_score"
+]
+
+
+def _normalize_email(value: str) -> Optional[str]:
+    email = str(value).strip().lower()
+    return email if "@" in email else None
+
+
+def _normalize_phone(value: str) -> Optional[str]:
+    digits = re.sub(r"\D", "", str(value))
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits if len(digits) >= 7 else None
+
+
+def _normalize_dob(value: str) -> Optional[str]:
+    text = str(value).strip()
+    for date_format in _DOB_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _normalize_name(value: str) -> str:
+    return " ".join(str(value).casefold().replace(".", " ").replace(",", " ").split())
+
+
+_NORMALIZERS = {
+    "emails": _normalize_email,
+    "phones": _normalize_phone,
+    "dob": _normalize_dob
+}
+
+
+def _merge_key(field: str, value: Any) -> str:
+    """Key under which merged list values are deduplicated."""
+    normalize = _NORMALIZERS.get(field)
+    return (normalize(value) if normalize else None) or _normalize_name(value)
+
+
+def validate_entities(entities: Mapping) -> None:
+    """
+    Check every entity field of a document before it is indexed.
+
+    Raises:
+        ValueError: If a list field is not a list of strings or numbers, or
+            years_of_experience is not a non-negative integer
+    """
+    for field in ENTITY_FIELDS:
+        value = entities.get(field)
+        if value is None:
+            continue
+        if field == "years_of_experience":
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError("Entity field 'years_of_experience' must be a non-negative integer")
+        elif not isinstance(value, (list, tuple)):
+            raise ValueError(f"Entity field '{field}' must be a list")
+        elif any(isinstance(item, bool) or not isinstance(item, (str, int, float)) for item in value):
+            raise ValueError(f"Entity field '{field}' must only hold strings or numbers")
+
+
+def _field_values(entities: Mapping, field: str) -> Tuple:
+    values = entities.get(field) or ()
+    if not isinstance(values, (list, tuple)):
+        raise ValueError(f"Entity field '{field}' must be a list")
+    return values
+
+
+def identity_keys(entities: Mapping) -> List[Tuple[str, str]]:
+    """
+    Normalized identity keys of one document's entities.
+
+    Args:
+        entities: Extracted entities
+
+    Returns:
+        Sorted, deduplicated (kind, value) tuples; kind is "email",
+        "phone", "dob" or "employment" (value "company|title")
+
+    Raises:
+        ValueError: If an identity field is not a list
+    """
+    keys = set()
+    for field in IDENTITY_KEY_FIELDS:
+        normalize = _NORMALIZERS[field]
+        for value in _field_values(entities, field):
+            normalized = normalize(value)
+            if normalized:
+                keys.add((field.rstrip("s"), normalized))
+
+    titles = {_normalize_name(title) for title in _field_values(entities, "job_title")}
+    for company in _field_values(entities, "company"):
+        company_name = _normalize_name(company)
+        for title in titles:
+            if company_name and title:
+                keys.add(("employment", f"{company_name}|{title}"))
+
+    return sorted(keys)
+
+
+def link_keys(keys: List[Tuple[str, str]]) -> List[Tuple]:
+    """
+    Keys that link documents, from a document's identity keys.
+
+    Strong keys (email, phone) are used as they are. Weak keys (dob,
+    employment) are combined into ("pair", key, key) keys for every two
+    of them, so a match needs two corroborating weak keys. Two
+    employments at the same company only differ in job title and are not
+    paired.
+
+    Args:
+        keys: Sorted keys returned by identity_keys
+
+    Returns:
+        List of link keys
+    """
+    links: List[Tuple] = [key for key in keys if key[0] in STRONG_KEY_KINDS]
+    weak = [key for key in keys if key[0] not in STRONG_KEY_KINDS]
+    for index, first in enumerate(weak):
+        for second in weak[index + 1:]:
+            same_company = (
+                first[0] == second[0] == "employment"
+                and first[1].split("|", 1)[0] == second[1].split("|", 1)[0]
+            )
+            if not same_company:
+                links.append(("pair", first, second))
+    return links
+
+
+def merge_entities(entity_sets: List[Mapping]) -> Dict[str, Any]:
+    """
+    Union of several documents' entities.
+
+    List fields keep the first occurrence of every value, in document
+    order, comparing values as identity keys do (so "A@x.com" and
+    "a@x.com" are one email); years_of_experience is the maximum.
+    """
+    merged: Dict[str, Any] = {}
+    seen: Dict[str, set] = {}
+    for entities in entity_sets:
+        for field, value in entities.items():
+            if isinstance(value, (list, tuple)):
+                values = merged.setdefault(field, [])
+                keys = seen.setdefault(field, set())
+                for item in value:
+                    key = _merge_key(field, item)
+                    if key not in keys:
+                        keys.add(key)
+                        values.append(item)
+            elif field == "years_of_experience":
+                merged[field] = max(merged.get(field) or 0, value or 0)
+            elif field not in merged:
+                merged[field] = value
+    return merged
+
+
+class _Identity:
+    """State kept on a union-find root."""
+
+    __slots__ = ("members", "key_counts", "removed")
+
+    def __init__(self, node: int, keys: List[Tuple[str, str]]):
+        # Member nodes in ascending order, which is indexing order
+        self.members = [node]
+        # Identity key -> number of current members holding it
+        self.key_counts = {key: 1 for key in keys}
+        # Removed documents whose nodes are still in members
+        self.removed = 0
+
+
+class IdentityIndex:
+    """
+    In-process index of documents by identity key.
+
+    Holds at most `max_documents` documents; the oldest document is
+    dropped when the index is full. Thread-safe.
+    """
+
+    def __init__(self, max_documents: int = 100000):
+        self.max_documents = max(1, max_documents)
+        self._lock = threading.RLock()
+        # document id -> (entities, identity keys, link keys, node), in insertion order
+        self._documents: "OrderedDict[str, Tuple[EntitySet, List[Tuple[str, str]], List[Tuple], int]]" = OrderedDict()
+        # Every indexed document gets a new, increasing union-find node
+        self._next_node = 0
+        self._node_documents: Dict[int, str] = {}
+        # link key -> nodes of the documents holding it (all in one identity)
+        self._postings: Dict[Tuple, set] = {}
+        # Union-find over nodes; identity state is kept on the root
+        self._parent: Dict[int, int] = {}
+        self._identities: Dict[int, _Identity] = {}
+        # identity root -> exposure, dropped whenever the identity changes
+        self._exposure: Dict[int, Dict[str, Any]] = {}
+        self._counters = {
+            "documents_added": 0, "links": 0, "rebuilds": 0,
+            "exposure_hits": 0, "exposure_misses": 0
+        }
+
+    def _find(self, node: int) -> int:
+        root = node
+        while self._parent[root] != root:
+            root = self._parent[root]
+        # Path compression
+        while self._parent[node] != root:
+            self._parent[node], node = root, self._parent[node]
+        return root
+
+    def _union(self, first: int, second: int) -> bool:
+        """Merge the identities of two nodes; returns False if already merged."""
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return False
+        # Union by size: the smaller identity is moved
+        if len(self._identities[first].members) < len(self._identities[second].members):
+            first, second = second, first
+        self._parent[second] = first
+        target = self._identities[first]
+        moved = self._identities.pop(second)
+
+        if moved.members[0] > target.members[-1]:
+            # A newer identity joining an older one: order is kept
+            target.members.extend(moved.members)
+        else:
+            target.members.extend(moved.members)
+            target.members.sort()
+        for key, count in moved.key_counts.items():
+            target.key_counts[key] = target.key_counts.get(key, 0) + count
+        target.removed += moved.removed
+
+        self._exposure.pop(first, None)
+        self._exposure.pop(second, None)
+        return True
+
+    def _add_node(self, document_id: str, entity_set: EntitySet, keys: List[Tuple[str, str]], links: List[Tuple]) -> int:
+        """Create a node for a document and link it through its link keys."""
+        node = self._next_node
+        self._next_node += 1
+        self._documents[document_id] = (entity_set, keys, links, node)
+        self._node_documents[node] = document_id
+        self._parent[node] = node
+        self._identities[node] = _Identity(node, keys)
+
+        for key in links:
+            holders = self._postings.setdefault(key, set())
+            if holders and self._union(next(iter(holders)), node):
+                self._counters["links"] += 1
+            holders.add(node)
+        return node
+
+    def add(self, entities: Mapping, document_id: Optional[str] = None) -> str:
+        """
+        Index one document's entities and link it to matching documents.
+
+        Re-adding an existing document id replaces its entities. The
+        identity is only assembled when requested (see identity()).
+
+        Args:
+            entities: Extracted entities of the document
+            document_id: Id of the document (e.g. an analysis id);
+                generated if omitted
+
+        Returns:
+            The document id
+
+        Raises:
+            ValueError: If entities is not a dictionary or a field has the
+                wrong type (see validate_entities)
+        """
+        entity_set = EntitySet.from_dict(entities)
+        validate_entities(entity_set)
+        document_id = document_id or str(uuid.uuid4())
+        keys = identity_keys(entity_set)
+        links = link_keys(keys)
+
+        with self._lock:
+            if document_id in self._documents:
+                self._remove(document_id)
+            while len(self._documents) >= self.max_documents:
+                self._remove(next(iter(self._documents)))
+
+            self._counters["documents_added"] += 1
+            self._add_node(document_id, entity_set, keys, links)
+            return document_id
+
+    def _remove(self, document_id: str) -> None:
+        """
+        Drop a document from the index.
+
+        The rest of its identity may only have been linked through this
+        document. Splitting it means re-linking the whole identity, so the
+        identity is only marked; it is rebuilt when next requested, or at
+        once when removed documents make up more than half of it.
+        """
+        _, keys, links, node = self._documents.pop(document_id)
+        del self._node_documents[node]
+        for key in links:
+            holders = self._postings[key]
+            holders.discard(node)
+            if not holders:
+                del self._postings[key]
+
+        root = self._find(node)
+        identity = self._identities[root]
+        for key in keys:
+            count = identity.key_counts[key] - 1
+            if count:
+                identity.key_counts[key] = count
+            else:
+                del identity.key_counts[key]
+        identity.removed += 1
+        self._exposure.pop(root, None)
+
+        if identity.removed * 2 > len(identity.members):
+            self._rebuild(root)
+
+    def _rebuild(self, root: int) -> None:
+        """Re-link the current documents of an identity, dropping removed ones."""
+        identity = self._identities.pop(root)
+        self._exposure.pop(root, None)
+        self._counters["rebuilds"] += 1
+        for node in identity.members:
+            del self._parent[node]
+
+        first_holders: Dict[Tuple, int] = {}
+        for node in identity.members:
+            document_id = self._node_documents.get(node)
+            if document_id is None:
+                continue
+            self._parent[node] = node
+            self._identities[node] = _Identity(node, self._documents[document_id][1])
+            for key in self._documents[document_id][2]:
+                holder = first_holders.setdefault(key, node)
+                if holder != node:
+                    self._union(holder, node)
+
+    def remove(self, document_id: str) -> bool:
+        """Remove a document; returns False if it was not indexed."""
+        with self._lock:
+            if document_id not in self._documents:
+                return False
+            self._remove(document_id)
+            return True
+
+    def identity(self, document_id: str, include_exposure: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Identity containing a document.
+
+        Args:
+            document_id: Id of an indexed document
+            include_exposure: Also score the identity's merged entities
+
+        Returns:
+            Dictionary with document_id, documents (linked document ids in
+            indexing order), shared_keys (keys held by more than one
+            document) and, if requested, exposure (risk assessment of the
+            merged entities); None if the document is not indexed
+        """
+        with self._lock:
+            if document_id not in self._documents:
+                return None
+            node = self._documents[document_id][3]
+            root = self._find(node)
+            if self._identities[root].removed:
+                self._rebuild(root)
+                root = self._find(node)
+
+            state = self._identities[root]
+            identity = {
+                "document_id": document_id,
+                "documents": [self._node_documents[member] for member in state.members],
+                "shared_keys": [
+                    {"kind": kind, "value": value, "documents": count}
+                    for (kind, value), count in sorted(
+                        (key, count) for key, count in state.key_counts.items() if count > 1
+                    )
+                ]
+            }
+            if not include_exposure:
+                return identity
+
+            cached = self._exposure.get(root)
+            if cached is not None:
+                self._counters["exposure_hits"] += 1
+                identity["exposure"] = cached
+                return identity
+            self._counters["exposure_misses"] += 1
+            entity_sets = [self._documents[member][0] for member in identity["documents"]]
+            size = len(state.members)
+
+        # Scored outside the lock; stored only if the identity is unchanged
+        # (any change replaces its state, grows its members or removes one)
+        exposure = score_merged_entities(merge_entities(entity_sets))
+        with self._lock:
+            if self._identities.get(root) is state and not state.removed and len(state.members) == size:
+                self._exposure[root] = exposure
+        identity["exposure"] = exposure
+        return identity
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus current documents, link keys and identities."""
+        with self._lock:
+            return {
+                **self._counters,
+                "documents": len(self._documents),
+                "keys": len(self._postings),
+                "identities": len(self._identities),
+                "max_documents": self.max_documents
+            }
+
+
+def score_merged_entities(entities: Mapping) -> Dict[str, Any]:
+    """
+    Correlate and score a merged entity set.
+
+    Returns:
+        Dictionary with the merged entities and the same risk fields as an
+        analysis's risk_assessment
+    """
+    # Imported here: analyze_service imports most services at load time
+    from app.services.analyze_service import run_analysis_pipeline
+
+    entity_set = EntitySet.from_dict(entities)
+    values = run_analysis_pipeline(inputs={"entities": entity_set}, outputs=_EXPOSURE_OUTPUTS)
+    return {
+        "entities": entity_set.to_dict(),
+        "risk_score": round(values["risk_score"], 2),
+        "risk_level": values["risk_level"],
+        "score_breakdown": values["score_breakdown"],
+        "inferred_risks": values["inferred_risks"],
+        "correlation_depth": round(values["correlation_depth"], 2),
+        "timeline_years": round(values["timeline_years"], 2),
+        "visibility_score": round(values["visibility_score"], 2)
+    }
+
+
+_identity_index = IdentityIndex(settings.IDENTITY_INDEX_MAX_DOCUMENTS)
+
+
+def get_identity_index() -> IdentityIndex:
+    """Return the process-wide identity index."""
+    return _identity_index
+
+
+def get_identity_index_stats() -> Dict[str, int]:
+    """Return identity index counters and sizes."""
+    return _identity_index.stats()
@@ -0,0 +1,296 @@
+"""
+Incremental re-analysis service.
+Re-analyzes edited versions of a document, extracting only the parts of
+the text that changed since the previous version.
+
+Normalized text is a single line (ingestion collapses all whitespace),
+and no extraction pattern can match across a comma: the line-based
+extractors (college, company, certifications) split on commas and the
+regex extractors never match one. Entities of the whole text are
+therefore exactly the merge of the entities of its comma-separated
+pieces. Segments are runs of pieces cut at content-defined boundaries
+(a piece whose hash hits the boundary modulus), so an edit only changes
+the segments it touches. Per-segment extraction results are cached by
+segment hash, and each analysis is compared with the previous version
+of the same document.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import threading
+import uuid
+import zlib
+
+from app.core.bounded_cache import BoundedCache
+from app.core.config import settings
+from app.services.analyze_service import resolve_analysis_stages, run_entity_analysis
+from app.services.extraction_service import extract_entities
+from app.services.ingestion_service import normalize_text
+
+
+# A piece ends a segment when its CRC32 is a multiple of this (4 pieces
+# per segment on average), or when the segment reaches SEGMENT_MAX_CHARS
+SEGMENT_BOUNDARY_MODULUS = 4
+SEGMENT_MAX_CHARS = 2048
+
+# How extract_entities deduplicates each field, for merging segments
+_UNORDERED_FIELDS = ("emails", "phones", "dob", "college", "company", "job_title", "location", "certifications")
+_SORTED_FIELDS = ("graduation_year", "family_mentions", "skills")
+
+# Score fields compared between versions
+_SCORE_FIELDS = ("risk_score", "risk_level", "correlation_depth", "timeline_years", "visibility_score")
+
+_segment_cache = BoundedCache("extraction_segments", settings.SEGMENT_CACHE_SIZE)
+_document_versions = BoundedCache("document_versions", settings.DOCUMENT_VERSION_CACHE_SIZE)
+_versions_lock = threading.Lock()
+
+
+def split_segments(normalized_text: str) -> List[str]:
+    """
+    Split normalized text into stable, comma-aligned segments.
+
+    ",".join(segments) reconstructs the text. Boundaries depend only on
+    the content of nearby pieces, so editing one part of the text leaves
+    the other segments unchanged.
+
+    Args:
+        normalized_text: Text returned by normalize_text
+
+    Returns:
+        List of segments
+    """
+    segments = []
+    current: List[str] = []
+    size = 0
+
+    for piece in normalized_text.split(","):
+        current.append(piece)
+        size += len(piece) + 1
+        if zlib.crc32(piece.encode("utf-8")) % SEGMENT_BOUNDARY_MODULUS == 0 or size >= SEGMENT_MAX_CHARS:
+            segments.append(",".join(current))
+            current = []
+            size = 0
+
+    if current:
+        segments.append(",".join(current))
+    return segments
+
+
+def _segment_digest(segment: str) -> str:
+    return hashlib.blake2b(segment.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _extract_segment(segment: str, digest: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Extract one segment, from the cache if possible.
+
+    Returns:
+        Tuple of (entities, whether it was cached)
+    """
+    # Graduation years are capped at the current year
+    key = (digest, datetime.now().year)
+    cached = _segment_cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    entities = extract_entities(segment) if segment.strip() else {}
+    _segment_cache.put(key, entities)
+    return entities, False
+
+
+def merge_segment_entities(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-segment extraction results into whole-text entities.
+
+    Deduplicates each field the way extract_entities does, so the result
+    matches extracting the whole text at once.
+    """
+    values: Dict[str, set] = {field: set() for field in _UNORDERED_FIELDS + _SORTED_FIELDS}
+    years_of_experience = 0
+
+    for part in parts:
+        for field, field_values in values.items():
+            field_values.update(part.get(field, ()))
+        years_of_experience = max(years_of_experience, part.get("years_of_experience", 0))
+
+    return {
+        "emails": list(values["emails"]),
+        "phones": list(values["phones"]),
+        "dob": list(values["dob"]),
+        "graduation_year": sorted(values["graduation_year"]),
+        "college": list(values["college"]),
+        "company": list(values["company"]),
+        "job_title": list(values["job_title"]),
+        "location": list(values["location"]),
+        "family_mentions": sorted(values["family_mentions"]),
+        "skills": sorted(values["skills"]),
+        "certifications": list(values["certifications"]),
+        "years_of_experience": years_of_experience
+    }
+
+
+def extract_entities_incremental(normalized_text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Extract entities segment by segment, reusing cached segments.
+
+    Args:
+        normalized_text: Text returned by normalize_text
+
+    Returns:
+        Tuple of (entities, segment stats with total, reused, extracted
+        and the segment hashes in order)
+
+    Raises:
+        ValueError: If text is empty
+    """
+    if not normalized_text or not normalized_text.strip():
+        raise ValueError("Text cannot be empty")
+
+    parts = []
+    digests = []
+    reused = 0
+    for segment in split_segments(normalized_text):
+        digest = _segment_digest(segment)
+        entities, cached = _extract_segment(segment, digest)
+        parts.append(entities)
+        digests.append(digest)
+        reused += cached
+
+    return merge_segment_entities(parts), {
+        "segments_total": len(digests),
+        "segments_reused": reused,
+        "segments_extracted": len(digests) - reused,
+        "segment_hashes": digests
+    }
+
+
+def diff_entities(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare two entity dicts field by field.
+
+    Returns:
+        {field: {"added": [...], "removed": [...]}} for changed list fields
+        and {field: {"previous": x, "current": y}} for changed scalars
+    """
+    diff = {}
+    for field in dict.fromkeys(list(previous) + list(current)):
+        before = previous.get(field)
+        after = current.get(field)
+        if isinstance(before, list) or isinstance(after, list):
+            before_set = set(before or [])
+            after_set = set(after or [])
+            if before_set != after_set:
+                diff[field] = {
+                    "added": sorted(after_set - before_set, key=str),
+                    "removed": sorted(before_set - after_set, key=str)
+                }
+        elif before != after:
+            diff[field] = {"previous": before, "current": after}
+    return diff
+
+
+def _diff_scores(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare risk assessments of two versions."""
+    diff = {}
+    for field in _SCORE_FIELDS:
+        before, after = previous.get(field), current.get(field)
+        if before == after:
+            continue
+        change = {"previous": before, "current": after}
+        if isinstance(before, (int, float)) and isinstance(after, (int, float)):
+            change["delta"] = round(after - before, 2)
+        diff[field] = change
+
+    breakdown_before = previous.get("score_breakdown") or {}
+    breakdown_after = current.get("score_breakdown") or {}
+    breakdown = {
+        key: round(breakdown_after.get(key, 0) - breakdown_before.get(key, 0), 2)
+        for key in dict.fromkeys(list(breakdown_before) + list(breakdown_after))
+        if breakdown_after.get(key, 0) != breakdown_before.get(key, 0)
+    }
+    if breakdown:
+        diff["score_breakdown"] = breakdown
+    return diff
+
+
+def run_incremental_analysis(
+    content: str,
+    document_id: Optional[str] = None,
+    persona: Optional[str] = None,
+    simulate_hardening: bool = False,
+    fields_to_remove: Optional[List[str]] = None,
+    profile: Optional[str] = None,
+    stages: Optional[List[str]] = None,
+    combined_llm: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Analyze a new version of a text document.
+
+    Only segments not seen before are extracted; the rest of the pipeline
+    runs on the merged entities. The result has the same shape as
+    run_comprehensive_analysis plus an "incremental" section with the
+    document id, version number, segment reuse counts and the entity and
+    score diff against the previous version (None for the first version).
+
+    Args:
+        content: Full text of the new version
+        document_id: Id of the document being edited (a new id is
+            generated if omitted)
+        (other arguments as in run_comprehensive_analysis)
+
+    Returns:
+        Dictionary with complete analysis results and "incremental"
+
+    Raises:
+        ValueError: If the text is empty or the profile or stage names
+            are invalid
+    """
+    resolve_analysis_stages(profile, stages)
+    normalized_text = normalize_text(content)
+    entities, segment_stats = extract_entities_incremental(normalized_text)
+
+    result = run_entity_analysis(
+        entities,
+        persona=persona,
+        simulate_hardening=simulate_hardening,
+        fields_to_remove=fields_to_remove,
+        profile=profile,
+        stages=stages,
+        combined_llm=combined_llm,
+        input_type="text",
+        normalized_text=normalized_text
+    )
+
+    document_id = document_id or str(uuid.uuid4())
+    risk_assessment = result["risk_assessment"]
+    snapshot = {
+        "entities": result["entities"],
+        "risk_assessment": {field: risk_assessment.get(field) for field in _SCORE_FIELDS + ("score_breakdown",)},
+        "segment_hashes": segment_stats["segment_hashes"]
+    }
+
+    with _versions_lock:
+        previous = _document_versions.get(document_id)
+        version = previous["version"] + 1 if previous else 1
+        _document_versions.put(document_id, {**snapshot, "version": version})
+
+    diff = None
+    if previous:
+        previous_hashes = set(previous["segment_hashes"])
+        diff = {
+            "previous_version": previous["version"],
+            "segments_changed": sum(1 for digest in segment_stats["segment_hashes"] if digest not in previous_hashes),
+            "entities": diff_entities(previous["entities"], result["entities"]),
+            "risk_assessment": _diff_scores(previous["risk_assessment"], snapshot["risk_assessment"])
+        }
+
+    result["incremental"] = {
+        "document_id": document_id,
+        "version": version,
+        "segments_total": segment_stats["segments_total"],
+        "segments_reused": segment_stats["segments_reused"],
+        "segments_extracted": segment_stats["segments_extracted"],
+        "diff": diff
+    }
+    return result
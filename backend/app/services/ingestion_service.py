@@ -1,11 +1,13 @@
 """
 Ingestion service for text normalization and PDF processing.
 Stateless, in-memory processing only.
+
+pypdf is imported lazily inside extract_text_from_pdf so text-only
+callers do not load the PDF stack.
 """
 
 import re
 from io import BytesIO
-from pypdf import PdfReader
 
 
 def normalize_text(text: str) -> str:
@@ -59,6 +61,8 @@ def extract_text_from_pdf(file_content: bytes) -> str:
         raise ValueError("File content cannot be empty")
     
     try:
+        from pypdf import PdfReader
+        
         pdf_file = BytesIO(file_content)
         reader = PdfReader(pdf_file)
         
@@ -0,0 +1,349 @@
+"""
+Background job queue service.
+SQLite-backed persistent queue with a worker pool and priority lanes for
+long-running analyses.
+"""
+
+from typing import Dict, Any, Optional, List
+import json
+import sqlite3
+import threading
+import time
+import urllib.request
+import uuid
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+
+# Priority lanes, lower value is served first
+JOB_LANES = {
+    "interactive": 0,
+    "bulk": 1
+}
+
+DEFAULT_LANE = "interactive"
+
+JOB_STATUSES = ["queued", "running", "completed", "failed"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    file_bytes BLOB,
+    callback_url TEXT,
+    analysis_id TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_dequeue ON jobs (status, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_analysis ON jobs (analysis_id);
+"""
+
+
+def validate_callback_url(callback_url: str) -> None:
+    """
+    Validate a webhook callback URL.
+
+    Only http(s) URLs pointing at hosts in WEBHOOK_ALLOWED_HOSTS are accepted,
+    so callbacks stay on the local network.
+
+    Raises:
+        ValueError: If the URL is not allowed
+    """
+    parsed = urlparse(callback_url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("callback_url must be an http(s) URL")
+
+    if parsed.hostname not in settings.WEBHOOK_ALLOWED_HOSTS:
+        raise ValueError(
+            f"callback_url host must be one of: {', '.join(settings.WEBHOOK_ALLOWED_HOSTS)}"
+        )
+
+
+class JobQueue:
+    """
+    Persistent job queue backed by SQLite.
+
+    Jobs survive restarts: anything still marked running when the queue
+    starts is put back in the queue. Workers take the oldest job from the
+    highest-priority lane. The first `interactive_reserved` workers only
+    serve the interactive lane, so bulk submissions cannot starve it.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        worker_count: int = 2,
+        interactive_reserved: int = 1
+    ):
+        self.db_path = db_path
+        self.worker_count = max(1, worker_count)
+        self.interactive_reserved = min(max(0, interactive_reserved), self.worker_count)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._stopping = threading.Event()
+
+        # Requeue jobs interrupted by a previous shutdown
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'"
+            )
+
+    def start(self) -> None:
+        """Start worker threads (no-op if already running)."""
+        if self._workers:
+            return
+
+        for index in range(self.worker_count):
+            lanes = ["interactive"] if index < self.interactive_reserved else list(JOB_LANES.keys())
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(lanes,),
+                name=f"job-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal workers to stop and wait for them to exit."""
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        file_bytes: Optional[bytes] = None,
+        lane: str = DEFAULT_LANE,
+        callback_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Job kind ('analyze_text' or 'analyze_pdf')
+            payload: JSON-serializable analysis options
+            file_bytes: Optional binary input (PDF bytes)
+            lane: Priority lane name from JOB_LANES
+            callback_url: Optional webhook URL notified on completion
+
+        Returns:
+            Job status dictionary
+
+        Raises:
+            ValueError: If lane or callback_url is invalid
+        """
+        if lane not in JOB_LANES:
+            raise ValueError(f"lane must be one of: {', '.join(JOB_LANES.keys())}")
+        if callback_url:
+            validate_callback_url(callback_url)
+
+        job_id = str(uuid.uuid4())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, lane, priority, status, payload, file_bytes, "
+                "callback_url, created_at) VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, kind, lane, JOB_LANES[lane], json.dumps(payload), file_bytes,
+                 callback_url, time.time())
+            )
+
+        self.start()
+        with self._wakeup:
+            # Wake every worker: the first one woken may not serve this lane
+            self._wakeup.notify_all()
+
+        return self.get(job_id)
+
+    def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """Return job status (and result when completed), or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, kind, lane, status, analysis_id, result, error, created_at, "
+                "started_at, finished_at FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+            position = None
+            if row and row["status"] == "queued":
+                position = self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND "
+                    "(priority < ? OR (priority = ? AND created_at < ?))",
+                    (JOB_LANES[row["lane"]], JOB_LANES[row["lane"]], row["created_at"])
+                ).fetchone()[0]
+
+        if row is None:
+            return None
+
+        return {
+            "job_id": row["job_id"],
+            "kind": row["kind"],
+            "lane": row["lane"],
+            "status": row["status"],
+            "queue_position": position,
+            "analysis_id": row["analysis_id"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+            "error": row["error"],
+            "result": json.loads(row["result"]) if include_result and row["result"] else None
+        }
+
+    def get_analysis_result(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result of a completed job by analysis id, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM jobs WHERE analysis_id = ? AND status = 'completed' LIMIT 1",
+                (analysis_id,)
+            ).fetchone()
+
+        if row is None or not row["result"]:
+            return None
+        return json.loads(row["result"])
+
+    def _claim_next(self, lanes: List[str]) -> Optional[sqlite3.Row]:
+        """Atomically claim the next queued job from the given lanes."""
+        placeholders = ", ".join("?" for _ in lanes)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT job_id, kind, payload, file_bytes, callback_url FROM jobs "
+                f"WHERE status = 'queued' AND lane IN ({placeholders}) "
+                f"ORDER BY priority, created_at LIMIT 1",
+                lanes
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ? WHERE job_id = ?",
+                (time.time(), row["job_id"])
+            )
+        return row
+
+    def _finish(self, job_id: str, result: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        """Record the outcome of a job."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, analysis_id = ?, "
+                "file_bytes = NULL, finished_at = ? WHERE job_id = ?",
+                (
+                    "failed" if error else "completed",
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    result.get("analysis_id") if result else None,
+                    time.time(),
+                    job_id
+                )
+            )
+
+    def _worker_loop(self, lanes: List[str]) -> None:
+        """Process jobs until stopped."""
+        while not self._stopping.is_set():
+            row = self._claim_next(lanes)
+            if row is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=settings.JOB_POLL_INTERVAL)
+                continue
+
+            job_id = row["job_id"]
+            print(f"[JOB {job_id}] Started ({row['kind']})")
+            result, error = None, None
+            try:
+                result = _execute_job(row["kind"], json.loads(row["payload"]), row["file_bytes"])
+            except Exception as e:
+                error = str(e)
+                print(f"[JOB {job_id}] Failed: {error}")
+
+            try:
+                self._finish(job_id, result, error)
+            except Exception as e:
+                # E.g. a result that cannot be serialized; the job must not
+                # stay running, and the worker must keep going
+                print(f"[JOB {job_id}] Failed to record result: {str(e)}")
+                try:
+                    self._finish(job_id, None, f"Failed to record result: {str(e)}")
+                except Exception as e:
+                    print(f"[JOB {job_id}] Failed to record failure: {str(e)}")
+                    continue
+            print(f"[JOB {job_id}] Finished")
+
+            if row["callback_url"]:
+                _send_webhook(row["callback_url"], self.get(job_id))
+
+
+def _execute_job(kind: str, payload: Dict[str, Any], file_bytes: Optional[bytes]) -> Dict[str, Any]:
+    """
+    Run the analysis for a job.
+
+    Raises:
+        ValueError: If the job kind is unknown or the analysis failed
+    """
+    # Imported here to avoid a circular import with the analysis pipeline
+    from app.services.analyze_service import run_comprehensive_analysis
+
+    if kind == "analyze_text":
+        result = run_comprehensive_analysis(input_type="text", file_bytes=None, **payload)
+    elif kind == "analyze_pdf":
+        result = run_comprehensive_analysis(input_type="pdf", content=None, file_bytes=file_bytes, **payload)
+    else:
+        raise ValueError(f"Unknown job kind: {kind}")
+
+    if result["risk_assessment"]["risk_level"] == "Unknown":
+        # run_comprehensive_analysis reports failures as a fallback result
+        raise ValueError("Document could not be analyzed (empty or unreadable)")
+    return result
+
+
+def _send_webhook(callback_url: str, job: Dict[str, Any]) -> None:
+    """POST the finished job to its callback URL (failures are logged only)."""
+    try:
+        request = urllib.request.Request(
+            callback_url,
+            data=json.dumps(job).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=settings.WEBHOOK_TIMEOUT):
+            pass
+    except Exception as e:
+        print(f"[WARNING] Webhook to {callback_url} failed: {str(e)}")
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, creating it on first use."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(
+                db_path=settings.JOB_DB_PATH,
+                worker_count=settings.JOB_WORKERS,
+                interactive_reserved=settings.JOB_INTERACTIVE_RESERVED
+            )
+            _job_queue.start()
+    return _job_queue
+
+
+def shutdown_job_queue() -> None:
+    """Stop the process-wide job queue's workers, if it was created."""
+    with _job_queue_lock:
+        if _job_queue is not None:
+            _job_queue.stop()
@@ -3,7 +3,9 @@ Persona simulation service.
 Generates attack strategy narratives from different attacker perspectives.
 """
 
-from app.llm.langchain_client import generate_text
+from typing import Iterator
+
+from app.llm.langchain_client import generate_text, stream_text
 from app.llm.persona_prompts import get_persona_prompt
 
 
@@ -24,6 +26,40 @@ def generate_persona_narrative(persona: str, analysis_summary: dict) -> dict:
     Raises:
         ValueError: If persona type is invalid
     """
+    prompt = _build_persona_prompt(persona, analysis_summary)
+    
+    # Generate narrative using LLM (with fallback to empty string)
+    narrative = generate_text(prompt)
+    
+    return {
+        "persona": persona,
+        "narrative": narrative
+    }
+
+
+def stream_persona_narrative(persona: str, analysis_summary: dict) -> Iterator[str]:
+    """
+    Stream a persona-based attack narrative as it is generated.
+    
+    The persona is validated before streaming starts. Nothing is streamed
+    on LLM failure, matching the empty narrative of generate_persona_narrative.
+    
+    Args:
+        persona: Type of attacker ("script_kiddie", "professional_scammer", "corporate_spy")
+        analysis_summary: Dictionary with entities, attack_vectors, risk_score
+    
+    Returns:
+        Iterator of narrative text chunks
+    
+    Raises:
+        ValueError: If persona type is invalid
+    """
+    prompt = _build_persona_prompt(persona, analysis_summary)
+    return stream_text(prompt)
+
+
+def _build_persona_prompt(persona: str, analysis_summary: dict) -> str:
+    """Validate the persona type and build its prompt."""
     # Validate persona type
     valid_personas = ["script_kiddie", "professional_scammer", "corporate_spy"]
     if persona not in valid_personas:
@@ -31,14 +67,6 @@ def generate_persona_narrative(persona: str, analysis_summary: dict) -> dict:
     
     # Get the appropriate prompt
     try:
-        prompt = get_persona_prompt(persona, analysis_summary)
+        return get_persona_prompt(persona, analysis_summary)
     except ValueError as e:
         raise ValueError(str(e))
-    
-    # Generate narrative using LLM (with fallback to empty string)
-    narrative = generate_text(prompt)
-    
-    return {
-        "persona": persona,
-        "narrative": narrative
-    }
@@ -4,7 +4,9 @@ Creates realistic phishing simulations for educational security awareness traini
 """
 
 import re
-from app.llm.langchain_client import generate_text
+from collections.abc import Mapping
+from typing import Iterator
+from app.llm.langchain_client import generate_text, stream_text
 from app.llm.phishing_prompt import get_phishing_email_prompt
 
 
@@ -29,7 +31,7 @@ def generate_phishing_email(entities: dict) -> dict:
         - Returns safe fallback if LLM fails
         - Always includes educational disclaimer
     """
-    if not isinstance(entities, dict):
+    if not isinstance(entities, Mapping):
         return _get_fallback_response()
     
     try:
@@ -61,6 +63,35 @@ def generate_phishing_email(entities: dict) -> dict:
         return _get_fallback_response()
 
 
+def stream_phishing_email(entities: dict) -> Iterator[str]:
+    """
+    Stream an educational phishing email simulation as it is generated.
+    
+    Streams the raw "Email Subject: ... Email Body: ..." text, followed by
+    the educational disclaimer. The fallback example is streamed in the
+    same format if the LLM fails before producing output.
+    
+    Args:
+        entities: Extracted entity dictionary with company, role, location, etc.
+    
+    Yields:
+        Email text chunks, always ending with the disclaimer
+    """
+    fallback = f"Email Subject: {FALLBACK_SUBJECT}\nEmail Body:\n{FALLBACK_BODY}"
+    
+    try:
+        prompt = get_phishing_email_prompt(entities) if isinstance(entities, Mapping) else None
+    except Exception:
+        prompt = None
+    
+    if prompt:
+        yield from stream_text(prompt, fallback=fallback)
+    else:
+        yield fallback
+    
+    yield f"\n\n{DISCLAIMER}"
+
+
 def _parse_phishing_email(generated_text: str) -> tuple:
     """
     Parse generated text to extract subject and body.
@@ -0,0 +1,211 @@
+"""
+Pipeline executor service.
+Runs a DAG of named stages with declared inputs and outputs.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import time
+
+
+class Stage:
+    """
+    A named pipeline stage.
+
+    The stage function is called with its declared inputs as keyword
+    arguments. A stage with a single output returns the value directly;
+    a stage with several outputs returns a dict keyed by output name.
+
+    Safe-fail stages never abort the pipeline: on error or timeout their
+    outputs are set to `defaults` instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: List[str],
+        outputs: List[str],
+        description: str = "",
+        timeout: Optional[float] = None,
+        safe_fail: bool = False,
+        defaults: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.description = description or name
+        self.timeout = timeout
+        self.safe_fail = safe_fail
+        self.defaults = defaults or {}
+
+    def run(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the stage function and map its return value onto the outputs."""
+        result = self.func(**{name: values[name] for name in self.inputs})
+        if len(self.outputs) == 1:
+            return {self.outputs[0]: result}
+        return {name: result.get(name) for name in self.outputs}
+
+    def default_outputs(self) -> Dict[str, Any]:
+        """Outputs used when a safe-fail stage errors or times out."""
+        return {name: self.defaults.get(name) for name in self.outputs}
+
+
+class PipelineExecutor:
+    """
+    Executes a DAG of stages, running independent stages concurrently.
+
+    Each output is computed at most once per run; values passed in as
+    initial inputs are treated as already computed, so callers can supply
+    shared intermediate results and skip the stages that produce them.
+    """
+
+    def __init__(self, stages: Iterable[Stage], max_workers: int = 4):
+        self.stages: Dict[str, Stage] = {}
+        self.producers: Dict[str, Stage] = {}
+        self.max_workers = max_workers
+
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(
+                        f"Output '{output}' produced by both "
+                        f"'{self.producers[output].name}' and '{stage.name}'"
+                    )
+                self.producers[output] = stage
+            self.stages[stage.name] = stage
+
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if stage inputs form a cycle."""
+        visiting, done = set(), set()
+
+        def visit(stage: Stage) -> None:
+            if stage.name in done:
+                return
+            if stage.name in visiting:
+                raise ValueError(f"Cycle detected at stage: {stage.name}")
+            visiting.add(stage.name)
+            for name in stage.inputs:
+                if name in self.producers:
+                    visit(self.producers[name])
+            visiting.discard(stage.name)
+            done.add(stage.name)
+
+        for stage in self.stages.values():
+            visit(stage)
+
+    def plan(self, outputs: List[str], available: Iterable[str] = ()) -> List[Stage]:
+        """
+        Return the stages needed to produce `outputs`, pruning everything else.
+
+        Args:
+            outputs: Output names the caller wants
+            available: Names already known (initial inputs or memoized values)
+
+        Returns:
+            Required stages in dependency order
+
+        Raises:
+            ValueError: If an output or input has no producer and is not available
+        """
+        available = set(available)
+        ordered: List[Stage] = []
+        seen = set()
+
+        def require(name: str) -> None:
+            if name in available:
+                return
+            if name not in self.producers:
+                raise ValueError(f"No stage produces '{name}' and it was not provided")
+            stage = self.producers[name]
+            if stage.name in seen:
+                return
+            seen.add(stage.name)
+            for input_name in stage.inputs:
+                require(input_name)
+            ordered.append(stage)
+
+        for name in outputs:
+            require(name)
+
+        return ordered
+
+    def run(
+        self,
+        inputs: Dict[str, Any],
+        outputs: List[str],
+        timeouts: Optional[Dict[str, float]] = None,
+        log_prefix: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Run the stages needed for `outputs`.
+
+        Args:
+            inputs: Initial values (and any precomputed intermediate results)
+            outputs: Output names to compute
+            timeouts: Optional per-stage timeout overrides in seconds
+            log_prefix: Prefix for progress log lines
+
+        Returns:
+            Dictionary with the initial inputs plus every computed output
+
+        Raises:
+            TimeoutError: If a stage that is not safe-fail exceeds its timeout
+            Exception: Any error raised by a stage that is not safe-fail
+        """
+        values = dict(inputs)
+        pending = self.plan(outputs, values.keys())
+        timeouts = timeouts or {}
+
+        if not pending:
+            return values
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        running = {}
+
+        try:
+            while pending or running:
+                # Submit every stage whose inputs are ready
+                for stage in list(pending):
+                    if all(name in values for name in stage.inputs):
+                        pending.remove(stage)
+                        if log_prefix:
+                            print(f"{log_prefix} {stage.description}...")
+                        timeout = timeouts.get(stage.name, stage.timeout)
+                        deadline = time.monotonic() + timeout if timeout else None
+                        stage_inputs = {name: values[name] for name in stage.inputs}
+                        running[pool.submit(stage.run, stage_inputs)] = (stage, deadline)
+
+                deadlines = [d for _, d in running.values() if d is not None]
+                wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait(running.keys(), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, _ = running.pop(future)
+                    try:
+                        values.update(future.result())
+                    except Exception as e:
+                        if not stage.safe_fail:
+                            raise
+                        print(f"[WARNING] Stage '{stage.name}' failed: {str(e)}")
+                        values.update(stage.default_outputs())
+
+                # Expire stages that ran past their deadline
+                now = time.monotonic()
+                for future, (stage, deadline) in list(running.items()):
+                    if deadline is not None and now >= deadline and not future.done():
+                        running.pop(future)
+                        if not stage.safe_fail:
+                            raise TimeoutError(f"Stage '{stage.name}' timed out")
+                        print(f"[WARNING] Stage '{stage.name}' timed out")
+                        values.update(stage.default_outputs())
+        finally:
+            # Do not block on stages abandoned after a timeout
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return values
@@ -0,0 +1,132 @@
+"""
+Entity presence service.
+Computes a compact presence/cardinality vector for extracted entities.
+
+The presence vector is computed once after extraction and shared by the
+correlation engine, visibility service, scoring engine and attack vector
+service, so every stage uses the same definition of "field is present".
+"""
+
+from collections.abc import Mapping
+from typing import Iterable, Optional, Tuple
+
+
+# Entity fields produced by extraction_service, in bit order
+ENTITY_FIELDS = (
+    "emails",
+    "phones",
+    "dob",
+    "graduation_year",
+    "college",
+    "company",
+    "job_title",
+    "location",
+    "family_mentions",
+    "skills",
+    "certifications",
+    "years_of_experience"
+)
+
+FIELD_INDEX = {field: index for index, field in enumerate(ENTITY_FIELDS)}
+
+FIELD_BITS = {field: 1 << index for index, field in enumerate(ENTITY_FIELDS)}
+
+
+class EntityPresence:
+    """
+    Presence bitmask plus per-field counts for one entity set.
+
+    A field is present when its count is greater than zero:
+    - list/tuple: number of items
+    - str: 1 if not empty
+    - int/float: 1 if greater than zero
+    - anything else: 1 if not None
+
+    Fields outside ENTITY_FIELDS are never present.
+    """
+
+    __slots__ = ("mask", "counts")
+
+    def __init__(self, mask: int, counts: Tuple[int, ...]):
+        self.mask = mask
+        self.counts = counts
+
+    def has(self, field: str) -> bool:
+        """Check if a single field is present."""
+        bit = FIELD_BITS.get(field)
+        return bit is not None and bool(self.mask & bit)
+
+    def has_all(self, required_mask: int) -> bool:
+        """Check if every field in a mask (see fields_mask) is present."""
+        return self.mask & required_mask == required_mask
+
+    def count(self, field: str) -> int:
+        """Return the cardinality of a field (0 if absent or unknown)."""
+        index = FIELD_INDEX.get(field)
+        return self.counts[index] if index is not None else 0
+
+    def present_fields(self) -> list:
+        """Return present field names in ENTITY_FIELDS order."""
+        return [field for field in ENTITY_FIELDS if self.mask & FIELD_BITS[field]]
+
+    def __repr__(self) -> str:
+        return f"EntityPresence(mask={self.mask:#x}, fields={self.present_fields()})"
+
+
+def fields_mask(fields: Iterable[str]) -> Optional[int]:
+    """
+    Build a bitmask for a set of field names.
+
+    Returns:
+        The combined mask, or None if any field is not in ENTITY_FIELDS
+        (such a set can never be fully present)
+    """
+    mask = 0
+    for field in fields:
+        bit = FIELD_BITS.get(field)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+
+def compute_presence(entities: Mapping) -> EntityPresence:
+    """
+    Compute the presence vector for an entity dictionary in one pass.
+
+    Args:
+        entities: Dictionary (or EntitySet) of extracted entities
+
+    Returns:
+        EntityPresence for the entities
+
+    Raises:
+        ValueError: If entities is invalid
+    """
+    if not isinstance(entities, Mapping):
+        raise ValueError("Entities must be a dictionary")
+
+    mask = 0
+    counts = []
+
+    for index, field in enumerate(ENTITY_FIELDS):
+        count = _field_count(entities.get(field))
+        counts.append(count)
+        if count:
+            mask |= 1 << index
+
+    return EntityPresence(mask, tuple(counts))
+
+
+def _field_count(value) -> int:
+    """Cardinality of a single entity value."""
+    if isinstance(value, (list, tuple)):
+        return len(value)
+    elif isinstance(value, bool):
+        return 1 if value else 0
+    elif isinstance(value, (int, float)):
+        return 1 if value > 0 else 0
+    elif isinstance(value, str):
+        return 1 if value else 0
+
+    return 0 if value is None else 1
@@ -0,0 +1,274 @@
+"""
+Precomputed score table.
+Deterministic scoring results for every entity presence mask.
+
+Correlation rules, correlation depth, visibility and the PII, employment
+and location score components depend only on which extraction fields are
+present, and the timeline component only on the clamped exposure years
+(0-10). The table evaluates all of them once per presence mask
+(2^12 masks x 11 timeline buckets) when the rules/weights snapshot is
+loaded, so scoring and hardening searches become lookups. The table is
+rebuilt automatically when correlation_rules.json or risk_weights.json
+changes; a snapshot that fails to load keeps the previous table in use.
+"""
+
+import itertools
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.services.presence_service import ENTITY_FIELDS, EntityPresence
+
+
+_RULES_DIR = os.path.join(os.path.dirname(__file__), "..", "rules")
+_CORRELATION_RULES_PATH = os.path.join(_RULES_DIR, "correlation_rules.json")
+_RISK_WEIGHTS_PATH = os.path.join(_RULES_DIR, "risk_weights.json")
+
+# Timeline years are clamped to 10 by the scoring engine
+MAX_TIMELINE_YEARS = 10
+TIMELINE_BUCKETS = MAX_TIMELINE_YEARS + 1
+
+MASK_COUNT = 1 << len(ENTITY_FIELDS)
+
+
+def _mask_presence(mask: int) -> EntityPresence:
+    """Presence vector with a count of 1 for every field in the mask."""
+    return EntityPresence(mask, tuple((mask >> index) & 1 for index in range(len(ENTITY_FIELDS))))
+
+
+def _same(a, b) -> bool:
+    """Equal value and type (an int and a float render differently in JSON)."""
+    return type(a) is type(b) and a == b
+
+
+def timeline_bucket(timeline_years) -> Optional[int]:
+    """
+    Map exposure years to a table bucket.
+
+    Returns:
+        Clamped years (0-10), or None for values the table does not cover
+        (non-integers and negative years)
+    """
+    if type(timeline_years) is not int or timeline_years < 0:
+        return None
+    return min(timeline_years, MAX_TIMELINE_YEARS)
+
+
+class ScoreTable:
+    """
+    Scoring results for every presence mask of one rules/weights snapshot.
+
+    Stored risk, depth and visibility values are shared between callers
+    and must be treated as read-only. `generation` increases with every
+    table built, so derived caches can key on it.
+    """
+
+    _generations = itertools.count(1)
+
+    def __init__(self, correlation_rules: List[Dict], weights: Dict):
+        # Imported here: these services look the table up themselves
+        from app.services.correlation_engine import match_correlation_rules
+        from app.services.correlation_depth_service import calculate_correlation_depth
+        from app.services.visibility_service import compute_visibility
+        from app.services.scoring_engine import (
+            build_score_result,
+            calculate_correlation_score,
+            calculate_score_components
+        )
+
+        self.generation = next(self._generations)
+        self._build_score_result = build_score_result
+        self._calculate_score_components = calculate_score_components
+        self.weights = weights
+
+        # Timeline component per bucket (independent of presence)
+        empty = _mask_presence(0)
+        self._timeline = tuple(
+            calculate_score_components(empty, 0, 0, years, 0, weights)[5]
+            for years in range(TIMELINE_BUCKETS)
+        )
+
+        self._risks: List[Tuple[Dict, ...]] = []
+        self._depth: List[Dict] = []
+        self._visibility: List[Dict] = []
+        self._components: List[Tuple] = []
+        self._scores: List[float] = []
+
+        # Share one risk dict per rule across all masks
+        shared_risks: Dict[Tuple, Dict] = {}
+
+        for mask in range(MASK_COUNT):
+            presence = _mask_presence(mask)
+
+            risks = tuple(
+                shared_risks.setdefault(
+                    (risk["rule_id"], risk["risk_type"], risk["severity"], tuple(risk["pathway"])), risk
+                )
+                for risk in match_correlation_rules(correlation_rules, presence)
+            )
+            depth = calculate_correlation_depth(list(risks))
+            visibility = compute_visibility(presence)
+            components = calculate_score_components(
+                presence,
+                calculate_correlation_score(list(risks), weights),
+                depth["correlation_depth_score"],
+                0,
+                visibility["visibility_score"],
+                weights
+            )
+
+            self._risks.append(risks)
+            self._depth.append(depth)
+            self._visibility.append(visibility)
+            self._components.append(components)
+            for bucket in range(TIMELINE_BUCKETS):
+                self._scores.append(self.score_result(mask, bucket)["risk_score"])
+
+    def inferred_risks(self, mask: int) -> Tuple[Dict, ...]:
+        """Correlation rule matches for a mask, by severity (descending)."""
+        return self._risks[mask]
+
+    def correlation_depth(self, mask: int) -> Dict:
+        """Correlation depth result for a mask's inferred risks."""
+        return self._depth[mask]
+
+    def visibility(self, mask: int) -> Dict:
+        """Visibility result for a mask."""
+        return self._visibility[mask]
+
+    def risk_score(self, mask: int, timeline_years: int) -> float:
+        """
+        Final risk score for a mask and exposure years.
+
+        Args:
+            mask: Presence mask
+            timeline_years: Estimated exposure years
+
+        Returns:
+            Risk score (0-100), as returned by calculate_risk_score
+        """
+        bucket = timeline_bucket(timeline_years)
+        if bucket is None:
+            components = self._components[mask]
+            timeline = self._calculate_score_components(
+                _mask_presence(0), 0, 0, timeline_years, 0, self.weights
+            )[5]
+            return self._build_score_result(
+                components[:5] + (timeline,) + components[6:], self.weights
+            )["risk_score"]
+        return self._scores[mask * TIMELINE_BUCKETS + bucket]
+
+    def score_result(self, mask: int, bucket: int) -> Dict:
+        """Full risk score result for a mask and timeline bucket."""
+        components = self._components[mask]
+        return self._build_score_result(
+            components[:5] + (self._timeline[bucket],) + components[6:], self.weights
+        )
+
+    def lookup_score(
+        self,
+        mask: int,
+        correlation_score: float,
+        correlation_depth: float,
+        timeline_years: int,
+        visibility_score: float
+    ) -> Optional[Dict]:
+        """
+        Return the precomputed score result if the inputs match the table.
+
+        The inputs match when the correlation component, depth and
+        visibility score equal (value and type) the ones the table derived
+        for the mask, and the exposure years fall in a bucket.
+
+        Returns:
+            Risk score result, or None if it has to be computed
+        """
+        bucket = timeline_bucket(timeline_years)
+        if bucket is None:
+            return None
+        if not (
+            _same(correlation_score, self._components[mask][1])
+            and _same(correlation_depth, self._depth[mask]["correlation_depth_score"])
+            and _same(visibility_score, self._visibility[mask]["visibility_score"])
+        ):
+            return None
+        return self.score_result(mask, bucket)
+
+
+_score_table = None
+_table_mtimes = None
+_table_lock = threading.Lock()
+
+
+def _snapshot_mtimes() -> Tuple[float, float]:
+    """Modification times of the rules and weights files (-1 if missing)."""
+    mtimes = []
+    for path in (_CORRELATION_RULES_PATH, _RISK_WEIGHTS_PATH):
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            # Missing file; _build_table reports it
+            mtimes.append(-1.0)
+    return tuple(mtimes)
+
+
+def _build_table() -> ScoreTable:
+    """Load the rules/weights snapshot and precompute the table."""
+    from app.services.correlation_engine import load_correlation_rules
+    from app.services.scoring_engine import load_risk_weights
+
+    try:
+        rules = load_correlation_rules()
+    except Exception as e:
+        raise ValueError(f"Failed to load correlation rules: {str(e)}")
+    try:
+        weights = load_risk_weights()
+    except Exception as e:
+        raise ValueError(f"Failed to load risk weights: {str(e)}")
+
+    started = time.perf_counter()
+    table = ScoreTable(rules, weights)
+    print(
+        f"[SCORE TABLE] Precomputed {MASK_COUNT} presence masks x {TIMELINE_BUCKETS} "
+        f"timeline buckets in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
+    return table
+
+
+def get_score_table() -> ScoreTable:
+    """
+    Return the score table, rebuilding it if the rules or weights changed.
+
+    If a changed snapshot cannot be loaded, the last good table stays in
+    use until the files change again.
+
+    Raises:
+        ValueError: If the rules or weights cannot be loaded and no earlier
+            table was built
+    """
+    global _score_table, _table_mtimes
+
+    mtimes = _snapshot_mtimes()
+    if _score_table is not None and mtimes == _table_mtimes:
+        return _score_table
+
+    with _table_lock:
+        if _score_table is None or mtimes != _table_mtimes:
+            try:
+                _score_table = _build_table()
+            except Exception as e:
+                if _score_table is None:
+                    raise
+                print(f"[WARNING] Failed to rebuild score table, keeping previous table: {str(e)}")
+            _table_mtimes = mtimes
+
+    return _score_table
+
+
+def reload_score_table() -> ScoreTable:
+    """Force a rebuild of the score table."""
+    global _table_mtimes
+    with _table_lock:
+        _table_mtimes = None
+    return get_score_table()
@@ -5,7 +5,11 @@ Deterministic weighted risk scoring calculation.
 
 import json
 import os
-from typing import Dict
+from collections.abc import Mapping
+from typing import Dict, Optional, Tuple
+
+from app.services.presence_service import EntityPresence, compute_presence
+from app.services.score_table import get_score_table
 
 
 def load_risk_weights() -> Dict:
@@ -33,21 +37,28 @@ def load_risk_weights() -> Dict:
 
 
 def calculate_risk_score(
-    entities: Dict,
+    entities: Mapping,
     inferred_risks: list,
     correlation_depth: int = 0,
     timeline_years: int = 0,
-    visibility_score: float = 0
+    visibility_score: float = 0,
+    presence: Optional[EntityPresence] = None
 ) -> Dict:
     """
     Calculate weighted risk score from entities and inferred risks.
     
+    When the inputs are the ones the pipeline derives from the presence
+    vector (same correlation, depth and visibility values), the result is
+    looked up in the precomputed score table (see score_table). Otherwise
+    it is computed from the cached weights snapshot.
+    
     Args:
         entities: Extracted entities dictionary
         inferred_risks: List of inferred risk objects
         correlation_depth: Depth of correlation chains
         timeline_years: Number of years exposed
         visibility_score: Visibility exposure score (0-100)
+        presence: Precomputed presence vector for entities (computed if omitted)
     
     Returns:
         Dictionary with risk_score, risk_level, and score_breakdown
@@ -55,26 +66,90 @@ def calculate_risk_score(
     Raises:
         ValueError: If inputs are invalid
     """
-    if not isinstance(entities, dict):
+    if not isinstance(entities, Mapping):
         raise ValueError("Entities must be a dictionary")
     
     if not isinstance(inferred_risks, list):
         raise ValueError("Inferred risks must be a list")
     
-    # Load weights
-    try:
-        weights = load_risk_weights()
-    except Exception as e:
-        raise ValueError(f"Failed to load risk weights: {str(e)}")
-    
-    # Calculate score components
-    pii_exposure = _calculate_pii_exposure(entities, weights)
-    correlation_score = _calculate_correlation_score(inferred_risks, weights)
-    inference_depth_score = _calculate_inference_depth_score(correlation_depth, weights)
-    employment_exposure = _calculate_employment_exposure(entities, weights)
-    location_exposure = _calculate_location_exposure(entities, weights)
-    timeline_exposure = _calculate_timeline_exposure(timeline_years, weights)
-    visibility_exposure = _calculate_visibility_exposure(visibility_score, weights)
+    # Weights snapshot (raises ValueError if the weights cannot be loaded)
+    table = get_score_table()
+    weights = table.weights
+    
+    if presence is None:
+        presence = compute_presence(entities)
+    
+    correlation_score = calculate_correlation_score(inferred_risks, weights)
+    
+    cached = table.lookup_score(
+        presence.mask, correlation_score, correlation_depth, timeline_years, visibility_score
+    )
+    if cached is not None:
+        return cached
+    
+    return build_score_result(
+        calculate_score_components(
+            presence, correlation_score, correlation_depth, timeline_years, visibility_score, weights
+        ),
+        weights
+    )
+
+
+def calculate_score_components(
+    presence: EntityPresence,
+    correlation_score: float,
+    correlation_depth: float,
+    timeline_years: int,
+    visibility_score: float,
+    weights: Dict
+) -> Tuple:
+    """
+    Calculate the seven unrounded score components.
+    
+    Args:
+        presence: Entity presence vector
+        correlation_score: Weighted correlation component
+            (see calculate_correlation_score)
+        correlation_depth: Depth of correlation chains
+        timeline_years: Number of years exposed
+        visibility_score: Visibility exposure score (0-100)
+        weights: Risk weights
+    
+    Returns:
+        Tuple of (pii, correlation, inference depth, employment, location,
+        timeline, visibility) components
+    """
+    return (
+        _calculate_pii_exposure(presence, weights),
+        correlation_score,
+        _calculate_inference_depth_score(correlation_depth, weights),
+        _calculate_employment_exposure(presence, weights),
+        _calculate_location_exposure(presence, weights),
+        _calculate_timeline_exposure(timeline_years, weights),
+        _calculate_visibility_exposure(visibility_score, weights)
+    )
+
+
+def build_score_result(components: Tuple, weights: Dict) -> Dict:
+    """
+    Sum score components into the risk score response.
+    
+    Args:
+        components: Score components (see calculate_score_components)
+        weights: Risk weights
+    
+    Returns:
+        Dictionary with risk_score, risk_level, and score_breakdown
+    """
+    (
+        pii_exposure,
+        correlation_score,
+        inference_depth_score,
+        employment_exposure,
+        location_exposure,
+        timeline_exposure,
+        visibility_exposure
+    ) = components
     
     # Sum all components
     total_score = (
@@ -109,7 +184,7 @@ def calculate_risk_score(
     }
 
 
-def _calculate_pii_exposure(entities: Dict, weights: Dict) -> float:
+def _calculate_pii_exposure(presence: EntityPresence, weights: Dict) -> float:
     """
     Calculate PII exposure score.
     For each present entity (emails, phone, dob), add weight.
@@ -118,21 +193,21 @@ def _calculate_pii_exposure(entities: Dict, weights: Dict) -> float:
     score = 0
     
     # Check emails
-    if entities.get("emails") and len(entities["emails"]) > 0:
+    if presence.has("emails"):
         score += pii_weights.get("email", 0)
     
     # Check phones
-    if entities.get("phones") and len(entities["phones"]) > 0:
+    if presence.has("phones"):
         score += pii_weights.get("phone", 0)
     
     # Check DOB
-    if entities.get("dob") and len(entities["dob"]) > 0:
+    if presence.has("dob"):
         score += pii_weights.get("dob", 0)
     
     return score
 
 
-def _calculate_correlation_score(inferred_risks: list, weights: Dict) -> float:
+def calculate_correlation_score(inferred_risks: list, weights: Dict) -> float:
     """
     Calculate correlation score.
     Sum of severities from inferred risks * correlation_weight
@@ -158,32 +233,27 @@ def _calculate_inference_depth_score(correlation_depth: int, weights: Dict) -> f
     return correlation_depth * depth_weight
 
 
-def _calculate_employment_exposure(entities: Dict, weights: Dict) -> float:
+def _calculate_employment_exposure(presence: EntityPresence, weights: Dict) -> float:
     """
     Calculate employment exposure score.
     If company + job_title present → employment_weight * 5
     """
     employment_weight = weights.get("employment_weight", 0)
     
-    has_company = entities.get("company") and len(entities["company"]) > 0
-    has_job_title = entities.get("job_title") and len(entities["job_title"]) > 0
-    
-    if has_company and has_job_title:
+    if presence.has("company") and presence.has("job_title"):
         return employment_weight * 5
     
     return 0
 
 
-def _calculate_location_exposure(entities: Dict, weights: Dict) -> float:
+def _calculate_location_exposure(presence: EntityPresence, weights: Dict) -> float:
     """
     Calculate location exposure score.
     If location present → location_weight * 5
     """
     location_weight = weights.get("location_weight", 0)
     
-    has_location = entities.get("location") and len(entities["location"]) > 0
-    
-    if has_location:
+    if presence.has("location"):
         return location_weight * 5
     
     return 0
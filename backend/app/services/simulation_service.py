@@ -2,25 +2,58 @@
 Hardening simulation service.
 Simulates risk score before and after removing sensitive fields.
 Includes LLM-powered explanation of hardening impact.
+
+Scoring is a pair of score table lookups and returns immediately with a
+deterministic templated explanation. Each simulation is registered under
+a simulation id (a hash of the removed fields and scores); the LLM
+explanation is generated only when it is fetched or streamed by that id.
 """
 
-from typing import Dict, List, Any
-import copy
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Any, Optional
+import hashlib
+import json
 
 from app.services.correlation_engine import apply_correlation_rules
 from app.services.correlation_depth_service import calculate_correlation_depth
-from app.services.timeline_service import calculate_timeline_exposure
+from app.services.timeline_service import estimate_exposure_years
 from app.services.visibility_service import calculate_visibility
 from app.services.scoring_engine import calculate_risk_score
-from app.llm.langchain_client import generate_text
+from app.services.score_table import get_score_table
+from app.services.entity_set import EntitySet, presence_of
+from app.core.bounded_cache import BoundedCache
+from app.core.config import settings
+from app.llm.langchain_client import generate_text, stream_text
 from app.llm.hardening_prompt import get_hardening_explanation_prompt
 
 
+# Simulations whose LLM explanation can still be fetched, by simulation id
+_simulations = BoundedCache("hardening_simulations", settings.HARDENING_SIMULATION_CACHE_SIZE)
+
+# Why each field matters to an attacker, used by the templated explanation
+FIELD_RISK_NOTES = {
+    "emails": "email addresses are the starting point for phishing and account takeover attempts",
+    "phones": "phone numbers enable SMS phishing, SIM swapping and account recovery abuse",
+    "dob": "a date of birth is a common identity verification answer",
+    "graduation_year": "a graduation year reveals your approximate age and education timeline",
+    "college": "your college helps attackers guess security answers and build rapport",
+    "company": "your employer lets attackers impersonate colleagues or IT support",
+    "job_title": "your job title shows which pretexts and privileges to target",
+    "location": "your location enables local scams and physical-world targeting",
+    "family_mentions": "family details are used in emotional pretexts and security questions",
+    "skills": "listed skills help attackers tailor convincing technical lures",
+    "certifications": "certifications can be used to fake credible professional contact",
+    "years_of_experience": "years of experience reveal seniority and likely access levels"
+}
+
+
 def run_hardening_simulation(
-    original_entities: Dict[str, Any],
+    original_entities: Mapping,
     remove_fields: List[str],
-    debug: bool = False
-) -> Dict[str, float]:
+    debug: bool = False,
+    original_score: Optional[float] = None,
+    explain: bool = False
+) -> Dict[str, Any]:
     """
     Simulate risk score before and after removing sensitive fields.
     
@@ -32,12 +65,18 @@ def run_hardening_simulation(
     - Scoring engine
     
     Args:
-        original_entities: Dictionary of extracted entities
+        original_entities: Dictionary (or EntitySet) of extracted entities
         remove_fields: List of field names to remove in simulation
         debug: If True, print debug information
+        original_score: Precomputed risk score of original_entities, if the
+            caller already has it (skips recomputing the original score)
+        explain: If True, wait for the LLM explanation instead of returning
+            the templated one
     
     Returns:
-        Dictionary with original_score, hardened_score, and difference
+        Dictionary with original_score, hardened_score, difference,
+        explanation, explanation_source ("template" or "llm") and
+        simulation_id
     """
     
     print("\n" + "="*60)
@@ -45,26 +84,23 @@ def run_hardening_simulation(
     print("="*60)
     print(f"Remove fields: {remove_fields}")
     
+    # Immutable view; its presence vector is shared with the hardened variant
+    original_entities = EntitySet.from_dict(original_entities)
+    
     # STEP 1: Compute original score using existing engines
-    print("\n--- ORIGINAL SCORE COMPUTATION ---")
-    original_score = _compute_risk_score(original_entities, debug=debug)
+    if original_score is None:
+        print("\n--- ORIGINAL SCORE COMPUTATION ---")
+        original_score = _compute_risk_score(original_entities, debug=debug)
+    else:
+        print(f"\n--- REUSING ORIGINAL SCORE: {original_score} ---")
     
-    # STEP 2: Create copy of entities and remove selected fields
+    # STEP 2: Derive a hardened variant with the selected fields emptied.
+    # Untouched fields are shared with the original, nothing is copied.
     print("\n--- CREATING HARDENED COPY ---")
-    hardened_entities = copy.deepcopy(original_entities)
+    hardened_entities = original_entities.without(remove_fields)
     for field in remove_fields:
-        if field in hardened_entities:
-            # Set to empty list or 0 depending on field type
-            value = hardened_entities[field]
-            if isinstance(value, list):
-                hardened_entities[field] = []
-            elif isinstance(value, str):
-                hardened_entities[field] = ""
-            elif isinstance(value, (int, float)):
-                hardened_entities[field] = 0
-            else:
-                hardened_entities[field] = None
-            print(f"[HARDENED] {field}: {value} → {hardened_entities[field]}")
+        if field in original_entities:
+            print(f"[HARDENED] {field}: {original_entities[field]} → {hardened_entities[field]}")
     
     # STEP 3: Recompute risk score using same pipeline
     print("\n--- HARDENED SCORE COMPUTATION ---")
@@ -81,25 +117,281 @@ def run_hardening_simulation(
     print(f"Risk Reduction:   {difference}")
     print("="*60 + "\n")
     
-    # Generate LLM explanation of hardening impact
-    print("\n--- GENERATING HARDENING EXPLANATION ---")
-    explanation = generate_hardening_explanation(
-        removed_fields=remove_fields,
-        original_score=original_score,
-        hardened_score=hardened_score,
-        risk_reduction=difference
-    )
-    
     return {
         "original_score": round(original_score, 1),
         "hardened_score": round(hardened_score, 1),
         "difference": round(difference, 1),
-        "explanation": explanation
+        **_explain_simulation(remove_fields, original_score, hardened_score, difference, explain)
+    }
+
+
+def run_hardening_scenarios(
+    original_entities: Mapping,
+    scenarios: List[List[str]],
+    debug: bool = False,
+    original_score: Optional[float] = None,
+    explain: bool = False
+) -> Dict[str, Any]:
+    """
+    Compare several hardening scenarios against one original profile.
+    
+    The original score is computed once and every scenario is scored from
+    a hardened variant sharing the original's buckets (a score table
+    lookup each). Only the best scenario - the largest risk reduction,
+    then the fewest removed fields, then the earliest - is explained and
+    registered under a simulation id.
+    
+    Args:
+        original_entities: Dictionary (or EntitySet) of extracted entities
+        scenarios: List of scenarios, each a list of field names to remove
+        debug: If True, print debug information
+        original_score: Precomputed risk score of original_entities
+        explain: If True, wait for the LLM explanation instead of returning
+            the templated one
+    
+    Returns:
+        Dictionary with original_score, per-scenario results, best_scenario
+        and the best scenario's hardened_score, difference, explanation,
+        explanation_source and simulation_id
+    
+    Raises:
+        ValueError: If no scenarios are given
+    """
+    
+    if not scenarios:
+        raise ValueError("At least one hardening scenario is required")
+    
+    print("\n" + "="*60)
+    print(f"HARDENING SCENARIOS STARTED ({len(scenarios)} scenarios)")
+    print("="*60)
+    
+    original_entities = EntitySet.from_dict(original_entities)
+    
+    # Shared base: the original score is computed once for all scenarios
+    if original_score is None:
+        original_score = _compute_risk_score(original_entities, debug=debug)
+    
+    results = []
+    scores = []
+    for index, remove_fields in enumerate(scenarios):
+        hardened_score = _compute_risk_score(original_entities.without(remove_fields), debug=debug)
+        difference = max(0, original_score - hardened_score)
+        scores.append((hardened_score, difference))
+        results.append({
+            "scenario": index,
+            "remove_fields": list(remove_fields),
+            "hardened_score": round(hardened_score, 1),
+            "difference": round(difference, 1)
+        })
+        print(f"[SCENARIO {index}] {remove_fields}: {hardened_score} (-{difference})")
+    
+    best = min(
+        results,
+        key=lambda result: (-result["difference"], len(set(result["remove_fields"])), result["scenario"])
+    )
+    print(f"Best scenario: {best['scenario']} ({best['remove_fields']})")
+    print("="*60 + "\n")
+    
+    hardened_score, difference = scores[best["scenario"]]
+    return {
+        "original_score": round(original_score, 1),
+        "hardened_score": best["hardened_score"],
+        "difference": best["difference"],
+        **_explain_simulation(best["remove_fields"], original_score, hardened_score, difference, explain),
+        "best_scenario": best["scenario"],
+        "scenarios": results
+    }
+
+
+def _explain_simulation(
+    removed_fields: List[str],
+    original_score: float,
+    hardened_score: float,
+    risk_reduction: float,
+    explain: bool
+) -> Dict[str, str]:
+    """
+    Register a simulation and return its explanation fields.
+    
+    Returns:
+        Dictionary with simulation_id, explanation and explanation_source
+    """
+    simulation = {
+        "removed_fields": list(removed_fields),
+        "original_score": original_score,
+        "hardened_score": hardened_score,
+        "risk_reduction": risk_reduction
+    }
+    simulation_id = _simulation_id(simulation)
+    
+    registered = _simulations.peek(simulation_id)
+    if registered is None:
+        registered = {**simulation, "llm_explanation": None}
+        _simulations.put(simulation_id, registered)
+    
+    if explain:
+        print("\n--- GENERATING HARDENING EXPLANATION ---")
+        return {"simulation_id": simulation_id, **get_simulation_explanation(simulation_id, registered)}
+    
+    return {
+        "simulation_id": simulation_id,
+        "explanation": registered["llm_explanation"] or build_templated_hardening_explanation(
+            removed_fields, original_score, hardened_score, risk_reduction
+        ),
+        "explanation_source": "llm" if registered["llm_explanation"] else "template"
     }
 
 
+def get_simulation_cache_stats() -> Dict[str, int]:
+    """Return hardening simulation registry counters."""
+    return _simulations.stats()
+
+
+def _simulation_id(simulation: Dict[str, Any]) -> str:
+    """Deterministic id: identical simulations share one LLM explanation."""
+    canonical = json.dumps(simulation, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+def get_simulation_explanation(
+    simulation_id: str,
+    simulation: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Return the LLM explanation of a registered simulation, generating it
+    on first request.
+    
+    Args:
+        simulation_id: Id returned with the simulation result
+        simulation: Registered simulation, if the caller already has it
+    
+    Returns:
+        Dictionary with explanation and explanation_source ("llm", or
+        "fallback" if the LLM was unavailable), or None if the id is
+        unknown or expired
+    """
+    simulation = simulation or _simulations.get(simulation_id)
+    if simulation is None:
+        return None
+    
+    if simulation["llm_explanation"]:
+        return {"explanation": simulation["llm_explanation"], "explanation_source": "llm"}
+    
+    explanation = generate_hardening_explanation(
+        removed_fields=simulation["removed_fields"],
+        original_score=simulation["original_score"],
+        hardened_score=simulation["hardened_score"],
+        risk_reduction=simulation["risk_reduction"]
+    )
+    if explanation == _get_fallback_hardening_explanation():
+        # Not stored, so the next request retries the LLM
+        return {"explanation": explanation, "explanation_source": "fallback"}
+    
+    _simulations.put(simulation_id, {**simulation, "llm_explanation": explanation})
+    return {"explanation": explanation, "explanation_source": "llm"}
+
+
+def stream_simulation_explanation(simulation_id: str) -> Optional[Iterator[str]]:
+    """
+    Stream the LLM explanation of a registered simulation.
+    
+    A previously generated explanation is sent in one chunk; otherwise the
+    completed stream is stored for later fetches.
+    
+    Returns:
+        Iterator of text chunks, or None if the id is unknown or expired
+    """
+    simulation = _simulations.get(simulation_id)
+    if simulation is None:
+        return None
+    return _stream_explanation(simulation_id, simulation)
+
+
+def _stream_explanation(simulation_id: str, simulation: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield the explanation chunks of a registered simulation.
+
+    Args:
+        simulation_id: Registry id of the simulation
+        simulation: Registry entry for simulation_id
+
+    Yields:
+        Text chunks; a completed LLM explanation (not the fallback) is
+        stored back in the registry
+    """
+    if simulation["llm_explanation"]:
+        yield simulation["llm_explanation"]
+        return
+    
+    prompt = get_hardening_explanation_prompt(
+        removed_fields=simulation["removed_fields"],
+        original_score=simulation["original_score"],
+        hardened_score=simulation["hardened_score"],
+        risk_reduction=simulation["risk_reduction"]
+    )
+    fallback = _get_fallback_hardening_explanation()
+    
+    chunks = []
+    for chunk in stream_text(prompt, fallback=fallback):
+        chunks.append(chunk)
+        yield chunk
+    
+    explanation = "".join(chunks).strip()
+    if explanation and explanation != fallback:
+        _simulations.put(simulation_id, {**simulation, "llm_explanation": explanation})
+
+
+def build_templated_hardening_explanation(
+    removed_fields: List[str],
+    original_score: float,
+    hardened_score: float,
+    risk_reduction: float
+) -> str:
+    """
+    Build a deterministic explanation of a hardening result without the LLM.
+    
+    Args:
+        removed_fields: List of field names that were removed
+        original_score: Original risk score
+        hardened_score: Risk score after hardening
+        risk_reduction: Difference in scores
+    
+    Returns:
+        Explanation text
+    """
+    fields = list(dict.fromkeys(removed_fields))
+    names = [field.replace("_", " ") for field in fields]
+    if len(names) > 1:
+        fields_str = ", ".join(names[:-1]) + " and " + names[-1]
+    else:
+        fields_str = names[0] if names else "no fields"
+    original_score = float(original_score)
+    hardened_score = float(hardened_score)
+    
+    if risk_reduction <= 0:
+        return (
+            f"Removing {fields_str} does not change your risk score "
+            f"({round(original_score, 1)}/100): the remaining data exposes you just as much. "
+            "Try removing the fields that appear in your highest-risk combinations instead."
+        )
+    
+    reduction_percent = round(risk_reduction / original_score * 100) if original_score > 0 else 0
+    sentences = [
+        f"Removing {fields_str} lowers your risk score from {round(original_score, 1)} to "
+        f"{round(hardened_score, 1)} out of 100 ({round(risk_reduction, 1)} points, {reduction_percent}% lower)."
+    ]
+    notes = [FIELD_RISK_NOTES[field] for field in fields if field in FIELD_RISK_NOTES]
+    if notes:
+        sentences.append(f"This matters because {'; '.join(notes)}.")
+    sentences.append(
+        "With less of this data available, attackers find it harder to link your details together "
+        "and craft convincing phishing or impersonation attempts."
+    )
+    return " ".join(sentences)
+
+
 def _compute_risk_score(
-    entities: Dict[str, Any],
+    entities: Mapping,
     debug: bool = False
 ) -> float:
     """
@@ -119,8 +411,17 @@ def _compute_risk_score(
             for key, value in entities.items():
                 print(f"  {key}: {value}")
         
+        # Presence vector shared by correlation, visibility and scoring
+        presence = presence_of(entities)
+        timeline_years = estimate_exposure_years(entities)
+        
+        if not debug:
+            # Every score input derives from presence and timeline years,
+            # so the score is a single table lookup
+            return get_score_table().risk_score(presence.mask, timeline_years)
+        
         # Apply correlation rules
-        correlation_result = apply_correlation_rules(entities)
+        correlation_result = apply_correlation_rules(entities, presence=presence)
         inferred_risks = correlation_result.get("inferred_risks", [])
         if debug:
             print(f"[DEBUG] Inferred risks ({len(inferred_risks)} total):")
@@ -133,33 +434,12 @@ def _compute_risk_score(
         if debug:
             print(f"[DEBUG] Correlation depth: {correlation_depth}")
         
-        # Calculate timeline exposure
-        # Extract individual fields from entities
-        graduation_year = 0
-        years_of_experience = 0
-        company_years = 0
-        
-        # Handle graduation_year (could be list or single value)
-        if "graduation_year" in entities and entities["graduation_year"]:
-            grad_year = entities["graduation_year"]
-            graduation_year = grad_year[0] if isinstance(grad_year, list) else grad_year
-        
-        # Handle years_of_experience
-        if "years_of_experience" in entities and entities["years_of_experience"]:
-            yoe = entities["years_of_experience"]
-            years_of_experience = yoe if isinstance(yoe, (int, float)) else (yoe[0] if isinstance(yoe, list) else 0)
-        
-        timeline_result = calculate_timeline_exposure(
-            graduation_year=graduation_year,
-            years_of_experience=years_of_experience,
-            company_years=company_years
-        )
-        timeline_years = timeline_result.get("estimated_exposure_years", 0)
+        # Timeline exposure
         if debug:
             print(f"[DEBUG] Timeline years: {timeline_years}")
         
         # Calculate visibility
-        visibility_result = calculate_visibility(entities)
+        visibility_result = calculate_visibility(entities, presence=presence)
         visibility_score = visibility_result.get("visibility_score", 0)
         if debug:
             print(f"[DEBUG] Visibility score: {visibility_score}")
@@ -170,7 +450,8 @@ def _compute_risk_score(
             inferred_risks=inferred_risks,
             correlation_depth=correlation_depth,
             timeline_years=timeline_years,
-            visibility_score=visibility_score
+            visibility_score=visibility_score,
+            presence=presence
         )
         
         final_score = score_result.get("risk_score", 0)
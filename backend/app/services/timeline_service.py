@@ -3,6 +3,7 @@ Timeline service.
 Calculates temporal exposure based on graduation year and work history.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Dict
 
@@ -66,3 +67,37 @@ def calculate_timeline_exposure(
         "estimated_exposure_years": estimated_exposure_years,
         "timeline_risk_weight": round(timeline_risk_weight, 2)
     }
+
+
+def estimate_exposure_years(entities: Mapping) -> int:
+    """
+    Estimate exposure years from extracted entities.
+    
+    Uses the first graduation year and the years of experience (a number
+    or a list holding one) with calculate_timeline_exposure.
+    
+    Args:
+        entities: Dictionary (or EntitySet) of extracted entities
+    
+    Returns:
+        Estimated exposure years (0-40)
+    """
+    graduation_year = 0
+    years_of_experience = 0
+    
+    # Handle graduation_year (could be list or single value)
+    if "graduation_year" in entities and entities["graduation_year"]:
+        grad_year = entities["graduation_year"]
+        graduation_year = grad_year[0] if isinstance(grad_year, (list, tuple)) else grad_year
+    
+    # Handle years_of_experience
+    if "years_of_experience" in entities and entities["years_of_experience"]:
+        yoe = entities["years_of_experience"]
+        years_of_experience = yoe if isinstance(yoe, (int, float)) else (yoe[0] if isinstance(yoe, (list, tuple)) else 0)
+    
+    timeline_result = calculate_timeline_exposure(
+        graduation_year=graduation_year,
+        years_of_experience=years_of_experience,
+        company_years=0
+    )
+    return timeline_result.get("estimated_exposure_years", 0)
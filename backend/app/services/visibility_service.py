@@ -3,10 +3,14 @@ Visibility service.
 Calculates data visibility exposure score.
 """
 
-from typing import Dict
+from collections.abc import Mapping
+from typing import Dict, Optional
 
+from app.services.presence_service import EntityPresence, compute_presence
+from app.services.score_table import get_score_table
 
-def calculate_visibility(entities: Dict) -> Dict:
+
+def calculate_visibility(entities: Mapping, presence: Optional[EntityPresence] = None) -> Dict:
     """
     Calculate visibility exposure score based on entity types.
     
@@ -21,8 +25,12 @@ def calculate_visibility(entities: Dict) -> Dict:
     
     visibility_score = weighted sum normalized to 0-10
     
+    The result is looked up in the precomputed score table (see
+    score_table) by presence mask.
+    
     Args:
         entities: Dictionary of extracted entities
+        presence: Precomputed presence vector for entities (computed if omitted)
     
     Returns:
         Dictionary with visibility_score and visibility_level
@@ -30,9 +38,29 @@ def calculate_visibility(entities: Dict) -> Dict:
     Raises:
         ValueError: If entities is invalid
     """
-    if not isinstance(entities, dict):
+    if not isinstance(entities, Mapping):
         raise ValueError("Entities must be a dictionary")
     
+    if presence is None:
+        presence = compute_presence(entities)
+    
+    try:
+        return dict(get_score_table().visibility(presence.mask))
+    except ValueError:
+        # Rules snapshot unavailable; visibility does not depend on it
+        return compute_visibility(presence)
+
+
+def compute_visibility(presence: EntityPresence) -> Dict:
+    """
+    Compute the visibility score for a presence vector.
+    
+    Args:
+        presence: Entity presence vector
+    
+    Returns:
+        Dictionary with visibility_score and visibility_level
+    """
     # Define weight mappings
     HIGH_VISIBILITY_WEIGHT = 3
     MEDIUM_VISIBILITY_WEIGHT = 2
@@ -45,33 +73,15 @@ def calculate_visibility(entities: Dict) -> Dict:
     total_score = 0
     max_possible_score = 0
     
-    # Calculate high visibility contribution
-    for field in high_visibility_fields:
-        max_possible_score += HIGH_VISIBILITY_WEIGHT
-        if field in entities and entities[field]:
-            # Check if field has content
-            if isinstance(entities[field], list) and len(entities[field]) > 0:
-                total_score += HIGH_VISIBILITY_WEIGHT
-            elif isinstance(entities[field], str) and entities[field]:
-                total_score += HIGH_VISIBILITY_WEIGHT
-    
-    # Calculate medium visibility contribution
-    for field in medium_visibility_fields:
-        max_possible_score += MEDIUM_VISIBILITY_WEIGHT
-        if field in entities and entities[field]:
-            if isinstance(entities[field], list) and len(entities[field]) > 0:
-                total_score += MEDIUM_VISIBILITY_WEIGHT
-            elif isinstance(entities[field], str) and entities[field]:
-                total_score += MEDIUM_VISIBILITY_WEIGHT
-    
-    # Calculate low visibility contribution
-    for field in low_visibility_fields:
-        max_possible_score += LOW_VISIBILITY_WEIGHT
-        if field in entities and entities[field]:
-            if isinstance(entities[field], list) and len(entities[field]) > 0:
-                total_score += LOW_VISIBILITY_WEIGHT
-            elif isinstance(entities[field], str) and entities[field]:
-                total_score += LOW_VISIBILITY_WEIGHT
+    for fields, weight in (
+        (high_visibility_fields, HIGH_VISIBILITY_WEIGHT),
+        (medium_visibility_fields, MEDIUM_VISIBILITY_WEIGHT),
+        (low_visibility_fields, LOW_VISIBILITY_WEIGHT)
+    ):
+        for field in fields:
+            max_possible_score += weight
+            if presence.has(field):
+                total_score += weight
     
     # Normalize to 0-10 scale
     if max_possible_score > 0:
@@ -0,0 +1,111 @@
+"""
+Response serialization benchmark for PersonaShield backend.
+Compares per-endpoint encoding cost of FastAPI's default path
+(response_model re-validation + jsonable_encoder + json) with the fast path
+(model_response / FastJSONResponse).
+"""
+
+import contextlib
+import io
+import json
+import sys
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse, model_response, orjson
+from app.schemas.heatmap_schema import HeatmapResponse
+from app.schemas.simulation_schema import HardeningSimulationResponse
+from app.schemas.attack_vector_schema import AttackVectorBatchResponse
+from app.services.analyze_service import run_comprehensive_analysis
+from app.services.heatmap_service import generate_heatmap
+from app.services.attack_vector_service import categorize_attack_vectors_batch
+
+RUNS = 2000
+
+SAMPLE_TEXT = (
+    "Name: Rahul Kumar Email: rahul@infosys.com, personal: rahul@gmail.com "
+    "Phone: 9876543210 Date of Birth: 1999-05-10 Graduated: 2021 from IIT Hyderabad "
+    "Job: Senior Software Engineer at Infosys, Bangalore Skills: Python, React, AWS, "
+    "Docker Experience: 3 years Certifications: AWS Solutions Architect. "
+    "I live in Pune with my wife and son."
+)
+
+
+def _default_model_path(model_cls, data):
+    """What FastAPI does for `return Model(**data)` with response_model=Model."""
+    model = model_cls(**data)
+    revalidated = model_cls.model_validate(model.model_dump(by_alias=True))
+    return JSONResponse(jsonable_encoder(revalidated)).body
+
+
+def _fast_model_path(model_cls, data):
+    """`return model_response(Model(**data))`."""
+    return model_response(model_cls(**data)).body
+
+
+def _default_dict_path(data):
+    """What FastAPI does for a plain dict without response_model."""
+    return JSONResponse(jsonable_encoder(data)).body
+
+
+def _fast_dict_path(data):
+    """`return FastJSONResponse(data)`."""
+    return FastJSONResponse(data).body
+
+
+with contextlib.redirect_stdout(io.StringIO()):
+    analysis = run_comprehensive_analysis(
+        "text",
+        SAMPLE_TEXT,
+        stages=["score", "vectors", "hardening", "heatmap"],
+        simulate_hardening=True
+    )
+
+heatmap = generate_heatmap({
+    "total_risk_score": analysis["risk_assessment"]["risk_score"],
+    "components": analysis["risk_assessment"]["score_breakdown"],
+    "data_type_contributions": {"email": 12, "phone": 6, "dob": 8, "company": 5, "location": 4}
+})
+hardening = {
+    "original_score": 81.5,
+    "hardened_score": 52.0,
+    "difference": 29.5,
+    "explanation": "Removing sensitive personal details reduces attack surface and lowers exposure risk."
+}
+attack_vector_batch = {"results": categorize_attack_vectors_batch([analysis["entities"]] * 50)}
+
+CASES = [
+    ("POST /analyze/text", lambda: _default_dict_path(analysis), lambda: _fast_dict_path(analysis)),
+    ("POST /risk-heatmap",
+     lambda: _default_model_path(HeatmapResponse, heatmap),
+     lambda: _fast_model_path(HeatmapResponse, heatmap)),
+    ("POST /simulate-hardening",
+     lambda: _default_model_path(HardeningSimulationResponse, hardening),
+     lambda: _fast_model_path(HardeningSimulationResponse, hardening)),
+    ("POST /attack-vectors/batch (50)",
+     lambda: _default_model_path(AttackVectorBatchResponse, attack_vector_batch),
+     lambda: _fast_model_path(AttackVectorBatchResponse, attack_vector_batch)),
+]
+
+print("\n" + "="*70)
+print("RESPONSE SERIALIZATION BENCHMARK")
+print("="*70)
+print(f"\nPython: {sys.version.split()[0]}  orjson: {'yes' if orjson else 'no (stdlib json fallback)'}")
+print(f"Runs per case: {RUNS}\n")
+
+for name, default_path, fast_path in CASES:
+    # Both paths must produce the same JSON document
+    if json.loads(default_path()) != json.loads(fast_path()):
+        print(f"{name:<32} ❌ outputs differ")
+        continue
+
+    default_us = min(timeit.repeat(default_path, number=RUNS, repeat=3)) / RUNS * 1e6
+    fast_us = min(timeit.repeat(fast_path, number=RUNS, repeat=3)) / RUNS * 1e6
+    print(
+        f"{name:<32} default {default_us:8.1f} µs   fast {fast_us:8.1f} µs   "
+        f"speedup {default_us / fast_us:5.1f}x   ({len(fast_path())} bytes)"
+    )
+
+print("\n" + "="*70)
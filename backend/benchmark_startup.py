@@ -0,0 +1,74 @@
+"""
+Startup-time benchmark for PersonaShield backend.
+Measures cold import cost of the app and checks that the LLM and PDF
+stacks are only loaded on first use.
+"""
+
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNS = 5
+
+# Heavy modules that must not be loaded by a plain import of the app
+HEAVY_MODULES = ["langchain_groq", "langchain_core", "pypdf"]
+
+# Import targets measured in a fresh interpreter each run
+TARGETS = {
+    "app.main": "import app.main",
+    "scoring only": "import app.services.scoring_engine",
+    "analyze service": "import app.services.analyze_service",
+    "llm on first use": "import langchain_groq, langchain_core.messages",
+    "pdf on first use": "import pypdf",
+}
+
+
+def _measure_import(statement: str) -> dict:
+    """Run one import in a fresh interpreter and report cost and loaded modules."""
+    probe = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.splitlines()
+
+    return {
+        "elapsed_ms": float(output[0]),
+        "heavy_loaded": [m for m in output[1].split(",") if m] if len(output) > 1 else []
+    }
+
+
+print("\n" + "="*70)
+print("STARTUP IMPORT BENCHMARK")
+print("="*70)
+print(f"\nPython: {sys.version.split()[0]}  Runs per target: {RUNS}\n")
+
+for name, statement in TARGETS.items():
+    try:
+        samples = [_measure_import(statement) for _ in range(RUNS)]
+    except subprocess.CalledProcessError as e:
+        print(f"{name:<20} ❌ import failed: {e.stderr.strip().splitlines()[-1]}")
+        continue
+
+    timings = sorted(s["elapsed_ms"] for s in samples)
+    heavy = samples[-1]["heavy_loaded"]
+    print(
+        f"{name:<20} min {timings[0]:8.1f} ms   "
+        f"median {timings[len(timings) // 2]:8.1f} ms   "
+        f"heavy modules: {', '.join(heavy) if heavy else 'none'}"
+    )
+
+print("\n" + "="*70)
+print("For a per-module breakdown run: python -X importtime -c \"import app.main\"")
+print("="*70)
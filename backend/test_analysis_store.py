@@ -0,0 +1,177 @@
+"""
+Test script for the indexed analysis store.
+Stores analyses (with `store: true` and in bulk), then checks filtered
+queries, score ordering and that pagination totals stay consistent.
+"""
+
+import copy
+import json
+import uuid
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1"
+STORE_URL = f"{BASE_URL}/analysis-store"
+
+# A company name unique to this run scopes every query below
+run = uuid.uuid4().hex[:8]
+company = f"Zyx {run} Labs"
+scores = [12.5, 87.0, 45.25, 63.0, 30.0, 95.5, 71.75, 5.0]
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+def query(**params):
+    response = requests.get(f"{STORE_URL}/query", params={"entity": f"company:{company}", **params})
+    return response.json()
+
+
+print("\n" + "="*70)
+print("INDEXED ANALYSIS STORE TEST")
+print("="*70)
+
+try:
+    # One analysis stored directly by the analyze endpoint
+    analysis = requests.post(
+        f"{BASE_URL}/analyze/text",
+        json={
+            "content": "Email: rahul@infosys.com, Phone: 9876543210, Date of Birth: 1999-05-10",
+            "profile": "fast",
+            "store": True
+        }
+    ).json()
+    stored_analysis = requests.get(f"{STORE_URL}/analyses/{analysis['analysis_id']}")
+
+    print("\n📊 CHECKS:")
+    check(
+        f"store: true on /analyze/text stores the result (got {stored_analysis.status_code})",
+        stored_analysis.status_code == 200
+        and stored_analysis.json()["risk_assessment"] == analysis["risk_assessment"]
+    )
+
+    # Copies of it with this run's company and known scores, plus one
+    # failed analysis that must be skipped
+    analyses = []
+    for score in scores:
+        result = copy.deepcopy(analysis)
+        result["analysis_id"] = str(uuid.uuid4())
+        result["entities"]["company"] = [company]
+        result["risk_assessment"]["risk_score"] = score
+        result["risk_assessment"]["risk_level"] = "High" if score > 60 else "Moderate" if score > 30 else "Low"
+        analyses.append(result)
+    failed = copy.deepcopy(analyses[0])
+    failed["analysis_id"] = str(uuid.uuid4())
+    failed["risk_assessment"]["risk_level"] = "Unknown"
+
+    response = requests.post(f"{STORE_URL}/analyses", json={"analyses": analyses + [failed]})
+    print(f"\nRequest URL: POST {STORE_URL}/analyses -> {response.status_code} {json.dumps(response.json())}")
+    check(
+        f"Stored {len(scores)} analyses and skipped the failed one",
+        response.json() == {"stored": len(scores), "skipped": 1}
+    )
+
+    # Pagination: every page reports the same total, pages do not overlap
+    # and together they list every match, highest score first
+    pages = [query(limit=3, offset=offset) for offset in (0, 3, 6, 9)]
+    print(f"\nRequest URL: GET {STORE_URL}/query?entity=company:{company}&limit=3&offset=...")
+    for page in pages:
+        print(f"   offset {page['offset']}: total {page['total']}, "
+              f"scores {[item['risk_score'] for item in page['results']]}")
+    paged_ids = [item["analysis_id"] for page in pages for item in page["results"]]
+    paged_scores = [item["risk_score"] for page in pages for item in page["results"]]
+    check(
+        f"Every page reports total {len(scores)} ({[page['total'] for page in pages]})",
+        all(page["total"] == len(scores) for page in pages)
+    )
+    check(
+        f"Page sizes are 3, 3, 2, 0 ({[len(page['results']) for page in pages]})",
+        [len(page["results"]) for page in pages] == [3, 3, 2, 0]
+    )
+    check(
+        "Pages cover every stored analysis exactly once",
+        sorted(paged_ids) == sorted(result["analysis_id"] for result in analyses)
+    )
+    check("Results are ordered by score, highest first", paged_scores == sorted(scores, reverse=True))
+
+    ascending = query(order="asc", limit=100)
+    check(
+        "order=asc returns the reverse order",
+        [item["risk_score"] for item in ascending["results"]] == sorted(scores)
+    )
+
+    # Filters combine with the entity filter
+    high = query(risk_level="High", limit=100)
+    check(
+        f"risk_level=High matches {high['total']} analyses",
+        high["total"] == sum(1 for score in scores if score > 60)
+        and all(item["risk_level"] == "High" for item in high["results"])
+    )
+    ranged = query(min_score=30, max_score=71.75, limit=2)
+    check(
+        f"Score range 30-71.75 matches {ranged['total']} analyses across pages",
+        ranged["total"] == sum(1 for score in scores if 30 <= score <= 71.75)
+        and len(ranged["results"]) == 2
+    )
+    exposed = query(field=["phones", "dob"], limit=100)
+    check(
+        f"field=phones&field=dob matches all {exposed['total']} analyses",
+        exposed["total"] == len(scores)
+    )
+
+    # Removal updates the indexes
+    removed = requests.delete(f"{STORE_URL}/analyses/{analyses[0]['analysis_id']}")
+    after = query(limit=100)
+    check(
+        f"Removing an analysis updates totals ({after['total']})",
+        removed.status_code == 200 and after["total"] == len(scores) - 1
+    )
+
+    missing = requests.get(f"{STORE_URL}/analyses/{analyses[0]['analysis_id']}")
+    invalid_filter = requests.get(f"{STORE_URL}/query", params={"entity": "company"})
+    invalid_result = requests.post(
+        f"{STORE_URL}/analyses",
+        json={"analyses": [{"analysis_id": str(uuid.uuid4()), "entities": {"emails": 5}}]}
+    )
+    check(
+        f"Removed analyses return 404, malformed filters and results 400 "
+        f"(got {missing.status_code}, {invalid_filter.status_code}, {invalid_result.status_code})",
+        missing.status_code == 404 and invalid_filter.status_code == 400 and invalid_result.status_code == 400
+    )
+
+    # Malformed results reject the whole batch, so nothing of it is stored
+    valid = copy.deepcopy(analyses[1])
+    valid["analysis_id"] = str(uuid.uuid4())
+    malformed = []
+    for path, value in [
+        (("analysis_id",), 5),
+        (("risk_assessment", "risk_score"), None),
+        (("risk_assessment", "risk_score"), [1]),
+        (("risk_assessment", "inferred_risks"), [{"rule_id": 7}]),
+        (("attack_analysis", "attack_vectors"), [{"category": {"name": "x"}}])
+    ]:
+        result = copy.deepcopy(valid)
+        result["analysis_id"] = str(uuid.uuid4())
+        target = result
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+        malformed.append(result)
+    statuses = [
+        requests.post(f"{STORE_URL}/analyses", json={"analyses": [valid, result]}).status_code
+        for result in malformed
+    ]
+    check(f"Malformed results return 400 ({statuses})", statuses == [400] * len(malformed))
+    check(
+        "A rejected batch stores none of its results",
+        requests.get(f"{STORE_URL}/analyses/{valid['analysis_id']}").status_code == 404
+        and query(limit=100)["total"] == len(scores) - 1
+    )
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
@@ -0,0 +1,92 @@
+"""
+Test script for field contribution (Shapley value) analysis.
+Checks that contributions add up to the risk score and match the
+contributions embedded in a text analysis.
+"""
+
+import json
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1"
+
+request_data = {
+    "entities": {
+        "emails": ["rahul@infosys.com"],
+        "phones": ["9876543210"],
+        "dob": ["1999-05-10"],
+        "graduation_year": [2021],
+        "company": ["Infosys"],
+        "job_title": ["Software Engineer"],
+        "location": ["Bangalore"],
+        "skills": ["Python", "React"],
+        "years_of_experience": 3
+    }
+}
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+print("\n" + "="*70)
+print("FIELD CONTRIBUTIONS TEST")
+print("="*70)
+print(f"\nRequest URL: POST {BASE_URL}/field-contributions")
+
+try:
+    response = requests.post(f"{BASE_URL}/field-contributions", json=request_data)
+    print(f"\nResponse Status: {response.status_code}")
+    result = response.json()
+    print(json.dumps(result, indent=2))
+
+    if response.status_code == 200:
+        contributions = result["contributions"]
+        shapley_total = sum(item["shapley_value"] for item in contributions)
+        shapley_values = [item["shapley_value"] for item in contributions]
+
+        print("\n📊 CHECKS:")
+        check(
+            f"Shapley values sum to risk_score - baseline_score "
+            f"({shapley_total:.2f} vs {result['risk_score'] - result['baseline_score']:.2f})",
+            abs(shapley_total - (result["risk_score"] - result["baseline_score"])) <= 0.01 * len(contributions) + 0.01
+        )
+        check("Contributions are ordered by Shapley value", shapley_values == sorted(shapley_values, reverse=True))
+        check(
+            "Every contribution is for a field in the request",
+            all(item["field"] in request_data["entities"] for item in contributions)
+        )
+
+        # A single-field hardening simulation removes the same score
+        top = contributions[0]
+        simulation = requests.post(
+            f"{BASE_URL}/simulate-hardening",
+            json={"original_entities": request_data["entities"], "remove_fields": [top["field"]]}
+        ).json()
+        check(
+            f"Marginal contribution of '{top['field']}' matches /simulate-hardening "
+            f"({top['marginal_contribution']} vs {simulation['difference']})",
+            abs(top["marginal_contribution"] - simulation["difference"]) <= 0.05
+        )
+
+        # Analyses embed the contributions of their extracted entities
+        analysis = requests.post(
+            f"{BASE_URL}/analyze/text",
+            json={"content": "Email: rahul@infosys.com, Phone: 9876543210", "profile": "fast"}
+        ).json()
+        embedded = analysis["risk_assessment"]["field_contributions"]
+        standalone = requests.post(
+            f"{BASE_URL}/field-contributions",
+            json={"entities": analysis["entities"]}
+        ).json()["contributions"]
+        check(
+            f"Analysis field_contributions match /field-contributions ({len(embedded)} fields)",
+            bool(embedded) and embedded == standalone
+        )
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
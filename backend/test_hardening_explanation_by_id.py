@@ -0,0 +1,84 @@
+"""
+Test script for lazily fetched hardening explanations.
+Runs a simulation without waiting for the LLM, then fetches (and
+streams) its explanation by simulation_id.
+"""
+
+import json
+import time
+import requests
+
+URL = "http://localhost:8000/api/v1/simulate-hardening"
+
+request_data = {
+    "original_entities": {
+        "emails": ["rahul@gmail.com"],
+        "phones": ["9876543210"],
+        "dob": ["1999-05-10"],
+        "company": ["Infosys"],
+        "job_title": ["Software Engineer"],
+        "location": ["Bangalore"]
+    },
+    "remove_fields": ["phones", "dob"]
+}
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+print("\n" + "="*70)
+print("HARDENING EXPLANATION BY ID TEST")
+print("="*70)
+print(f"\nRequest URL: POST {URL}")
+
+try:
+    started = time.time()
+    response = requests.post(URL, json=request_data)
+    elapsed = time.time() - started
+    print(f"\nResponse Status: {response.status_code} ({elapsed:.2f}s)")
+    result = response.json()
+    print(json.dumps(result, indent=2))
+
+    if response.status_code == 200:
+        simulation_id = result["simulation_id"]
+
+        print("\n📊 CHECKS:")
+        check(
+            f"Scores return with a templated explanation (source: {result['explanation_source']})",
+            result["explanation_source"] == "template" and bool(result["explanation"])
+        )
+        again = requests.post(URL, json=request_data).json()
+        check("Identical simulations share a simulation_id", again["simulation_id"] == simulation_id)
+
+        print(f"\nRequest URL: GET {URL}/{simulation_id}/explanation")
+        explanation = requests.get(f"{URL}/{simulation_id}/explanation")
+        explanation_json = explanation.json()
+        print(json.dumps(explanation_json, indent=2))
+        check(f"Explanation fetched by id (got {explanation.status_code})", explanation.status_code == 200)
+        check(
+            f"Explanation belongs to the simulation (source: {explanation_json.get('explanation_source')})",
+            explanation_json.get("simulation_id") == simulation_id
+            and explanation_json.get("explanation_source") in ("llm", "fallback")
+            and bool(explanation_json.get("explanation"))
+        )
+
+        stream = requests.get(f"{URL}/{simulation_id}/explanation/stream", stream=True)
+        streamed = "".join(chunk for chunk in stream.iter_content(chunk_size=None, decode_unicode=True))
+        check(f"Explanation streams as text ({len(streamed)} chars)", stream.status_code == 200 and bool(streamed.strip()))
+
+    # Unknown ids are not found
+    unknown = requests.get(f"{URL}/does-not-exist/explanation")
+    unknown_stream = requests.get(f"{URL}/does-not-exist/explanation/stream")
+    check(
+        f"Unknown simulation ids return 404 (got {unknown.status_code}, {unknown_stream.status_code})",
+        unknown.status_code == 404 and unknown_stream.status_code == 404
+    )
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
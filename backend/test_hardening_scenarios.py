@@ -0,0 +1,85 @@
+"""
+Test script for comparing several hardening scenarios in one request.
+Checks the per-scenario scores against single simulations and that the
+best scenario is the one with the largest risk reduction.
+"""
+
+import json
+import requests
+
+URL = "http://localhost:8000/api/v1/simulate-hardening"
+
+original_entities = {
+    "emails": ["rahul@gmail.com"],
+    "phones": ["9876543210"],
+    "dob": ["1999-05-10"],
+    "graduation_year": [2021],
+    "college": ["IIT Hyderabad"],
+    "company": ["Infosys"],
+    "job_title": ["Software Engineer"],
+    "location": ["Bangalore"],
+    "skills": ["Python", "React"],
+    "years_of_experience": 3
+}
+
+scenarios = [
+    ["phones"],
+    ["dob", "graduation_year"],
+    ["emails", "phones", "dob"],
+    ["skills"]
+]
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+print("\n" + "="*70)
+print("HARDENING SCENARIO COMPARISON TEST")
+print("="*70)
+print(f"\nRequest URL: POST {URL}")
+
+try:
+    response = requests.post(URL, json={"original_entities": original_entities, "scenarios": scenarios})
+    print(f"\nResponse Status: {response.status_code}")
+    result = response.json()
+    print(json.dumps(result, indent=2))
+
+    if response.status_code == 200:
+        print("\n📊 CHECKS:")
+        check(f"One result per scenario ({len(result['scenarios'])})", len(result["scenarios"]) == len(scenarios))
+
+        for scenario in result["scenarios"]:
+            single = requests.post(
+                URL,
+                json={"original_entities": original_entities, "remove_fields": scenario["remove_fields"]}
+            ).json()
+            check(
+                f"Scenario {scenario['scenario']} {scenario['remove_fields']} matches a single simulation "
+                f"({scenario['hardened_score']} vs {single['hardened_score']})",
+                scenario["hardened_score"] == single["hardened_score"]
+                and single["original_score"] == result["original_score"]
+            )
+
+        best = result["scenarios"][result["best_scenario"]]
+        check(
+            f"Best scenario {result['best_scenario']} has the largest reduction ({best['difference']})",
+            best["difference"] == max(scenario["difference"] for scenario in result["scenarios"])
+        )
+        check(
+            "Top-level scores are the best scenario's",
+            result["hardened_score"] == best["hardened_score"] and result["difference"] == best["difference"]
+        )
+        check("Best scenario has a simulation_id", bool(result.get("simulation_id")))
+
+    # Empty scenario lists are rejected
+    empty = requests.post(URL, json={"original_entities": original_entities, "scenarios": []})
+    check(f"Empty scenarios return 400 (got {empty.status_code})", empty.status_code == 400)
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
@@ -21,7 +21,8 @@ request_data = {
         "certifications": [],
         "years_of_experience": 3
     },
-    "remove_fields": ["phones", "graduation_year"]
+    "remove_fields": ["phones", "graduation_year"],
+    "explain": True
 }
 
 print("\n" + "="*70)
@@ -84,6 +84,18 @@ try:
         print(f"   Pie Chart Slices:  {len(graph.get('pie_chart', {}).get('labels', []))} segments")
         
         print("\n" + "="*70)
+        
+        # Fetch the same payload again by breakdown hash
+        breakdown_hash = response_json.get("breakdown_hash")
+        print(f"\nRequest URL: GET http://localhost:8000/api/v1/risk-heatmap/{breakdown_hash}")
+        cached_response = requests.get(
+            f"http://localhost:8000/api/v1/risk-heatmap/{breakdown_hash}"
+        )
+        print(f"Response Status: {cached_response.status_code}")
+        if cached_response.status_code == 200 and cached_response.json() == response_json:
+            print("✅ Precomputed heatmap matches")
+        else:
+            print("❌ Precomputed heatmap mismatch")
 
 except requests.exceptions.ConnectionError:
     print("\n❌ ERROR: Could not connect to server at localhost:8000")
@@ -0,0 +1,143 @@
+"""
+Test script for the cross-document identity index.
+Indexes documents of one person and of two people sharing a single
+weak key with them, then checks which documents are linked, the combined
+exposure score and re-linking after a removal.
+"""
+
+import json
+import uuid
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1/identity-index/documents"
+
+# Unique ids and keys, so the script can be re-run against the same server
+run = uuid.uuid4().hex[:8]
+email = f"rahul.{run}@infosys.com"
+phone = f"98{uuid.uuid4().int % 10**8:08d}"
+company = f"Infosys {run}"
+
+documents = {
+    f"resume-{run}": {
+        "emails": [email],
+        "dob": ["10/05/1999"],
+        "company": [company],
+        "job_title": ["Software Engineer"],
+        "skills": ["Python", "React"]
+    },
+    # Linked to the resume by the shared email (case differs)
+    f"bio-{run}": {
+        "emails": [email.title()],
+        "location": ["Bangalore"]
+    },
+    # Linked to the resume by DOB and employment together
+    f"post-{run}": {
+        "phones": [phone],
+        "dob": ["1999-05-10"],
+        "company": [company],
+        "job_title": ["software engineer"]
+    },
+    # Shares only an employment with the resume: not linked
+    f"colleague-{run}": {
+        "company": [company],
+        "job_title": ["Software Engineer"],
+        "location": ["Pune"]
+    },
+    # Shares only a DOB with the resume: not linked
+    f"stranger-{run}": {
+        "emails": [f"someone.{run}@example.com"],
+        "dob": ["1999-05-10"]
+    }
+}
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+print("\n" + "="*70)
+print("CROSS-DOCUMENT IDENTITY INDEX TEST")
+print("="*70)
+print(f"\nRequest URL: POST {BASE_URL}")
+
+try:
+    for document_id, entities in documents.items():
+        response = requests.post(
+            BASE_URL,
+            json={"document_id": document_id, "entities": entities, "include_exposure": False}
+        )
+        print(f"\n{document_id}: {response.status_code} {json.dumps(response.json())}")
+
+    resume, bio, post, colleague, stranger = documents
+    identity = requests.get(f"{BASE_URL}/{resume}").json()
+    print(f"\nIdentity of {resume}:")
+    print(json.dumps(identity, indent=2))
+
+    print("\n📊 CHECKS:")
+    check(
+        f"Resume, bio and post are one identity ({identity['documents']})",
+        identity["documents"] == [resume, bio, post]
+    )
+    check(
+        "Shared email is reported once per linked document",
+        {"kind": "email", "value": email, "documents": 2} in identity["shared_keys"]
+    )
+    for other in (colleague, stranger):
+        other_identity = requests.get(f"{BASE_URL}/{other}").json()
+        check(
+            f"{other.split('-')[0].title()} sharing one weak key is not linked ({other_identity['documents']})",
+            other_identity["documents"] == [other]
+        )
+
+    exposure = identity["exposure"]
+    single = requests.get(f"{BASE_URL}/{bio}").json()["exposure"]
+    check(
+        f"Exposure scores the merged entities (risk score {exposure['risk_score']}, {exposure['risk_level']})",
+        bool(exposure["entities"]["emails"]) and bool(exposure["entities"]["phones"])
+        and bool(exposure["entities"]["dob"]) and exposure["risk_score"] >= single["risk_score"]
+    )
+    check(
+        "Every document of the identity reports the same exposure",
+        requests.get(f"{BASE_URL}/{post}").json()["exposure"] == exposure
+    )
+    check(
+        f"Emails differing only in case are merged once ({exposure['entities']['emails']})",
+        exposure["entities"]["emails"] == [email]
+    )
+
+    # A malformed document sharing the email is rejected, not indexed
+    malformed = requests.post(
+        BASE_URL,
+        json={"document_id": f"malformed-{run}", "entities": {"emails": [email], "years_of_experience": "5"}}
+    )
+    linked = requests.get(f"{BASE_URL}/{bio}")
+    check(
+        f"Malformed fields return 400 and linked documents still 200 (got {malformed.status_code}, {linked.status_code})",
+        malformed.status_code == 400 and linked.status_code == 200
+        and linked.json()["documents"] == [resume, bio, post]
+    )
+
+    # Bio and post were only linked through the resume
+    removed = requests.delete(f"{BASE_URL}/{resume}")
+    check(f"Removing the resume returns 200 (got {removed.status_code})", removed.status_code == 200)
+    bio_after = requests.get(f"{BASE_URL}/{bio}").json()["documents"]
+    post_after = requests.get(f"{BASE_URL}/{post}").json()["documents"]
+    check(
+        f"Bio and post become separate identities ({bio_after}, {post_after})",
+        bio_after == [bio] and post_after == [post]
+    )
+
+    missing = requests.get(f"{BASE_URL}/{resume}")
+    invalid = requests.post(BASE_URL, json={"entities": {"emails": 5}})
+    check(
+        f"Removed documents return 404 and invalid entities 400 (got {missing.status_code}, {invalid.status_code})",
+        missing.status_code == 404 and invalid.status_code == 400
+    )
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
@@ -0,0 +1,102 @@
+"""
+Test script for incremental re-analysis of edited text.
+Analyzes two versions of a document and checks the version diff, segment
+reuse and that the result matches a full analysis of the edited text.
+"""
+
+import json
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1/analyze/text"
+
+first_version = (
+    "Rahul Sharma, Email: rahul@infosys.com, Skills: Python, React, AWS, "
+    "Mentors junior developers, Speaker at PyCon India, "
+    "Enjoys cricket, Volunteers at local schools"
+)
+
+# Adds a phone number; the rest of the text is unchanged
+second_version = first_version.replace("Enjoys cricket", "Enjoys cricket, Phone: 9876543210")
+
+
+def check(label, passed):
+    print(f"   {'✅' if passed else '❌'} {label}")
+
+
+def same_entities(first, second):
+    return all(
+        sorted(map(str, first.get(field) or [])) == sorted(map(str, second.get(field) or []))
+        if isinstance(first.get(field), list) or isinstance(second.get(field), list)
+        else first.get(field) == second.get(field)
+        for field in set(first) | set(second)
+    )
+
+
+print("\n" + "="*70)
+print("INCREMENTAL RE-ANALYSIS TEST")
+print("="*70)
+print(f"\nRequest URL: POST {BASE_URL}/incremental")
+
+try:
+    first = requests.post(f"{BASE_URL}/incremental", json={"content": first_version, "profile": "fast"})
+    print(f"\nVersion 1 Status: {first.status_code}")
+    first_result = first.json()
+    print(json.dumps(first_result.get("incremental"), indent=2))
+
+    if first.status_code == 200:
+        document_id = first_result["incremental"]["document_id"]
+        second = requests.post(
+            f"{BASE_URL}/incremental",
+            json={"content": second_version, "document_id": document_id, "profile": "fast"}
+        )
+        print(f"\nVersion 2 Status: {second.status_code}")
+        second_result = second.json()
+        incremental = second_result["incremental"]
+        print(json.dumps(incremental, indent=2))
+
+        print("\n📊 CHECKS:")
+        check(
+            "First version has no diff",
+            first_result["incremental"]["version"] == 1 and first_result["incremental"]["diff"] is None
+        )
+        check(
+            "Second version is version 2 of the same document",
+            incremental["document_id"] == document_id and incremental["version"] == 2
+        )
+        check(
+            f"Unchanged segments are reused ({incremental['segments_reused']}/{incremental['segments_total']})",
+            incremental["segments_reused"] > 0
+            and incremental["segments_reused"] + incremental["segments_extracted"] == incremental["segments_total"]
+        )
+
+        diff = incremental["diff"] or {}
+        entity_diff = diff.get("entities", {})
+        check(
+            f"Diff reports only the added phone ({json.dumps(entity_diff)})",
+            entity_diff == {"phones": {"added": ["9876543210"], "removed": []}}
+        )
+        score_diff = diff.get("risk_assessment", {}).get("risk_score", {})
+        check(
+            f"Diff reports the score change ({score_diff})",
+            score_diff.get("previous") == first_result["risk_assessment"]["risk_score"]
+            and score_diff.get("current") == second_result["risk_assessment"]["risk_score"]
+        )
+
+        full = requests.post(BASE_URL, json={"content": second_version, "profile": "fast"}).json()
+        check(
+            "Entities and score match a full analysis of version 2",
+            same_entities(full["entities"], second_result["entities"])
+            and full["risk_assessment"]["risk_score"] == second_result["risk_assessment"]["risk_score"]
+        )
+
+    # Empty content is rejected
+    empty = requests.post(f"{BASE_URL}/incremental", json={"content": "   "})
+    check(f"Empty content returns 400 (got {empty.status_code})", empty.status_code == 400)
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")
@@ -0,0 +1,60 @@
+"""
+Test script for background analysis jobs.
+Submits a bulk and an interactive job, then polls until both finish.
+"""
+
+import json
+import time
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1/jobs"
+
+request_data = {
+    "content": """
+    Email: rahul@infosys.com, Phone: 9876543210
+    Date of Birth: 1999-05-10
+    Senior Software Engineer at Infosys, Bangalore
+    """,
+    "persona": "professional_scammer",
+    "simulate_hardening": True,
+    "fields_to_remove": ["phones", "graduation_year"]
+}
+
+print("\n" + "="*70)
+print("BACKGROUND JOB QUEUE TEST")
+print("="*70)
+
+try:
+    bulk = requests.post(f"{BASE_URL}/analyze/text", json={**request_data, "lane": "bulk"})
+    interactive = requests.post(f"{BASE_URL}/analyze/text", json={**request_data, "lane": "interactive"})
+
+    print(f"\nBulk submit:        {bulk.status_code} {json.dumps(bulk.json())}")
+    print(f"Interactive submit: {interactive.status_code} {json.dumps(interactive.json())}")
+
+    pending = {job["job_id"]: job["lane"] for job in (bulk.json(), interactive.json())}
+    deadline = time.time() + 120
+
+    while pending and time.time() < deadline:
+        for job_id, lane in list(pending.items()):
+            job = requests.get(f"{BASE_URL}/{job_id}").json()
+            if job["status"] in ("completed", "failed"):
+                result = job.get("result") or {}
+                risk = result.get("risk_assessment", {})
+                duration = (job["finished_at"] or 0) - (job["created_at"] or 0)
+                print(f"\n[{lane}] {job_id}: {job['status']} in {duration:.1f}s")
+                print(f"   Risk Score: {risk.get('risk_score')}  Level: {risk.get('risk_level')}")
+                if job.get("error"):
+                    print(f"   Error: {job['error']}")
+                del pending[job_id]
+        time.sleep(1)
+
+    if pending:
+        print(f"\n❌ Timed out waiting for jobs: {list(pending)}")
+
+    print("\n" + "="*70)
+
+except requests.exceptions.ConnectionError:
+    print("\n❌ ERROR: Could not connect to server at localhost:8000")
+    print("   Make sure uvicorn is running: uvicorn app.main:app --reload")
+except Exception as e:
+    print(f"\n❌ ERROR: {str(e)}")